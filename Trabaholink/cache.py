@@ -0,0 +1,137 @@
+"""
+Shared cache helpers built on the project's Redis.
+
+- InstrumentedRedisCache: Django's RedisCache plus per-namespace hit/miss
+  counters (kept in a Redis hash, reported by `manage.py cache_stats`)
+- get_or_set_single_flight: cache-aside with stampede protection, so only
+  one process recomputes an expired value while the others wait for it
+- release_lock: compare-and-delete for token locks taken with cache.add
+"""
+from collections import Counter
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+import logging
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Redis hash holding hit/miss totals for a cache namespace (KEY_PREFIX)
+STATS_KEY = 'cache_stats:{namespace}'
+
+# Counters are flushed to Redis after this many operations or seconds
+STATS_FLUSH_EVERY = 100
+STATS_FLUSH_SECONDS = 10
+
+# Deletes KEYS[1] only while it still holds ARGV[1]
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class InstrumentedRedisCache(RedisCache):
+    """RedisCache that records hit/miss totals for its namespace."""
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self.namespace = params.get('KEY_PREFIX') or 'default'
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._stats_flushed_at = time.monotonic()
+
+    def _count(self, hits=0, misses=0):
+        with self._stats_lock:
+            self._stats['hits'] += hits
+            self._stats['misses'] += misses
+            pending = self._stats['hits'] + self._stats['misses']
+            due = pending >= STATS_FLUSH_EVERY or time.monotonic() - self._stats_flushed_at > STATS_FLUSH_SECONDS
+            if not due:
+                return
+            stats = dict(self._stats)
+            self._stats.clear()
+            self._stats_flushed_at = time.monotonic()
+
+        try:
+            client = self._cache.get_client(write=True)
+            pipe = client.pipeline()
+            for field, value in stats.items():
+                if value:
+                    pipe.hincrby(STATS_KEY.format(namespace=self.namespace), field, value)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"Cache stats flush failed for {self.namespace}: {e}")
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        if value is _MISSING:
+            self._count(misses=1)
+            return default
+        self._count(hits=1)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        result = super().get_many(keys, version)
+        self._count(hits=len(result), misses=len(keys) - len(result))
+        return result
+
+
+def get_or_set_single_flight(key, compute, timeout=300, alias='default', lock_timeout=30, wait=5.0):
+    """
+    Return the cached value for `key`, computing it at most once across processes.
+
+    On a miss, the first caller takes a short-lived lock and recomputes;
+    concurrent callers poll for the fresh value for up to `wait` seconds and
+    only compute it themselves if the lock holder does not deliver in time.
+    """
+    cache = caches[alias]
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    lock_key = f'lock:{key}'
+    token = uuid.uuid4().hex
+    if cache.add(lock_key, token, timeout=lock_timeout):
+        try:
+            value = compute()
+            cache.set(key, value, timeout=timeout)
+            return value
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait
+    delay = 0.05
+    while time.monotonic() < deadline:
+        time.sleep(delay)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        delay = min(delay * 2, 0.5)
+
+    logger.warning(f"Single-flight wait for '{key}' timed out, computing locally")
+    value = compute()
+    cache.set(key, value, timeout=timeout)
+    return value
+
+
+def release_lock(cache, key, token):
+    """
+    Delete the lock `key` only if it still holds `token`.
+
+    On Redis the check and the delete run as one script, so a lock that
+    expired and was taken by another worker in between is left alone.
+    """
+    if isinstance(cache, RedisCache):
+        client = cache._cache.get_client(write=True)
+        client.eval(RELEASE_LOCK_SCRIPT, 1, cache.make_and_validate_key(key), cache._cache._serializer.dumps(token))
+        return
+    # Local-memory caches are per process, so nothing else can take the lock in between
+    if cache.get(key) == token:
+        cache.delete(key)
@@ -28,6 +28,15 @@ app.autodiscover_tasks(['users'], related_name='tasks_philsys_auto')
 # Import schedule tasks for calendar notifications
 app.autodiscover_tasks(['jobs'], related_name='tasks_schedule')
 
+# Import new-job notification fanout tasks
+app.autodiscover_tasks(['jobs'], related_name='tasks_notifications')
+
+# Import job expiry tasks
+app.autodiscover_tasks(['jobs'], related_name='tasks_expiry')
+
+# Import worker recommendation tasks
+app.autodiscover_tasks(['jobs'], related_name='tasks_recommendations')
+
 # Configure Celery Beat schedule for periodic tasks
 app.conf.beat_schedule = {
     'send-daily-schedule-reminders': {
@@ -35,6 +44,26 @@ app.conf.beat_schedule = {
         'schedule': crontab(hour=8, minute=0),  # Run every day at 8:00 AM
         'options': {'expires': 3600}  # Expire if not run within 1 hour
     },
+    'sweep-expired-jobs': {
+        'task': 'jobs.tasks_expiry.sweep_expired_jobs',
+        'schedule': crontab(minute='*/15'),  # Keep in sync with EXPIRY_SWEEP_INTERVAL
+        'options': {'expires': 600}
+    },
+    'rollup-daily-metrics': {
+        'task': 'admin_dashboard.tasks.rollup_daily_metrics',
+        'schedule': crontab(minute='*/10'),
+        'options': {'expires': 540}
+    },
+    'flush-moderation-hits': {
+        'task': 'admin_dashboard.tasks.flush_moderation_hits',
+        'schedule': crontab(minute='*'),
+        'options': {'expires': 50}
+    },
+    'refresh-worker-recommendations': {
+        'task': 'jobs.tasks_recommendations.refresh_worker_recommendations',
+        'schedule': crontab(minute=20),  # Hourly; new jobs are merged in between by recommend_new_job
+        'options': {'expires': 3000}
+    },
 }
 
 
@@ -54,6 +54,13 @@ def health_check_detailed(request):
         health_status['checks']['cache'] = 'unhealthy'
         health_status['status'] = 'unhealthy'
     
+    # Navbar state cache effectiveness (informational, never fails the check)
+    try:
+        from notifications.navbar import get_metrics
+        health_status['navbar_cache'] = get_metrics()
+    except Exception as e:
+        logger.warning(f"Navbar cache metrics unavailable: {e}")
+    
     # Return appropriate status code
     status_code = 200 if health_status['status'] == 'healthy' else 503
     return JsonResponse(health_status, status=status_code)
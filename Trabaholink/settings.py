@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.gis',
+    'django.contrib.postgres',
     'django.contrib.sites',
     "corsheaders",
     
@@ -77,7 +78,6 @@ MIDDLEWARE = [
     'users.middleware.RoleSelectionMiddleware',  # ✅ Force role selection for new social users
     'users.onboarding_middleware.ProfileSetupMiddleware',  # ✅ Profile setup onboarding
     'notifications.middleware.NotificationMiddleware',
-    'jobs.middleware.ExpiredJobsMiddleware',  # Auto-deactivate expired jobs
 ]
 
 # ============================================================================
@@ -151,10 +151,7 @@ TEMPLATES = [
                 'django.template.context_processors.i18n',  # Internationalization
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
-                'notifications.context_processors.unread_notifications',
-                'admin_dashboard.context_processors.admin_notifications',
-                'jobs.context_processors.user_dashboard_access',
-                'users.context_processors.user_guide_context',  # User guide system
+                'notifications.context_processors.navbar_state',  # Cached unread counts, dashboard access, user guide, admin counts
             ],
         },
     },
@@ -176,6 +173,49 @@ CHANNEL_LAYERS = {
     },
 }
 
+# ============================================================================
+# CACHE CONFIGURATION
+# ============================================================================
+# Shared Redis cache (separate DB from Channels/Celery) so every web and
+# Celery process sees the same cached data. Each alias is its own key
+# namespace; bump CACHE_VERSION to invalidate everything on deploy.
+
+REDIS_CACHE_ENABLED = os.environ.get('REDIS_CACHE_ENABLED', 'True') == 'True'
+REDIS_CACHE_URL = os.environ.get(
+    'REDIS_CACHE_URL',
+    f"redis://:{os.environ.get('REDIS_PASSWORD', '')}@{os.environ.get('REDIS_HOST', '127.0.0.1')}:{os.environ.get('REDIS_PORT', '6379')}/1"
+    if os.environ.get('REDIS_PASSWORD') else
+    f"redis://{os.environ.get('REDIS_HOST', '127.0.0.1')}:{os.environ.get('REDIS_PORT', '6379')}/1"
+)
+CACHE_VERSION = int(os.environ.get('CACHE_VERSION', '1'))
+
+def _cache(namespace, timeout=300):
+    if not REDIS_CACHE_ENABLED:
+        # Local development without Redis: per-process memory cache
+        return {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': namespace,
+            'TIMEOUT': timeout,
+        }
+    return {
+        'BACKEND': 'Trabaholink.cache.InstrumentedRedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+        'KEY_PREFIX': namespace,
+        'VERSION': CACHE_VERSION,
+        'TIMEOUT': timeout,
+    }
+
+CACHES = {
+    'default': _cache('default'),
+    'sessions': _cache('sessions', timeout=SESSION_COOKIE_AGE),
+    'fragments': _cache('fragments', timeout=600),  # {% cache %} template fragments
+    'counters': _cache('counters', timeout=None),  # Metrics/counters, never expire
+    'verification': _cache('verification', timeout=600),  # Verification progress (written by Celery)
+}
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+
 # CORS Configuration
 CORS_ALLOWED_ORIGINS = os.environ.get(
     'CORS_ALLOWED_ORIGINS', 
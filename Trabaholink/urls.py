@@ -9,6 +9,7 @@ from django.views.decorators.http import require_GET
 from django.views.decorators.cache import cache_control
 import os
 from .health_views import health_check, health_check_detailed
+from jobs.api_views import map_clusters_api
 
 @require_GET
 @cache_control(max_age=0, no_cache=True, no_store=True, must_revalidate=True)
@@ -35,6 +36,7 @@ urlpatterns = [
     path('reports/', include('reports.urls', namespace='reports')),
     # API URLs
     path('api/jobs/', include('jobs.api_urls', namespace='jobs_api')),
+    path('api/map/clusters', map_clusters_api, name='map_clusters'),
     # Allauth URLs
     path('accounts/', include('allauth.urls')),
     # Internationalization
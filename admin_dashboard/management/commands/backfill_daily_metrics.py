@@ -0,0 +1,45 @@
+"""
+Management command to (re)build DailyMetrics rows for past days
+"""
+from datetime import date, timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from admin_dashboard.metrics import rollup
+
+
+class Command(BaseCommand):
+    help = 'Recompute daily dashboard metrics for a date range (default: the last 365 days)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help='Number of days ending today to recompute (default: 365)'
+        )
+        parser.add_argument(
+            '--start',
+            help='First day to recompute (YYYY-MM-DD); overrides --days'
+        )
+        parser.add_argument(
+            '--end',
+            help='Last day to recompute (YYYY-MM-DD, default: today)'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            end = date.fromisoformat(options['end']) if options['end'] else timezone.localdate()
+            if options['start']:
+                start = date.fromisoformat(options['start'])
+            else:
+                start = end - timedelta(days=options['days'] - 1)
+        except ValueError as e:
+            raise CommandError(f'Invalid date: {e}')
+
+        if start > end:
+            raise CommandError('--start must not be after --end')
+
+        written = rollup(start, end)
+        self.stdout.write(
+            self.style.SUCCESS(f'Rolled up {written} day(s) from {start} to {end}')
+        )
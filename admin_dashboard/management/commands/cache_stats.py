@@ -0,0 +1,63 @@
+"""
+Management command to report hit ratio and memory use per cache namespace
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+from Trabaholink.cache import InstrumentedRedisCache, STATS_KEY
+
+
+class Command(BaseCommand):
+    help = 'Show hit ratio, key count and memory usage for each configured cache alias'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sample',
+            type=int,
+            default=200,
+            help='Number of keys per namespace to sample with MEMORY USAGE (default: 200)'
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the hit/miss counters after reporting'
+        )
+
+    def handle(self, *args, **options):
+        sample_size = options['sample']
+
+        for alias in settings.CACHES:
+            cache = caches[alias]
+            if not isinstance(cache, InstrumentedRedisCache):
+                self.stdout.write(f"{alias}: {type(cache).__name__} (no stats)")
+                continue
+
+            client = cache._cache.get_client(write=True)
+            stats_key = STATS_KEY.format(namespace=cache.namespace)
+            stats = {k.decode(): int(v) for k, v in client.hgetall(stats_key).items()}
+            hits = stats.get('hits', 0)
+            misses = stats.get('misses', 0)
+            total = hits + misses
+            ratio = f"{hits / total:.1%}" if total else 'n/a'
+
+            # SCAN the namespace; sample MEMORY USAGE and extrapolate
+            key_count = 0
+            sampled_bytes = 0
+            sampled = 0
+            for key in client.scan_iter(match=f"{cache.namespace}:*", count=1000):
+                key_count += 1
+                if sampled < sample_size:
+                    sampled_bytes += client.memory_usage(key) or 0
+                    sampled += 1
+            est_bytes = int(sampled_bytes / sampled * key_count) if sampled else 0
+
+            self.stdout.write(
+                f"{alias}: hits={hits} misses={misses} hit_ratio={ratio} "
+                f"keys={key_count} memory~{est_bytes / 1024:.1f} KiB"
+            )
+
+            if options['reset']:
+                client.delete(stats_key)
+
+        if options['reset']:
+            self.stdout.write(self.style.SUCCESS('Cache stats counters reset'))
@@ -0,0 +1,177 @@
+"""
+Daily metrics rollup for the admin dashboard.
+
+Flow metrics (rows created per day) are counted with one grouped
+TruncDate query per source over a whole date range, so a backfill of a
+year costs the same handful of queries as a single day. Gauges (current
+totals) are snapshotted onto today's row only; backfilled past days keep
+whatever gauges they had (zero for rows created by a backfill).
+
+The beat task rolls up yesterday and today every few minutes; the
+dashboard and chart endpoint then read a date range from DailyMetrics in
+one query.
+"""
+from datetime import datetime, time, timedelta
+from django.apps import apps
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+import logging
+
+from .models import DailyMetrics
+
+logger = logging.getLogger(__name__)
+
+# metric -> (model label, timestamp field, extra filter)
+FLOW_METRICS = {
+    'new_users': ('users.CustomUser', 'date_joined', None),
+    'new_jobs': ('jobs.Job', 'created_at', None),
+    'new_services': ('services.ServicePost', 'created_at', None),
+    'new_reports': ('reports.Report', 'created_at', None),
+    'new_contracts': ('jobs.Contract', 'created_at', None),
+    'new_verifications': ('users.AccountVerification', 'submitted_at', None),
+    'approved_verifications': ('users.AccountVerification', 'reviewed_at', Q(status='approved')),
+}
+
+GAUGE_METRICS = (
+    'total_users', 'active_users', 'active_jobs', 'approved_services',
+    'total_reports', 'pending_reports', 'user_reports', 'post_reports',
+    'total_skill_verifications', 'pending_skill_verifications', 'verified_skill_verifications',
+)
+
+CHART_METRICS = tuple(FLOW_METRICS) + GAUGE_METRICS
+
+# Ranges offered by the dashboard chart selectors; the API accepts any up to the max
+CHART_RANGES = (7, 30, 90, 365)
+MAX_CHART_DAYS = 365
+
+
+def _day_bounds(start_date, end_date):
+    """Aware datetimes for [start_date 00:00, end_date + 1 day 00:00) in the current timezone."""
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz)
+    return start, end
+
+
+def count_flows(start_date, end_date):
+    """{date: {metric: count}} for every flow metric over the inclusive range."""
+    start, end = _day_bounds(start_date, end_date)
+    counts = {}
+    for metric, (label, field, extra) in FLOW_METRICS.items():
+        queryset = apps.get_model(label)._default_manager.filter(**{
+            f'{field}__gte': start,
+            f'{field}__lt': end,
+        })
+        if extra is not None:
+            queryset = queryset.filter(extra)
+        rows = queryset.order_by().annotate(day=TruncDate(field)).values('day').annotate(n=Count('pk'))
+        for row in rows:
+            counts.setdefault(row['day'], {})[metric] = row['n']
+    return counts
+
+
+def snapshot_gauges():
+    """Current platform totals, one aggregate query per source table."""
+    CustomUser = apps.get_model('users.CustomUser')
+    Job = apps.get_model('jobs.Job')
+    ServicePost = apps.get_model('services.ServicePost')
+    Report = apps.get_model('reports.Report')
+    Skill = apps.get_model('users.Skill')
+
+    users = CustomUser.objects.aggregate(
+        total_users=Count('pk'),
+        active_users=Count('pk', filter=Q(is_active=True)),
+    )
+    reports = Report.objects.aggregate(
+        total_reports=Count('pk'),
+        pending_reports=Count('pk', filter=Q(status='pending')),
+        user_reports=Count('pk', filter=Q(reported_user__isnull=False)),
+        post_reports=Count('pk', filter=Q(reported_post__isnull=False)),
+    )
+    skills = Skill.objects.aggregate(
+        total_skill_verifications=Count('pk'),
+        pending_skill_verifications=Count('pk', filter=Q(status='pending')),
+        verified_skill_verifications=Count('pk', filter=Q(status='verified')),
+    )
+    return {
+        **users,
+        'active_jobs': Job.objects.filter(is_active=True).count(),
+        'approved_services': ServicePost.objects.filter(status='approved').count(),
+        **reports,
+        **skills,
+    }
+
+
+def rollup(start_date, end_date=None):
+    """
+    Recompute DailyMetrics rows for the inclusive date range and return
+    how many were written. Today's row, if in range, also gets fresh gauges.
+    """
+    end_date = end_date or start_date
+    today = timezone.localdate()
+    flows = count_flows(start_date, end_date)
+    gauges = snapshot_gauges() if start_date <= today <= end_date else {}
+
+    rows = []
+    day = start_date
+    while day <= end_date:
+        values = {metric: flows.get(day, {}).get(metric, 0) for metric in FLOW_METRICS}
+        if day == today:
+            values.update(gauges)
+        rows.append(DailyMetrics(date=day, **values))
+        day += timedelta(days=1)
+
+    # Past days keep their stored gauges; only today's are refreshed
+    DailyMetrics.objects.bulk_create(
+        [row for row in rows if row.date != today],
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['date'],
+        update_fields=list(FLOW_METRICS) + ['computed_at'],
+    )
+    DailyMetrics.objects.bulk_create(
+        [row for row in rows if row.date == today],
+        update_conflicts=True,
+        unique_fields=['date'],
+        update_fields=list(FLOW_METRICS) + list(GAUGE_METRICS) + ['computed_at'],
+    )
+    return len(rows)
+
+
+def get_today_metrics():
+    """Today's DailyMetrics row, rolled up on the spot if the beat hasn't yet."""
+    today = timezone.localdate()
+    metrics = DailyMetrics.objects.filter(date=today).first()
+    if metrics is None:
+        rollup(today)
+        metrics = DailyMetrics.objects.get(date=today)
+    return metrics
+
+
+def get_series(days, metrics, end_date=None):
+    """
+    {'labels': [...], metric: [...]} for the `days` days ending `end_date`
+    (default today), read from DailyMetrics in one query. Days without a
+    row count as zero.
+    """
+    end_date = end_date or timezone.localdate()
+    start_date = end_date - timedelta(days=days - 1)
+    stored = {
+        row['date']: row
+        for row in DailyMetrics.objects.filter(
+            date__gte=start_date, date__lte=end_date
+        ).values('date', *metrics)
+    }
+
+    label_format = '%b %d' if days <= 90 else '%b %d, %Y'
+    series = {'labels': []}
+    for metric in metrics:
+        series[metric] = []
+    for offset in range(days):
+        day = start_date + timedelta(days=offset)
+        series['labels'].append(day.strftime(label_format))
+        row = stored.get(day, {})
+        for metric in metrics:
+            series[metric].append(row.get(metric, 0))
+    return series
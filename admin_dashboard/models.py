@@ -51,3 +51,45 @@ class ModeratedWord(models.Model):
         """Fetch all banned words from the database."""
         return list(cls.objects.filter(is_banned=True).values_list('word', flat=True))
 
+
+
+class DailyMetrics(models.Model):
+    """
+    One row per calendar day (Asia/Manila) of platform activity.
+
+    `new_*` columns count rows created that day. Gauge columns (`total_*`,
+    `active_*`, `pending_*`) are snapshots taken when the day was last
+    rolled up, i.e. end-of-day for past days and near-live for today.
+    Written by admin_dashboard.metrics (beat task + backfill command) and
+    read by the dashboard home page and its chart endpoint.
+    """
+    date = models.DateField(unique=True)
+
+    new_users = models.PositiveIntegerField(default=0)
+    new_jobs = models.PositiveIntegerField(default=0)
+    new_services = models.PositiveIntegerField(default=0)
+    new_reports = models.PositiveIntegerField(default=0)
+    new_contracts = models.PositiveIntegerField(default=0)
+    new_verifications = models.PositiveIntegerField(default=0)
+    approved_verifications = models.PositiveIntegerField(default=0)
+
+    total_users = models.PositiveIntegerField(default=0)
+    active_users = models.PositiveIntegerField(default=0)
+    active_jobs = models.PositiveIntegerField(default=0)
+    approved_services = models.PositiveIntegerField(default=0)
+    total_reports = models.PositiveIntegerField(default=0)
+    pending_reports = models.PositiveIntegerField(default=0)
+    user_reports = models.PositiveIntegerField(default=0)
+    post_reports = models.PositiveIntegerField(default=0)
+    total_skill_verifications = models.PositiveIntegerField(default=0)
+    pending_skill_verifications = models.PositiveIntegerField(default=0)
+    verified_skill_verifications = models.PositiveIntegerField(default=0)
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name_plural = "Daily metrics"
+
+    def __str__(self):
+        return f"Metrics for {self.date}"
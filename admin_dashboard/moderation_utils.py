@@ -1,5 +1,173 @@
 from admin_dashboard.models import ModeratedWord
+from django.core.cache import cache, caches
+from django.db.models import Case, F, IntegerField, Value, When
+from collections import Counter
+import logging
 import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever a ModeratedWord is saved or deleted (see admin_dashboard.signals)
+VERSION_CACHE_KEY = 'moderated_words_version'
+
+# How often (seconds) a process re-reads the version key before matching
+VERSION_CHECK_INTERVAL = 5
+
+# Upper bound on matcher age, in case a version bump was missed
+MATCHER_MAX_AGE = 300
+
+# Per-word hit counters in the shared 'counters' cache, moved into
+# ModeratedWord.flagged_count by the flush_moderation_hits beat task
+HIT_CACHE_KEY = 'moderated_word_hits:{word_id}'
+
+
+class BannedWordMatcher:
+    """
+    Matches a whole word list with one compiled regex.
+
+    Words are joined into a single case-insensitive alternation (longest
+    first so phrases win over their own words). Multi-word phrases match
+    across any run of whitespace, and matches must not touch other word
+    characters on either side.
+    """
+
+    def __init__(self, words):
+        self.words = {}
+        for word_id, word in words:
+            key = self.normalize(word)
+            if key:
+                self.words.setdefault(key, (word_id, word))
+
+        if self.words:
+            alternatives = sorted(self.words, key=len, reverse=True)
+            body = '|'.join(r'\s+'.join(re.escape(part) for part in key.split()) for key in alternatives)
+            self.pattern = re.compile(r'(?<!\w)(?:' + body + r')(?!\w)', re.IGNORECASE)
+        else:
+            self.pattern = None
+
+    @staticmethod
+    def normalize(text):
+        return ' '.join(text.lower().split())
+
+    def find(self, text):
+        """Return [(word_id, word)] for each distinct listed word found in text."""
+        if not self.pattern or not text:
+            return []
+        found = {}
+        for match in self.pattern.finditer(text):
+            key = self.normalize(match.group(0))
+            if key in self.words and key not in found:
+                found[key] = self.words[key]
+        return list(found.values())
+
+    def censor(self, text):
+        """Replace every listed word in text with asterisks of the same length."""
+        if not self.pattern or not text:
+            return text
+        return self.pattern.sub(lambda match: '*' * len(match.group(0)), text)
+
+
+_lock = threading.Lock()
+_matchers = {}  # kind -> (version, built_at, matcher)
+_version_state = {'version': None, 'checked_at': 0.0}
+
+
+def get_moderated_words_version():
+    """Return the shared word-list version, checking the cache at most every few seconds."""
+    now = time.monotonic()
+    if now - _version_state['checked_at'] > VERSION_CHECK_INTERVAL:
+        version = cache.get(VERSION_CACHE_KEY)
+        if version is None:
+            version = 1
+            cache.add(VERSION_CACHE_KEY, version, timeout=None)
+        _version_state['version'] = version
+        _version_state['checked_at'] = now
+    return _version_state['version']
+
+
+def bump_moderated_words_version():
+    """Invalidate every process's compiled matchers."""
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(VERSION_CACHE_KEY, 2, timeout=None)
+    _version_state['checked_at'] = 0.0
+
+
+def get_matcher(kind='banned'):
+    """
+    Return the process-wide matcher for a word list.
+
+    kind='banned' covers words with is_banned=True (moderation checks);
+    kind='censor' covers every ModeratedWord (save-time censoring).
+    The matcher is rebuilt only when the version key changes.
+    """
+    version = get_moderated_words_version()
+    entry = _matchers.get(kind)
+    if entry and entry[0] == version and time.monotonic() - entry[1] < MATCHER_MAX_AGE:
+        return entry[2]
+
+    with _lock:
+        entry = _matchers.get(kind)
+        if entry and entry[0] == version and time.monotonic() - entry[1] < MATCHER_MAX_AGE:
+            return entry[2]
+
+        words = ModeratedWord.objects.all()
+        if kind == 'banned':
+            words = words.filter(is_banned=True)
+        matcher = BannedWordMatcher(words.values_list('id', 'word'))
+        _matchers[kind] = (version, time.monotonic(), matcher)
+        return matcher
+
+
+def record_hits(word_ids):
+    """
+    Count flagged words in the shared counters cache, so hits survive idle
+    or killed processes until flush_hits() moves them to the database.
+    """
+    counters = caches['counters']
+    for word_id, count in Counter(word_ids).items():
+        key = HIT_CACHE_KEY.format(word_id=word_id)
+        try:
+            counters.incr(key, count)
+        except ValueError:
+            if not counters.add(key, count, timeout=None):
+                counters.incr(key, count)
+        except Exception as e:
+            logger.debug(f"Moderated word hit count update failed: {e}")
+
+
+def flush_hits():
+    """
+    Add the cached hit counts to ModeratedWord.flagged_count in one UPDATE.
+    Counts are taken out of the cache only after the UPDATE succeeds, and
+    by decrement, so hits recorded meanwhile are kept for the next flush.
+    """
+    counters = caches['counters']
+    keys = {
+        HIT_CACHE_KEY.format(word_id=word_id): word_id
+        for word_id in ModeratedWord.objects.values_list('id', flat=True)
+    }
+    hits = {keys[key]: count for key, count in counters.get_many(list(keys)).items() if count}
+    if not hits:
+        return 0
+
+    ModeratedWord.objects.filter(pk__in=hits).update(
+        flagged_count=F('flagged_count') + Case(
+            *[When(pk=word_id, then=Value(count)) for word_id, count in hits.items()],
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    )
+    for word_id, count in hits.items():
+        try:
+            counters.decr(HIT_CACHE_KEY.format(word_id=word_id), count)
+        except ValueError:
+            pass  # Evicted meanwhile
+    return sum(hits.values())
+
 
 def check_for_banned_words(text):
     """
@@ -8,21 +176,11 @@ def check_for_banned_words(text):
     """
     if not text:
         return False, []
-    
-    text_lower = text.lower()
-    banned_words = ModeratedWord.objects.filter(is_banned=True)
-    flagged_words = []
-    
-    for word_obj in banned_words:
-        word = word_obj.word.lower()
-        # Use word boundaries to match whole words
-        pattern = r'\b' + re.escape(word) + r'\b'
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            flagged_words.append(word_obj.word)
-            # Increment flagged count
-            word_obj.flagged_count = (word_obj.flagged_count or 0) + 1
-            word_obj.save()
-    
+
+    found = get_matcher('banned').find(text)
+    record_hits([word_id for word_id, _ in found])
+    flagged_words = [word for _, word in found]
+
     return len(flagged_words) > 0, flagged_words
 
 def sanitize_text(text):
@@ -31,15 +189,15 @@ def sanitize_text(text):
     """
     if not text:
         return text
-    
-    banned_words = ModeratedWord.objects.filter(is_banned=True)
-    sanitized = text
-    
-    for word_obj in banned_words:
-        word = word_obj.word
-        # Replace with asterisks of same length
-        replacement = '*' * len(word)
-        pattern = re.compile(re.escape(word), re.IGNORECASE)
-        sanitized = pattern.sub(replacement, sanitized)
-    
-    return sanitized
+
+    return get_matcher('banned').censor(text)
+
+def censor_text(text):
+    """
+    Replace every moderated word (banned or not) with asterisks.
+    Used when saving user content (jobs, messages, announcements, feedback).
+    """
+    if not text:
+        return text
+
+    return get_matcher('censor').censor(text)
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from admin_dashboard.models import ModeratedWord
+from admin_dashboard.moderation_utils import bump_moderated_words_version
+
+
+@receiver(post_save, sender=ModeratedWord)
+@receiver(post_delete, sender=ModeratedWord)
+def invalidate_banned_word_matchers(sender, **kwargs):
+    """Rebuild compiled banned-word matchers in every process."""
+    bump_moderated_words_version()
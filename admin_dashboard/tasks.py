@@ -0,0 +1,34 @@
+"""
+Celery tasks for the admin dashboard: the DailyMetrics rollup and the
+moderated-word hit count flush.
+"""
+from celery import shared_task
+from datetime import timedelta
+from django.utils import timezone
+import logging
+
+from .metrics import rollup
+from .moderation_utils import flush_hits
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def rollup_daily_metrics():
+    """
+    Roll up yesterday and today. Yesterday is included so rows created
+    between the last run before midnight and midnight are still counted.
+    """
+    today = timezone.localdate()
+    written = rollup(today - timedelta(days=1), today)
+    logger.info(f"Daily metrics rolled up ({written} days)")
+    return written
+
+
+@shared_task(ignore_result=True)
+def flush_moderation_hits():
+    """Move moderated-word hit counts from the counters cache to the database."""
+    flushed = flush_hits()
+    if flushed:
+        logger.info(f"Flushed {flushed} moderated word hits")
+    return flushed
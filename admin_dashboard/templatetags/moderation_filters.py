@@ -1,6 +1,5 @@
 from django import template
-from admin_dashboard.models import ModeratedWord
-import re
+from admin_dashboard.moderation_utils import get_matcher, sanitize_text
 
 register = template.Library()
 
@@ -10,21 +9,7 @@ def censor_text(text):
     Censor banned words in text for display.
     Usage: {{ content|censor_text }}
     """
-    if not text:
-        return text
-    
-    # Get all banned words
-    banned_words = ModeratedWord.objects.filter(is_banned=True).values_list('word', flat=True)
-    
-    censored = text
-    for word in banned_words:
-        # Create case-insensitive pattern with word boundaries
-        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-        # Replace with asterisks
-        replacement = '*' * len(word)
-        censored = pattern.sub(replacement, censored)
-    
-    return censored
+    return sanitize_text(text)
 
 @register.filter(name='has_banned_words')
 def has_banned_words(text):
@@ -35,14 +20,7 @@ def has_banned_words(text):
     if not text:
         return False
     
-    banned_words = ModeratedWord.objects.filter(is_banned=True).values_list('word', flat=True)
-    
-    for word in banned_words:
-        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-        if pattern.search(text):
-            return True
-    
-    return False
+    return bool(get_matcher('banned').find(text))
 
 
 @register.filter(name='multiply')
@@ -9,6 +9,7 @@ app_name = 'admin_dashboard'
 
 urlpatterns = [
     path('', views.DashboardMainView.as_view(), name='dashboard_main'),
+    path('metrics/', views.dashboard_metrics_api, name='dashboard_metrics_api'),
     # User Management
     path('users/', views.UserListView.as_view(), name='user_list'),
     path('users/<int:pk>/', views.UserDetailView.as_view(), name='user_detail'),
@@ -81,6 +82,7 @@ urlpatterns = [
     path('admin-announcements/<int:pk>/', views.AnnouncementDetailView.as_view(), name='admin_announcement_detail'),
     path('announcements/<int:pk>/republish/', views.republish_announcement, name='republish_announcement'),
     path('announcements/<int:pk>/duplicate/', views.duplicate_announcement, name='duplicate_announcement'),
+    path('announcements/<int:pk>/broadcast-progress/', views.announcement_broadcast_progress, name='announcement_broadcast_progress'),
     
     # Skill Verification Management
     path('skill-verifications/', views.SkillVerificationListView.as_view(), name='skill_verification_list'),
@@ -15,9 +15,11 @@ from datetime import datetime, timedelta
 import json
 
 from reports.models import Report
+from .metrics import CHART_METRICS, CHART_RANGES, MAX_CHART_DAYS, get_series, get_today_metrics
 from .models import FlaggedChat, ModeratedWord
 from .forms import ModeratedWordForm, AdminCreationForm
 from users.models import CustomUser, AccountVerification, Skill, VerificationLog
+from jobs.activity_summary import get_activity_summary
 from jobs.models import Job, JobApplication
 from services.models import ServicePost
 from announcements.models import Announcement
@@ -34,61 +36,38 @@ class DashboardMainView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        User = get_user_model()
         
-        # Basic stats
-        context['total_users'] = User.objects.count()
-        context['active_users'] = User.objects.filter(is_active=True).count()
-        context['total_jobs'] = Job.objects.filter(is_active=True).count()
-        context['new_jobs_today'] = Job.objects.filter(
-            created_at__date=timezone.now().date()
-        ).count()
-        context['total_services'] = ServicePost.objects.filter(status='approved').count()
-        context['new_services_today'] = ServicePost.objects.filter(
-            created_at__date=timezone.now().date()
-        ).count()
-        context['total_reports'] = Report.objects.count()
-        context['pending_reports'] = Report.objects.filter(status='pending').count()
+        # Basic stats, from today's DailyMetrics rollup (refreshed every 10 minutes)
+        today = get_today_metrics()
+        context['total_users'] = today.total_users
+        context['active_users'] = today.active_users
+        context['total_jobs'] = today.active_jobs
+        context['new_jobs_today'] = today.new_jobs
+        context['total_services'] = today.approved_services
+        context['new_services_today'] = today.new_services
+        context['total_reports'] = today.total_reports
+        context['pending_reports'] = today.pending_reports
         context['pending_reports_count'] = context['pending_reports']
         context['moderated_words_count'] = ModeratedWord.objects.count()
         context['total_announcements'] = Announcement.objects.count()
-        context['total_skill_verifications'] = Skill.objects.count()
-        context['pending_skill_verifications'] = Skill.objects.filter(status='pending').count()
-        context['verified_skill_verifications'] = Skill.objects.filter(status='verified').count()
+        context['total_skill_verifications'] = today.total_skill_verifications
+        context['pending_skill_verifications'] = today.pending_skill_verifications
+        context['verified_skill_verifications'] = today.verified_skill_verifications
         
         # Recent reports
         context['recent_reports'] = Report.objects.order_by('-created_at')[:5]
         
-        # Chart data - User growth (last 7 days)
-        user_growth_data = []
-        user_growth_labels = []
-        for i in range(6, -1, -1):
-            date = timezone.now().date() - timedelta(days=i)
-            count = User.objects.filter(date_joined__date=date).count()
-            user_growth_data.append(count)
-            user_growth_labels.append(date.strftime('%b %d'))
-        
-        context['user_growth_data'] = json.dumps(user_growth_data)
-        context['user_growth_labels'] = json.dumps(user_growth_labels)
-        
-        # Job trends
-        job_trends_data = []
-        job_trends_labels = []
-        for i in range(6, -1, -1):
-            date = timezone.now().date() - timedelta(days=i)
-            count = Job.objects.filter(created_at__date=date).count()
-            job_trends_data.append(count)
-            job_trends_labels.append(date.strftime('%b %d'))
-        
-        context['job_trends_data'] = json.dumps(job_trends_data)
-        context['job_trends_labels'] = json.dumps(job_trends_labels)
+        # Chart data - user growth and job trends (last 7 days), one query;
+        # the range selectors reload them from dashboard_metrics_api
+        series = get_series(CHART_RANGES[0], ['new_users', 'new_jobs'])
+        context['user_growth_data'] = json.dumps(series['new_users'])
+        context['user_growth_labels'] = json.dumps(series['labels'])
+        context['job_trends_data'] = json.dumps(series['new_jobs'])
+        context['job_trends_labels'] = json.dumps(series['labels'])
         
         # Report categories - count by type (User vs Post)
-        user_reports_count = Report.objects.filter(reported_user__isnull=False).count()
-        post_reports_count = Report.objects.filter(reported_post__isnull=False).count()
-        
         context['report_categories_labels'] = json.dumps(['User Reports', 'Post Reports'])
-        context['report_categories_data'] = json.dumps([user_reports_count, post_reports_count])
+        context['report_categories_data'] = json.dumps([today.user_reports, today.post_reports])
 
         return context
     
@@ -132,7 +111,9 @@ class UserDetailView(AdminRequiredMixin, DetailView):
         
         # Get user's jobs (Job model uses 'owner' not 'posted_by')
         context['user_jobs'] = Job.objects.filter(owner=user)[:10]
-        context['user_jobs_count'] = Job.objects.filter(owner=user).count()
+        summary = get_activity_summary(user)
+        context['activity_summary'] = summary
+        context['user_jobs_count'] = summary.jobs_total
         
         # Get user's services (ServicePost model uses 'worker' field)
         context['user_services'] = ServicePost.objects.filter(worker=user)[:10]
@@ -580,6 +561,35 @@ class PendingSkillUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView
 
 # ===== NEW ADMIN DASHBOARD VIEWS =====
 
+@login_required
+def dashboard_metrics_api(request):
+    """
+    Daily series for the dashboard charts, read from DailyMetrics.
+
+    GET ?days=30&metrics=new_users,new_jobs (days 1-365, default 7)
+    """
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'Unauthorized'}, status=403)
+
+    try:
+        days = int(request.GET.get('days', CHART_RANGES[0]))
+    except ValueError:
+        return JsonResponse({'success': False, 'message': 'days must be an integer'}, status=400)
+    if not 1 <= days <= MAX_CHART_DAYS:
+        return JsonResponse({'success': False, 'message': f'days must be between 1 and {MAX_CHART_DAYS}'}, status=400)
+
+    metrics = [m for m in request.GET.get('metrics', 'new_users,new_jobs').split(',') if m]
+    unknown = [m for m in metrics if m not in CHART_METRICS]
+    if unknown or not metrics:
+        return JsonResponse({
+            'success': False,
+            'message': f"Unknown metrics: {', '.join(unknown) or '(none)'}",
+            'available': list(CHART_METRICS),
+        }, status=400)
+
+    return JsonResponse({'success': True, 'days': days, **get_series(days, metrics)})
+
+
 @require_POST
 @login_required
 def toggle_user_status(request, pk):
@@ -1091,6 +1101,37 @@ class AnnouncementDetailView(AdminRequiredMixin, DetailView):
     context_object_name = 'announcement'
 
 
+@login_required
+def announcement_broadcast_progress(request, pk):
+    """Report how far the announcement broadcast task has got"""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'Unauthorized'}, status=403)
+    
+    from announcements.models import AnnouncementBroadcast
+    
+    broadcast = AnnouncementBroadcast.objects.filter(announcement_id=pk).first()
+    if not broadcast:
+        return JsonResponse({
+            'success': False,
+            'message': 'No broadcast found for this announcement'
+        })
+    
+    return JsonResponse({
+        'success': True,
+        'broadcast': {
+            'status': broadcast.status,
+            'status_display': broadcast.get_status_display(),
+            'progress': broadcast.progress,
+            'total_recipients': broadcast.total_recipients,
+            'processed_count': broadcast.processed_count,
+            'notified_count': broadcast.notified_count,
+            'emailed_count': broadcast.emailed_count,
+            'error': broadcast.error,
+            'completed_at': broadcast.completed_at.isoformat() if broadcast.completed_at else None,
+        }
+    })
+
+
 @require_POST
 @login_required
 def republish_announcement(request, pk):
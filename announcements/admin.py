@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Announcement
+from .models import Announcement, AnnouncementBroadcast
 
 @admin.register(Announcement)
 class AnnouncementAdmin(admin.ModelAdmin):
@@ -7,3 +7,10 @@ class AnnouncementAdmin(admin.ModelAdmin):
     list_editable = ("is_active",)
     list_filter = ("is_active", "created_at")
     search_fields = ("title", "description")
+
+
+@admin.register(AnnouncementBroadcast)
+class AnnouncementBroadcastAdmin(admin.ModelAdmin):
+    list_display = ("announcement", "status", "processed_count", "total_recipients", "notified_count", "emailed_count", "updated_at")
+    list_filter = ("status",)
+    readonly_fields = ("last_user_id", "started_at", "completed_at", "updated_at")
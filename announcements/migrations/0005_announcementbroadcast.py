@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0004_announcement_is_active'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnnouncementBroadcast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('last_user_id', models.BigIntegerField(default=0, help_text='Keyset cursor: last user id processed')),
+                ('total_recipients', models.PositiveIntegerField(default=0)),
+                ('processed_count', models.PositiveIntegerField(default=0)),
+                ('notified_count', models.PositiveIntegerField(default=0)),
+                ('emailed_count', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('announcement', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='broadcast', to='announcements.announcement')),
+            ],
+        ),
+    ]
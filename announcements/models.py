@@ -1,10 +1,6 @@
 from django.db import models
 from django.conf import settings  
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from notifications.utils import send_notification_email
-from admin_dashboard.utils import load_banned_words
-from better_profanity import profanity
+from admin_dashboard.moderation_utils import censor_text
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -25,32 +21,43 @@ class Announcement(models.Model):
     def save(self, *args, **kwargs):
         # Only apply profanity filtering if content exists
         if self.content:
-            banned_words = load_banned_words()
+            self.content = censor_text(self.content)
 
-            profanity.load_censor_words([word for word in banned_words if ' ' not in word])
-            self.content = profanity.censor(self.content)
+        super().save(*args, **kwargs)
 
-            for phrase in banned_words:
-                if ' ' in phrase:  
-                    self.content = self.content.replace(phrase, '*' * len(phrase))
+class AnnouncementBroadcast(models.Model):
+    """
+    Progress of delivering an announcement to every user.
+    The broadcast task walks users in primary-key order and stores the last
+    processed id, so an interrupted broadcast resumes where it stopped.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
 
-        super().save(*args, **kwargs)
+    announcement = models.OneToOneField(Announcement, on_delete=models.CASCADE, related_name="broadcast")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    last_user_id = models.BigIntegerField(default=0, help_text="Keyset cursor: last user id processed")
+    total_recipients = models.PositiveIntegerField(default=0)
+    processed_count = models.PositiveIntegerField(default=0)
+    notified_count = models.PositiveIntegerField(default=0)
+    emailed_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Broadcast of '{self.announcement.title}' ({self.status})"
 
-@receiver(post_save, sender=Announcement)
-def notify_users_about_announcement(sender, instance, created, **kwargs):
-    if created:
-        try:
-            all_users = User.objects.all()
-            for user in all_users:
-                try:
-                    subject = "New Announcement from Trabaholink!"
-                    message = f"{instance.title}\n\n{instance.description}"
-                    send_notification_email(subject, message, user.email)
-                except Exception as e:
-                    # Log the error but don't stop the process
-                    print(f"Failed to send email to {user.email}: {str(e)}")
-                    continue
-        except Exception as e:
-            # If email sending fails completely, just log and continue
-            print(f"Email notification failed: {str(e)}")
-            pass
+    @property
+    def progress(self):
+        """Percentage of recipients processed so far."""
+        if self.status == 'completed':
+            return 100
+        if not self.total_recipients:
+            return 0
+        return min(99, int(self.processed_count * 100 / self.total_recipients))
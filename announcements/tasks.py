@@ -0,0 +1,159 @@
+"""
+Celery tasks for broadcasting announcements to all users.
+"""
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from announcements.models import Announcement, AnnouncementBroadcast
+from notifications.models import Notification, NotificationSettings
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+# Users handled per chunk (one notification INSERT + one SMTP session each)
+BROADCAST_CHUNK_SIZE = 500
+
+# Stop and re-queue before the worker's soft time limit is reached
+BROADCAST_TIME_BUDGET_SECONDS = 240
+
+
+def _recipients(announcement):
+    return User.objects.filter(is_active=True).exclude(id=announcement.posted_by_id)
+
+
+def _send_chunk_emails(announcement, recipients):
+    """Send the announcement email to a chunk over a single backend connection."""
+    subject = "New Announcement from Trabaholink!"
+    body = f"{announcement.title}\n\n{announcement.description}"
+    messages = [
+        EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [email])
+        for email in recipients
+    ]
+    if not messages:
+        return 0
+
+    try:
+        connection = get_connection(fail_silently=True)
+        connection.open()
+        try:
+            return connection.send_messages(messages) or 0
+        finally:
+            connection.close()
+    except Exception as e:
+        logger.error(f"Announcement {announcement.pk}: email chunk failed: {e}")
+        return 0
+
+
+def start_broadcast(announcement):
+    """Create the broadcast record for a new announcement and queue the task after commit."""
+    broadcast, _ = AnnouncementBroadcast.objects.get_or_create(announcement=announcement)
+
+    def _dispatch():
+        try:
+            broadcast_announcement.delay(announcement.pk)
+        except Exception as e:
+            logger.error(f"Failed to queue broadcast for announcement {announcement.pk}: {e}")
+
+    transaction.on_commit(_dispatch)
+    return broadcast
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=60)
+def broadcast_announcement(self, announcement_id):
+    """
+    Deliver an announcement to every active user in keyset-ordered chunks.
+
+    Each chunk bulk-inserts notifications and advances the cursor in one
+    transaction, then emails the chunk over a single reused connection. The
+    task re-queues itself when its time budget runs out, and a retry or
+    re-run continues from the stored cursor.
+    """
+    try:
+        announcement = Announcement.objects.get(pk=announcement_id)
+    except Announcement.DoesNotExist:
+        logger.warning(f"Announcement {announcement_id} no longer exists, skipping broadcast")
+        return {'success': False, 'reason': 'Announcement not found'}
+
+    broadcast, _ = AnnouncementBroadcast.objects.get_or_create(announcement=announcement)
+    if broadcast.status == 'completed':
+        return {'success': True, 'status': 'completed'}
+
+    if broadcast.status != 'running':
+        if not broadcast.started_at:
+            broadcast.started_at = timezone.now()
+            broadcast.total_recipients = _recipients(announcement).count()
+        broadcast.status = 'running'
+        broadcast.save(update_fields=['status', 'started_at', 'total_recipients', 'updated_at'])
+
+    email_opted_out = Exists(NotificationSettings.objects.filter(
+        user_id=OuterRef('pk'),
+        email_on_announcement=False,
+    ))
+    message = f"New announcement: {announcement.title}"
+    deadline = time.monotonic() + BROADCAST_TIME_BUDGET_SECONDS
+
+    try:
+        while True:
+            chunk = list(
+                _recipients(announcement)
+                .filter(pk__gt=broadcast.last_user_id)
+                .annotate(email_opted_out=email_opted_out)
+                .order_by('pk')
+                .values_list('pk', 'email', 'email_opted_out')[:BROADCAST_CHUNK_SIZE]
+            )
+            if not chunk:
+                break
+
+            with transaction.atomic():
+                created = Notification.objects.bulk_notify(
+                    [user_id for user_id, _, _ in chunk],
+                    "announcement",
+                    message,
+                    object_id=announcement.pk,
+                    batch_size=BROADCAST_CHUNK_SIZE,
+                )
+                broadcast.last_user_id = chunk[-1][0]
+                broadcast.processed_count += len(chunk)
+                broadcast.notified_count += len(created)
+                broadcast.save(update_fields=['last_user_id', 'processed_count', 'notified_count', 'updated_at'])
+
+            emails = [email for _, email, opted_out in chunk if email and not opted_out]
+            sent = _send_chunk_emails(announcement, emails)
+            if sent:
+                broadcast.emailed_count += sent
+                broadcast.save(update_fields=['emailed_count', 'updated_at'])
+
+            if time.monotonic() > deadline:
+                logger.info(f"Announcement {announcement_id}: time budget used at user {broadcast.last_user_id}, re-queueing")
+                broadcast_announcement.delay(announcement_id)
+                return {'success': True, 'status': 'running', 'processed': broadcast.processed_count}
+    except Exception as exc:
+        logger.exception(f"Announcement {announcement_id}: broadcast failed at user {broadcast.last_user_id}")
+        broadcast.error = str(exc)
+        if self.request.retries >= self.max_retries:
+            broadcast.status = 'failed'
+        broadcast.save(update_fields=['error', 'status', 'updated_at'])
+        raise self.retry(exc=exc)
+
+    broadcast.status = 'completed'
+    broadcast.completed_at = timezone.now()
+    broadcast.error = ""
+    broadcast.save(update_fields=['status', 'completed_at', 'error', 'updated_at'])
+
+    logger.info(
+        f"Announcement {announcement_id} broadcast complete: "
+        f"{broadcast.notified_count} notified, {broadcast.emailed_count} emailed"
+    )
+    return {
+        'success': True,
+        'status': 'completed',
+        'notified': broadcast.notified_count,
+        'emailed': broadcast.emailed_count,
+    }
@@ -0,0 +1,10 @@
+"""
+Local geography helpers (gazetteer lookups) that do not need the network.
+"""
+from .gazetteer import (Place, geocode, geocode_text, lookup_barangay,
+                        lookup_municipality, normalize)
+
+__all__ = [
+    'Place', 'geocode', 'geocode_text', 'lookup_barangay',
+    'lookup_municipality', 'normalize',
+]
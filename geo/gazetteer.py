@@ -0,0 +1,169 @@
+"""
+Local gazetteer of municipalities and barangays.
+
+The bundled dataset (geo/data/gazetteer.json, or settings.GEO_GAZETTEER_PATH)
+holds a centroid and optional aliases for every place. It is loaded once
+per process into dictionaries keyed by normalized name, so lookups never
+hit the network or the database.
+
+Coordinates in the dataset are GeoJSON order: [lng, lat].
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from django.conf import settings
+import difflib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATASET = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.json')
+
+# difflib ratio a misspelled municipality name needs to be accepted. Barangay
+# names are matched exactly (after normalize()): siblings such as "Molino 2"
+# and "Molino 3" are too close for fuzzy matching to tell apart.
+FUZZY_CUTOFF = 0.85
+
+_ROMAN_NUMERALS = {'i': '1', 'ii': '2', 'iii': '3', 'iv': '4', 'v': '5', 'vi': '6', 'vii': '7', 'viii': '8', 'ix': '9', 'x': '10'}
+_STRIP_WORDS = {'barangay', 'brgy', 'bgy', 'municipality'}
+
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    kind: str  # 'municipality' or 'barangay'
+    lat: float
+    lng: float
+    municipality: str = ''
+    province: str = ''
+
+
+def normalize(name):
+    """
+    Canonical form for matching: accents removed, lowercase, punctuation
+    dropped, "Brgy."/"Barangay" noise removed and roman numerals turned
+    into digits ("Molino IV" -> "molino 4").
+    """
+    if not name:
+        return ''
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    tokens = re.findall(r'[a-z0-9]+', name)
+    result = []
+    for i, token in enumerate(tokens):
+        if token in _STRIP_WORDS:
+            continue
+        if i > 0 and token in _ROMAN_NUMERALS:
+            token = _ROMAN_NUMERALS[token]
+        result.append(token)
+    return ' '.join(result)
+
+
+class Gazetteer:
+    """In-memory index over the gazetteer dataset."""
+
+    def __init__(self, data):
+        self.municipalities = {}  # normalized name -> Place
+        self.barangays = {}  # normalized municipality -> {normalized barangay -> Place}
+
+        for entry in data.get('municipalities', []):
+            place = self._place(entry, 'municipality')
+            for alias in [entry['name'], *entry.get('aliases', [])]:
+                self.municipalities[normalize(alias)] = place
+
+        for entry in data.get('barangays', []):
+            place = self._place(entry, 'barangay')
+            names = self.barangays.setdefault(normalize(entry['municipality']), {})
+            for alias in [entry['name'], *entry.get('aliases', [])]:
+                names[normalize(alias)] = place
+
+    @staticmethod
+    def _place(entry, kind):
+        lng, lat = entry['centroid']
+        return Place(
+            name=entry['name'],
+            kind=kind,
+            lat=lat,
+            lng=lng,
+            municipality=entry.get('municipality', entry['name'] if kind == 'municipality' else ''),
+            province=entry.get('province', ''),
+        )
+
+    def _match(self, index, name, fuzzy=True):
+        key = normalize(name)
+        if not key:
+            return None
+        if key in index:
+            return index[key]
+        if not fuzzy:
+            return None
+        close = difflib.get_close_matches(key, index.keys(), n=1, cutoff=FUZZY_CUTOFF)
+        return index[close[0]] if close else None
+
+    def municipality(self, name):
+        return self._match(self.municipalities, name)
+
+    def barangay(self, municipality, barangay):
+        muni = self.municipality(municipality)
+        if not muni:
+            return None
+        return self._match(self.barangays.get(normalize(muni.name), {}), barangay, fuzzy=False)
+
+
+_gazetteer = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer():
+    """Process-wide Gazetteer, loaded on first use."""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                path = getattr(settings, 'GEO_GAZETTEER_PATH', None) or DEFAULT_DATASET
+                with open(path, encoding='utf-8') as f:
+                    _gazetteer = Gazetteer(json.load(f))
+                logger.info(f"Loaded gazetteer from {path}")
+    return _gazetteer
+
+
+@lru_cache(maxsize=2048)
+def lookup_municipality(name):
+    """Municipality Place for a (possibly misspelled) name, or None."""
+    return get_gazetteer().municipality(name)
+
+
+@lru_cache(maxsize=4096)
+def lookup_barangay(municipality, barangay):
+    """Barangay Place within a municipality, or None."""
+    if not municipality or not barangay:
+        return None
+    return get_gazetteer().barangay(municipality, barangay)
+
+
+def geocode(municipality, barangay=None):
+    """Best centroid for an address: barangay if known, else municipality."""
+    return lookup_barangay(municipality, barangay) or lookup_municipality(municipality)
+
+
+def geocode_text(address):
+    """
+    Centroid for a free-text address such as "Blk 3, Molino 2, Bacoor":
+    comma-separated parts are tried as municipality, then each earlier part
+    as a barangay of it.
+    """
+    parts = [p for p in (address or '').split(',') if normalize(p)]
+    for i in range(len(parts) - 1, -1, -1):
+        muni = lookup_municipality(parts[i])
+        if not muni:
+            continue
+        for part in parts[:i]:
+            place = lookup_barangay(muni.name, part)
+            if place:
+                return place
+        return muni
+    return None
@@ -0,0 +1,108 @@
+"""
+NumPy distance engine for deployments without PostGIS (USE_GIS False).
+
+Candidates are narrowed in SQL with a bounding box on plain float
+latitude/longitude columns, then great-circle distances for the whole
+candidate array are computed in one vectorized haversine pass, which is
+what sorting and radius checks use instead of ST_Distance/ST_DWithin.
+"""
+import math
+import re
+
+from django.db.models import ExpressionWrapper, F, FloatField
+from django.db.models.functions import Abs
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Kilometres per degree of latitude (and of longitude at the equator)
+KM_PER_DEGREE = 111.32
+
+_POINT_RE = re.compile(r'POINT\s*\(\s*(-?[\d.]+)\s+(-?[\d.]+)\s*\)', re.IGNORECASE)
+
+
+def bounding_box(lat, lng, radius_km):
+    """(min_lat, max_lat, min_lng, max_lng) enclosing a radius around a point."""
+    dlat = radius_km / KM_PER_DEGREE
+    dlng = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+    return (
+        max(lat - dlat, -90.0), min(lat + dlat, 90.0),
+        max(lng - dlng, -180.0), min(lng + dlng, 180.0),
+    )
+
+
+def haversine_km(lat, lng, lats, lngs):
+    """Distances in km from (lat, lng) to every point in the lats/lngs arrays."""
+    lat1 = math.radians(lat)
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlng = np.radians(np.asarray(lngs, dtype=np.float64)) - math.radians(lng)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def parse_point(value):
+    """
+    (lat, lng) from a GEOS point or the text the non-GIS PointField stores
+    ("SRID=4326;POINT (lng lat)"), or None.
+    """
+    if value is None or value == '':
+        return None
+    if hasattr(value, 'x') and hasattr(value, 'y'):
+        return float(value.y), float(value.x)
+    match = _POINT_RE.search(str(value))
+    if not match:
+        return None
+    return float(match.group(2)), float(match.group(1))
+
+
+def rank_by_distance(rows, lat, lng, radius_km=None):
+    """
+    Sort (key, lat, lng, [radius_km]) rows by distance from (lat, lng).
+
+    A per-row radius (4th column) or the global `radius_km` drops rows that
+    are farther away. Returns [(key, distance_km), ...], nearest first.
+    """
+    rows = [row for row in rows if row[1] is not None and row[2] is not None]
+    if not rows:
+        return []
+
+    keys = [row[0] for row in rows]
+    columns = np.array([row[1:] for row in rows], dtype=np.float64)
+    distances = haversine_km(lat, lng, columns[:, 0], columns[:, 1])
+
+    mask = np.ones(len(rows), dtype=bool)
+    if columns.shape[1] > 2:
+        mask &= distances <= columns[:, 2]
+    if radius_km:
+        mask &= distances <= radius_km
+
+    order = np.argsort(distances, kind='stable')
+    return [(keys[i], float(distances[i])) for i in order if mask[i]]
+
+
+def nearby(queryset, lat, lng, radius_km=None, limit=None, lat_field='latitude', lng_field='longitude'):
+    """
+    [(pk, distance_km), ...] for a queryset's rows, nearest first.
+
+    With a radius the rows are pre-filtered by bounding box in SQL so only
+    plausible candidates are loaded. With a limit only the `limit` rows
+    nearest by a flat-earth approximation are loaded, which keeps the
+    haversine pass (and anything built from its result) bounded.
+    """
+    queryset = queryset.filter(**{f'{lat_field}__isnull': False, f'{lng_field}__isnull': False})
+    if radius_km:
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+        queryset = queryset.filter(**{
+            f'{lat_field}__range': (min_lat, max_lat),
+            f'{lng_field}__range': (min_lng, max_lng),
+        })
+    queryset = queryset.order_by()
+    if limit:
+        approx = ExpressionWrapper(
+            Abs(F(lat_field) - lat) + Abs(F(lng_field) - lng) * math.cos(math.radians(lat)),
+            output_field=FloatField(),
+        )
+        queryset = queryset.annotate(approx_distance=approx).order_by('approx_distance')[:limit]
+    rows = queryset.values_list('pk', lat_field, lng_field)
+    return rank_by_distance(rows, lat, lng, radius_km)
@@ -0,0 +1,237 @@
+"""
+Per-user activity counters (UserActivitySummary).
+
+Every counter is declared once in COUNTERS as a Q filter (used by the
+reconciliation queries) plus the equivalent Python test on a values() row
+(used by the incremental signal handlers), so both paths agree on what is
+counted.
+
+Incremental maintenance: the pre_save/pre_delete handlers snapshot the
+counted columns of the row, post_save/post_delete diff them against the
+new state and apply the difference with F() updates. The counted models
+derive from models.ActivityCountedModel, whose save() is atomic, and
+deletes run in the deletion collector's transaction, so the change and its
+deltas commit together. Each counted save costs two snapshot SELECTs (one
+for a new row) plus one UPDATE per affected user.
+
+Bulk QuerySet.update() calls bypass signals; callers that flip counted
+columns in bulk (job expiry) call rebuild_summaries() for the affected users.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+OPEN_CONTRACT_EXCLUDED = ('Completed', 'Cancelled')
+IN_PROGRESS_CONTRACT = ('Accepted', 'In Progress')
+
+
+@dataclass(frozen=True)
+class Counter:
+    field: str
+    user: str               # values() path to the user being counted for
+    q: Q = None             # None counts every row
+    test: object = None     # row dict -> bool, mirrors `q`
+
+
+def _status(row):
+    return (row['status'] or '').lower()
+
+
+COUNTERS = {
+    'Job': [
+        Counter('jobs_total', 'owner_id'),
+        Counter('jobs_active', 'owner_id', Q(is_active=True), lambda r: r['is_active']),
+    ],
+    'JobApplication': [
+        Counter('applications_received_total', 'job__owner_id'),
+        Counter('applications_received_pending', 'job__owner_id',
+                Q(status='Pending'), lambda r: r['status'] == 'Pending'),
+        Counter('applications_received_rejected', 'job__owner_id',
+                Q(status__iexact='rejected'), lambda r: _status(r) == 'rejected'),
+        Counter('applications_sent_total', 'worker_id'),
+        Counter('applications_sent_pending', 'worker_id',
+                Q(status='Pending'), lambda r: r['status'] == 'Pending'),
+        Counter('applications_sent_rejected', 'worker_id',
+                Q(status__iexact='rejected'), lambda r: _status(r) == 'rejected'),
+        Counter('applications_sent_archived', 'worker_id',
+                Q(status__iexact='archived'), lambda r: _status(r) == 'archived'),
+    ],
+    'Contract': [
+        Counter(f'{role}_contracts_{bucket}', f'{role}_id', q, test)
+        for role in ('client', 'worker')
+        for bucket, q, test in (
+            ('open', ~Q(status__in=OPEN_CONTRACT_EXCLUDED),
+             lambda r: r['status'] not in OPEN_CONTRACT_EXCLUDED),
+            ('in_progress', Q(status__in=IN_PROGRESS_CONTRACT),
+             lambda r: r['status'] in IN_PROGRESS_CONTRACT),
+            ('completed', Q(status='Completed'), lambda r: r['status'] == 'Completed'),
+            ('cancelled', Q(status='Cancelled'), lambda r: r['status'] == 'Cancelled'),
+        )
+    ],
+    'JobOffer': [
+        Counter('offers_sent_total', 'employer_id'),
+        Counter('offers_sent_pending', 'employer_id',
+                Q(status='Pending'), lambda r: r['status'] == 'Pending'),
+        Counter('offers_received_total', 'worker_id'),
+        Counter('offers_received_pending', 'worker_id',
+                Q(status='Pending'), lambda r: r['status'] == 'Pending'),
+    ],
+}
+
+# Columns each model's counters read; saves touching none of them are skipped
+TRACKED_FIELDS = {
+    'Job': {'owner', 'owner_id', 'is_active'},
+    'JobApplication': {'job', 'job_id', 'worker', 'worker_id', 'status'},
+    'Contract': {'client', 'client_id', 'worker', 'worker_id', 'status'},
+    'JobOffer': {'employer', 'employer_id', 'worker', 'worker_id', 'status'},
+}
+
+COUNTER_FIELDS = [counter.field for counters in COUNTERS.values() for counter in counters]
+
+
+def _value_paths(model_name):
+    paths = {counter.user for counter in COUNTERS[model_name]}
+    return sorted(paths | ({'is_active'} if model_name == 'Job' else {'status'}))
+
+
+def snapshot(model, pk):
+    """The counted columns of one row as a dict, or None if it doesn't exist."""
+    if pk is None:
+        return None
+    return model._default_manager.filter(pk=pk).values(*_value_paths(model.__name__)).first()
+
+
+def tally(model_name, row):
+    """{(user_id, field): 1} for every counter the row contributes to."""
+    if row is None:
+        return {}
+    counts = {}
+    for counter in COUNTERS[model_name]:
+        user_id = row[counter.user]
+        if user_id is not None and (counter.test is None or counter.test(row)):
+            counts[(user_id, counter.field)] = 1
+    return counts
+
+
+def diff(model_name, before, after):
+    """{user_id: {field: delta}} between two snapshots of the same row."""
+    deltas = defaultdict(dict)
+    old, new = tally(model_name, before), tally(model_name, after)
+    for key in old.keys() | new.keys():
+        delta = new.get(key, 0) - old.get(key, 0)
+        if delta:
+            user_id, field = key
+            deltas[user_id][field] = delta
+    return deltas
+
+
+def apply_deltas(deltas, create_missing=True):
+    """
+    Add `deltas` to the stored counters with F() updates.
+
+    Users without a summary row get one built from scratch (which already
+    includes the change) unless `create_missing` is False, as on deletes,
+    where the user may be the one being deleted.
+    """
+    from .models import UserActivitySummary
+
+    missing = []
+    for user_id, fields in deltas.items():
+        updated = UserActivitySummary.objects.filter(user_id=user_id).update(
+            **{field: F(field) + delta for field, delta in fields.items()}
+        )
+        if not updated:
+            missing.append(user_id)
+    if missing and create_missing:
+        rebuild_summaries(missing)
+
+
+def compute_counts(user_ids=None):
+    """
+    {user_id: {field: count}} straight from the source tables, with one
+    grouped query per (model, user path). Users with no activity are absent.
+    """
+    from django.apps import apps
+
+    totals = defaultdict(dict)
+    for model_name, counters in COUNTERS.items():
+        model = apps.get_model('jobs', model_name)
+        by_path = defaultdict(list)
+        for counter in counters:
+            by_path[counter.user].append(counter)
+
+        for path, path_counters in by_path.items():
+            queryset = model._default_manager.filter(**{f'{path}__isnull': False})
+            if user_ids is not None:
+                queryset = queryset.filter(**{f'{path}__in': user_ids})
+            rows = queryset.order_by().values(path).annotate(**{
+                counter.field: Count('pk', filter=counter.q) if counter.q is not None else Count('pk')
+                for counter in path_counters
+            })
+            for row in rows:
+                user_id = row.pop(path)
+                totals[user_id].update(row)
+    return totals
+
+
+def rebuild_summaries(user_ids=None, dry_run=False):
+    """
+    Recompute counters from the source tables and fix any stored row that
+    drifted (all users when `user_ids` is None). Returns the ids of users
+    whose summary was created or corrected.
+    """
+    from users.models import CustomUser
+    from .models import UserActivitySummary
+
+    counts = compute_counts(user_ids)
+    stored = UserActivitySummary.objects.all()
+    if user_ids is not None:
+        stored = stored.filter(user_id__in=user_ids)
+    stored = {summary.user_id: summary for summary in stored}
+
+    wanted = set(counts) if user_ids is None else set(user_ids)
+    wanted |= set(stored)
+    existing_users = set(CustomUser.objects.filter(pk__in=wanted).values_list('pk', flat=True))
+
+    now = timezone.now()
+    to_create, to_update, changed = [], [], []
+    for user_id in wanted & existing_users:
+        expected = {field: counts.get(user_id, {}).get(field, 0) for field in COUNTER_FIELDS}
+        summary = stored.get(user_id)
+        if summary is None:
+            to_create.append(UserActivitySummary(user_id=user_id, reconciled_at=now, **expected))
+            changed.append(user_id)
+            continue
+        drift = {f: v for f, v in expected.items() if getattr(summary, f) != v}
+        if not drift:
+            continue
+        logger.info(f"Activity summary drift for user {user_id}: {drift}")
+        for field, value in drift.items():
+            setattr(summary, field, value)
+        summary.reconciled_at = now
+        to_update.append(summary)
+        changed.append(user_id)
+
+    if not dry_run:
+        with transaction.atomic():
+            UserActivitySummary.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+            UserActivitySummary.objects.bulk_update(
+                to_update, COUNTER_FIELDS + ['reconciled_at'], batch_size=500
+            )
+    return changed
+
+
+def get_activity_summary(user):
+    """The user's UserActivitySummary, built on first access."""
+    from .models import UserActivitySummary
+
+    summary = UserActivitySummary.objects.filter(user=user).first()
+    if summary is None:
+        rebuild_summaries([user.pk])
+        summary = UserActivitySummary.objects.get(user=user)
+    return summary
@@ -4,7 +4,7 @@ from .api_views import (
     JobViewSet, JobApplicationViewSet, JobOfferViewSet,
     ContractViewSet, ProgressLogViewSet, DashboardViewSet,
     JobCategoryViewSet, JobProgressViewSet, FeedbackViewSet,
-    schedule_events_api
+    schedule_events_api, available_workers_api
 )
 
 router = DefaultRouter()
@@ -23,4 +23,5 @@ app_name = 'jobs_api'
 urlpatterns = [
     path('', include(router.urls)),
     path('schedule/events/', schedule_events_api, name='schedule_events'),
+    path('workers/available/', available_workers_api, name='available_workers'),
 ]
@@ -15,6 +15,9 @@ from .serializers import (
     DashboardStatsSerializer, JobCategorySerializer, JobProgressSerializer, FeedbackSerializer
 )
 from notifications.models import Notification
+from .activity_summary import get_activity_summary
+from .recommendations import TOP_N, get_recommended_jobs
+from .search import JobSearchFilter
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -30,8 +33,8 @@ class JobViewSet(viewsets.ModelViewSet):
     queryset = Job.objects.filter(is_active=True).select_related('owner', 'category')
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'description', 'municipality', 'barangay']
+    # JobSearchFilter runs last so relevance ordering wins over the default
+    filter_backends = [filters.OrderingFilter, JobSearchFilter]
     ordering_fields = ['created_at', 'budget', 'title']
     ordering = ['-created_at']
     
@@ -74,6 +77,20 @@ class JobViewSet(viewsets.ModelViewSet):
         serializer = JobApplicationSerializer(page, many=True, context={'request': request})
         return paginator.get_paginated_response(serializer.data)
     
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def recommended(self, request):
+        """Get precomputed job recommendations for the current worker"""
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), TOP_N)
+        except ValueError:
+            limit = 10
+        jobs = get_recommended_jobs(request.user, limit=limit)
+        serializer = JobListSerializer(jobs, many=True, context={'request': request})
+        data = serializer.data
+        for item, job in zip(data, jobs):
+            item['recommendation_score'] = job.recommendation_score
+        return Response(data)
+    
     @action(detail=False, methods=['get'])
     def my_jobs(self, request):
         """Get jobs posted by the current user"""
@@ -799,29 +816,17 @@ class DashboardViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def employer_stats(self, request):
         """Get statistics for employer dashboard"""
-        user = request.user
+        summary = get_activity_summary(request.user)
         
         stats = {
-            'total_jobs': Job.objects.filter(owner=user).count(),
-            'active_jobs': Job.objects.filter(owner=user, is_active=True).count(),
-            'total_applications': JobApplication.objects.filter(job__owner=user, status='Pending').count(),
-            'pending_applications': JobApplication.objects.filter(
-                job__owner=user, 
-                status='Pending'
-            ).count(),
-            'active_contracts': Contract.objects.filter(
-                client=user, 
-                status__in=['Accepted', 'In Progress']
-            ).count(),
-            'completed_contracts': Contract.objects.filter(
-                client=user, 
-                status='Completed'
-            ).count(),
-            'total_offers_sent': JobOffer.objects.filter(employer=user).count(),
-            'pending_offers': JobOffer.objects.filter(
-                employer=user, 
-                status='Pending'
-            ).count(),
+            'total_jobs': summary.jobs_total,
+            'active_jobs': summary.jobs_active,
+            'total_applications': summary.applications_received_pending,
+            'pending_applications': summary.applications_received_pending,
+            'active_contracts': summary.client_contracts_in_progress,
+            'completed_contracts': summary.client_contracts_completed,
+            'total_offers_sent': summary.offers_sent_total,
+            'pending_offers': summary.offers_sent_pending,
         }
         
         serializer = DashboardStatsSerializer(stats)
@@ -830,32 +835,52 @@ class DashboardViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def worker_stats(self, request):
         """Get statistics for worker dashboard"""
-        user = request.user
+        summary = get_activity_summary(request.user)
         
         stats = {
-            'total_applications': JobApplication.objects.filter(worker=user).count(),
-            'pending_applications': JobApplication.objects.filter(
-                worker=user, 
-                status='Pending'
-            ).count(),
-            'active_contracts': Contract.objects.filter(
-                worker=user, 
-                status__in=['Accepted', 'In Progress']
-            ).count(),
-            'completed_contracts': Contract.objects.filter(
-                worker=user, 
-                status='Completed'
-            ).count(),
-            'total_offers_received': JobOffer.objects.filter(worker=user).count(),
-            'pending_offers': JobOffer.objects.filter(
-                worker=user, 
-                status='Pending'
-            ).count(),
+            'total_jobs': summary.jobs_total,
+            'active_jobs': summary.jobs_active,
+            'total_applications': summary.applications_sent_total,
+            'pending_applications': summary.applications_sent_pending,
+            'active_contracts': summary.worker_contracts_in_progress,
+            'completed_contracts': summary.worker_contracts_completed,
+            'total_offers_received': summary.offers_received_total,
+            'pending_offers': summary.offers_received_pending,
         }
         
         serializer = DashboardStatsSerializer(stats)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'])
+    def workload(self, request):
+        """
+        Per-day workload heatmap for the worker over ?start=&end= (YYYY-MM-DD,
+        inclusive; FullCalendar datetimes are accepted). Defaults to the current month.
+        """
+        from .calendar_events import CalendarWindowError, parse_window
+        from .schedule_utils import MAX_WORKLOAD_DAYS, workload_range
+
+        try:
+            start_date, end_date = parse_window(
+                request.GET.get('start'), request.GET.get('end'), max_days=MAX_WORKLOAD_DAYS,
+            )
+        except CalendarWindowError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        workload = workload_range(request.user.pk, start_date, end_date)
+        return Response({
+            'start': workload['start'].isoformat(),
+            'end': workload['end'].isoformat(),
+            'days': [{**day, 'date': day['date'].isoformat()} for day in workload['days']],
+            'contracts': [{
+                'id': contract['id'],
+                'title': contract['job__title'],
+                'client': contract['client__username'],
+                'start_date': contract['start_date'].isoformat(),
+                'end_date': contract['end_date'].isoformat() if contract['end_date'] else None,
+            } for contract in workload['contracts']],
+        })
+
 
 class JobCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -950,110 +975,68 @@ class FeedbackViewSet(viewsets.ModelViewSet):
 
 
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from django.utils.dateparse import parse_datetime
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def schedule_events_api(request):
     """
     API endpoint to get schedule events for calendar.
-    Returns contracts and interviews in FullCalendar format.
+    Returns contracts and interviews in FullCalendar format for the
+    requested start/end window (cached; supports ETag/304).
     """
-    user = request.user
-    
-    # Get date range from query parameters
-    start_date = request.GET.get('start')
-    end_date = request.GET.get('end')
-    
-    # Parse dates
-    start = parse_datetime(start_date) if start_date else None
-    end = parse_datetime(end_date) if end_date else None
-    
-    events = []
-    
-    # Get user's contracts (for workers)
-    if user.role == 'worker':
-        contracts = Contract.objects.filter(
-            worker=user,
-            status__in=['Finalized', 'In Progress', 'Awaiting Review', 'Completed']
-        ).select_related('job', 'client')
-        
-        # Filter by date range if provided
-        if start:
-            contracts = contracts.filter(end_date__gte=start.date())
-        if end:
-            contracts = contracts.filter(start_date__lte=end.date())
-        
-        # Convert to calendar events
-        for contract in contracts:
-            event_data = contract.get_calendar_event_data()
-            if event_data:
-                events.append(event_data)
-    
-    # Get interviews (for both workers and employers)
-    from .models import InterviewSchedule
-    
-    if user.profile.user_type == 'worker':
-        # Worker sees interviews where they are the applicant
-        interviews = InterviewSchedule.objects.filter(
-            application__worker=user,
-            status__in=['scheduled', 'rescheduled']
-        ).select_related('application__job', 'application__job__owner')
-    else:
-        # Employer sees interviews for their job postings
-        interviews = InterviewSchedule.objects.filter(
-            application__job__owner=user,
-            status__in=['scheduled', 'rescheduled']
-        ).select_related('application__worker', 'application__job')
-    
-    # Filter interviews by date range
-    if start:
-        interviews = interviews.filter(scheduled_datetime__gte=start)
-    if end:
-        interviews = interviews.filter(scheduled_datetime__lte=end)
-    
-    # Convert interviews to calendar events
-    for interview in interviews:
-        # Determine the other party's name
-        if user.profile.user_type == 'worker':
-            other_party = interview.application.job.owner.get_full_name() or interview.application.job.owner.username
-            title_prefix = "Interview with"
-        else:
-            other_party = interview.application.worker.get_full_name() or interview.application.worker.username
-            title_prefix = "Interview:"
-        
-        # Determine URL based on interview type and timing
-        from django.utils import timezone
-        now = timezone.now()
-        time_until_interview = (interview.scheduled_datetime - now).total_seconds() / 60  # minutes
-        
-        # For video interviews, link directly to join if within 5 minutes
-        if interview.interview_type == 'video' and -5 <= time_until_interview <= interview.duration_minutes:
-            event_url = f'/interview/{interview.id}/join/'
-        else:
-            event_url = f'/job_application/{interview.application.id}/'
-        
-        # Create event data
-        event = {
-            'id': f'interview_{interview.id}',
-            'title': f'{title_prefix} {other_party}',
-            'start': interview.scheduled_datetime.isoformat(),
-            'end': (interview.scheduled_datetime + timedelta(minutes=interview.duration_minutes)).isoformat(),
-            'backgroundColor': '#3b82f6' if interview.interview_type == 'video' else '#8b5cf6' if interview.interview_type == 'phone' else '#f59e0b',
-            'borderColor': '#2563eb' if interview.interview_type == 'video' else '#7c3aed' if interview.interview_type == 'phone' else '#d97706',
-            'url': event_url,
-            'extendedProps': {
-                'type': 'interview',
-                'interview_type': interview.get_interview_type_display(),
-                'interview_id': interview.id,
-                'video_room_url': interview.video_room_url if interview.interview_type == 'video' else None,
-                'job_title': interview.application.job.title,
-                'status': interview.get_status_display(),
-                'can_join': -5 <= time_until_interview <= interview.duration_minutes
-            }
-        }
-        events.append(event)
-    
-    return Response(events)
+    from .calendar_events import calendar_response
+    return calendar_response(request, 'schedule')
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def map_clusters_api(request):
+    """
+    Clustered job/service markers for the map.
+
+    GET /api/map/clusters?bbox=west,south,east,north&zoom=12[&type=job|service][&category=<id>]
+    Returns a GeoJSON FeatureCollection; each feature carries count/jobs/services
+    and, for a single point, its kind and id.
+    """
+    from .map_clusters import BBoxError, get_clusters, parse_bbox
+
+    try:
+        bbox = parse_bbox(request.GET.get('bbox'))
+        zoom = int(request.GET.get('zoom', ''))
+        category_id = int(request.GET['category']) if request.GET.get('category') else None
+        data = get_clusters(bbox, zoom, request.GET.get('type', 'all'), category_id)
+    except (BBoxError, ValueError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    response = Response(data)
+    response['Cache-Control'] = 'public, max-age=60'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def available_workers_api(request):
+    """
+    Workers near one of the client's jobs who are free for a proposed schedule.
+
+    GET /api/jobs/workers/available/?job=<id>
+        &start_date=YYYY-MM-DD[&end_date=YYYY-MM-DD]&start_time=HH:MM&end_time=HH:MM
+        [&weekdays=tue,thu][&radius_km=10][&skills=plumbing,tiling][&verified=1]
+        [&min_free_ratio=1.0][&limit=20]
+    Returns {'candidates', 'count', 'results'}, best match first; distances
+    are rounded up to whole kilometres.
+    """
+    from .worker_search import WorkerSearchError, parse_search, search_available_workers
+
+    if request.user.role != 'client':
+        return Response(
+            {'error': 'Only clients can search for available workers'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    try:
+        search = parse_search(request.GET, request.user)
+    except WorkerSearchError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(search_available_workers(search))
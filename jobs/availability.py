@@ -0,0 +1,238 @@
+"""
+Weekly availability bitmaps for WorkerAvailability.
+
+A worker's available slots are compiled into a 7 x 1440 boolean array
+(weekday x minute of day). Packed, that is 1260 bytes per worker; it is
+cached per worker and dropped whenever one of their WorkerAvailability
+rows changes (see jobs.signals).
+
+Checking a proposed schedule is then array work: the time window is a
+column slice, `all()` over it gives a per-weekday verdict, and indexing
+that with the weekday of every day in the date range gives a per-day
+verdict. Existing contracts come from one conflict-engine query
+(jobs.schedule_conflicts) and are painted onto the same day axis.
+evaluate_workers does this for many workers at once.
+"""
+from datetime import timedelta
+from django.core.cache import cache
+
+import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+DAYS_PER_WEEK = 7
+
+AVAILABILITY_CACHE_KEY = 'availability:week:{worker_id}'
+AVAILABILITY_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def minute_of_day(value):
+    return value.hour * 60 + value.minute
+
+
+def window_minutes(start_time, end_time):
+    """
+    Boolean mask of the minutes a daily [start_time, end_time) window covers.
+    An end of 00:00 means midnight; a window ending before it starts wraps
+    around the day.
+    """
+    start, end = minute_of_day(start_time), minute_of_day(end_time)
+    mask = np.zeros(MINUTES_PER_DAY, dtype=bool)
+    if end == 0:
+        end = MINUTES_PER_DAY
+    if start < end:
+        mask[start:end] = True
+    else:
+        mask[start:] = True
+        mask[:end] = True
+    return mask
+
+
+def format_minute(minute):
+    hour, minute = divmod(minute % MINUTES_PER_DAY, 60)
+    suffix = 'AM' if hour < 12 else 'PM'
+    return f"{(hour % 12) or 12:02d}:{minute:02d} {suffix}"
+
+
+class WeeklyAvailability:
+    """A worker's availability as a (7, 1440) boolean array."""
+
+    def __init__(self, bits=None):
+        if bits is None:
+            bits = np.zeros((DAYS_PER_WEEK, MINUTES_PER_DAY), dtype=bool)
+        self.bits = bits
+
+    @classmethod
+    def from_slots(cls, slots):
+        """Build from (day_of_week, start_time, end_time) tuples; overlapping slots merge."""
+        week = cls()
+        for day_of_week, start_time, end_time in slots:
+            week.bits[day_of_week] |= window_minutes(start_time, end_time)
+        return week
+
+    @classmethod
+    def from_bytes(cls, data):
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        return cls(bits[:DAYS_PER_WEEK * MINUTES_PER_DAY].astype(bool).reshape(DAYS_PER_WEEK, MINUTES_PER_DAY))
+
+    def to_bytes(self):
+        return np.packbits(self.bits).tobytes()
+
+    @property
+    def available_days(self):
+        """(7,) bool: weekdays with any availability at all."""
+        return self.bits.any(axis=1)
+
+    def covers(self, start_time, end_time):
+        """(7,) bool: weekdays on which the whole daily window is available."""
+        mask = window_minutes(start_time, end_time)
+        return self.bits[:, mask].all(axis=1)
+
+    def intervals(self, day_of_week):
+        """[(start_minute, end_minute), ...] of the available runs on a weekday."""
+        padded = np.concatenate(([False], self.bits[day_of_week], [False]))
+        edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+        return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+    def describe(self, day_of_week):
+        return ", ".join(f"{format_minute(s)}-{format_minute(e)}" for s, e in self.intervals(day_of_week))
+
+
+def compile_availability(worker_ids):
+    """{worker_id: WeeklyAvailability} straight from the database, one query."""
+    from .models import WorkerAvailability
+
+    slots = {worker_id: [] for worker_id in worker_ids}
+    rows = WorkerAvailability.objects.filter(
+        worker_id__in=worker_ids, is_available=True
+    ).values_list('worker_id', 'day_of_week', 'start_time', 'end_time')
+    for worker_id, day_of_week, start_time, end_time in rows:
+        slots[worker_id].append((day_of_week, start_time, end_time))
+    return {worker_id: WeeklyAvailability.from_slots(s) for worker_id, s in slots.items()}
+
+
+def get_weekly_availabilities(worker_ids):
+    """{worker_id: WeeklyAvailability}, from the cache where possible."""
+    worker_ids = list(worker_ids)
+    keys = {AVAILABILITY_CACHE_KEY.format(worker_id=worker_id): worker_id for worker_id in worker_ids}
+    cached = cache.get_many(list(keys))
+    weeks = {keys[key]: WeeklyAvailability.from_bytes(data) for key, data in cached.items()}
+
+    missing = [worker_id for worker_id in worker_ids if worker_id not in weeks]
+    if missing:
+        compiled = compile_availability(missing)
+        cache.set_many({
+            AVAILABILITY_CACHE_KEY.format(worker_id=worker_id): week.to_bytes()
+            for worker_id, week in compiled.items()
+        }, timeout=AVAILABILITY_CACHE_TIMEOUT)
+        weeks.update(compiled)
+    return weeks
+
+
+def get_weekly_availability(worker_id):
+    return get_weekly_availabilities([worker_id])[worker_id]
+
+
+def invalidate_availability(worker_id):
+    cache.delete(AVAILABILITY_CACHE_KEY.format(worker_id=worker_id))
+
+
+def schedule_weekdays(start_date, end_date):
+    """(n_days,) weekday index of every day in the inclusive range."""
+    days = (end_date - start_date).days + 1
+    return (start_date.weekday() + np.arange(max(days, 0))) % DAYS_PER_WEEK
+
+
+def booked_days(conflicts, start_date, days):
+    """(n_days,) bool: days of the range on which any of the conflicts falls."""
+    booked = np.zeros(days, dtype=bool)
+    for conflict in conflicts:
+        first = (conflict.overlap_start - start_date).days
+        last = (conflict.overlap_end - start_date).days
+        if last >= 0:
+            booked[max(first, 0):last + 1] = True
+    return booked
+
+
+def evaluate_workers(worker_ids, start_date, end_date, start_time, end_time, weekdays=None):
+    """
+    Check a proposed schedule for many workers in one pass.
+
+    `weekdays` optionally limits the schedule to those days of the week
+    (0=Monday), e.g. "Tuesdays" for a recurring booking. Returns
+    {worker_id: {'requested': n, 'free': n, 'booked': n, 'unavailable': n,
+    'free_ratio': float}} with per-day counts over the requested days.
+    """
+    from .schedule_conflicts import find_conflicts
+
+    worker_ids = list(worker_ids)
+    day_weekdays = schedule_weekdays(start_date, end_date)
+    requested = np.ones(len(day_weekdays), dtype=bool)
+    if weekdays is not None:
+        requested = np.isin(day_weekdays, list(weekdays))
+    if not worker_ids:
+        return {}
+
+    weeks = get_weekly_availabilities(worker_ids)
+    mask = window_minutes(start_time, end_time)
+    covers = np.stack([weeks[worker_id].bits[:, mask].all(axis=1) for worker_id in worker_ids])
+    available = covers[:, day_weekdays]  # (n_workers, n_days)
+
+    conflicts = find_conflicts(worker_ids, start_date, end_date, start_time, end_time)
+    booked = np.zeros_like(available)
+    for row, worker_id in enumerate(worker_ids):
+        if worker_id in conflicts:
+            booked[row] = booked_days(conflicts[worker_id], start_date, len(day_weekdays))
+
+    booked &= requested
+    unavailable = ~available & requested & ~booked
+    free = available & requested & ~booked
+    total = int(requested.sum())
+
+    results = {}
+    for row, worker_id in enumerate(worker_ids):
+        free_days = int(free[row].sum())
+        results[worker_id] = {
+            'requested': total,
+            'free': free_days,
+            'booked': int(booked[row].sum()),
+            'unavailable': int(unavailable[row].sum()),
+            'free_ratio': free_days / total if total else 0.0,
+        }
+    return results
+
+
+def check_schedule(worker_id, start_date, end_date, start_time, end_time, exclude_contract_id=None):
+    """
+    Per-day problems with a proposed schedule for one worker: contract
+    clashes first, then days or hours outside the worker's availability.
+    Returns [{'date', 'reason', ...}, ...] in date order.
+    """
+    from .schedule_conflicts import worker_conflicts
+
+    week = get_weekly_availability(worker_id)
+    conflicts = worker_conflicts(worker_id, start_date, end_date, start_time, end_time, exclude_contract_id)
+
+    day_weekdays = schedule_weekdays(start_date, end_date)
+    booked = booked_days(conflicts, start_date, len(day_weekdays))
+    has_day = week.available_days[day_weekdays]
+    covered = week.covers(start_time, end_time)[day_weekdays]
+
+    window = f"{start_time.strftime('%I:%M %p')}-{end_time.strftime('%I:%M %p')}"
+    problems = []
+    for offset in np.flatnonzero(booked | ~covered).tolist():
+        day = start_date + timedelta(days=offset)
+        if booked[offset]:
+            clash = next(c for c in conflicts if c.covers(day))
+            problems.append({
+                'date': day,
+                'reason': f'Time conflict with "{clash.job_title}" ({clash.times})',
+                'contract_id': clash.contract_id,
+            })
+        elif not has_day[offset]:
+            problems.append({'date': day, 'reason': 'Worker not available on this day of week'})
+        else:
+            problems.append({
+                'date': day,
+                'reason': f'Time {window} not in available slots: {week.describe(int(day_weekdays[offset]))}',
+            })
+    return problems
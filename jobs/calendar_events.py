@@ -0,0 +1,339 @@
+"""
+Calendar events for the schedule views (FullCalendar JSON).
+
+A window is the date range a calendar view asks for. Contracts are
+expanded into one event per working day, clipped to the window, so a
+long contract costs only the days on screen. Interviews are one event each.
+
+Serialized windows are cached per user under a schedule version that the
+Contract and InterviewSchedule signals bump (jobs.signals), so an
+unchanged window is served without touching the database. The only
+time-dependent part is whether a video interview can be joined yet. The
+join windows are cached separately from the events, and the ETag is built
+from the version plus the interviews joinable right now. A revalidation
+therefore needs only the join windows: at most one small interview query,
+and no events are built or loaded for a 304. can_join is applied to the
+events on the way out.
+
+Job titles and user names are copied into the cached events, but editing
+them does not bump the version. Such edits show up once the cached window
+expires (WINDOW_CACHE_TIMEOUT) or the next contract/interview change.
+"""
+from datetime import datetime, time, timedelta
+import hashlib
+import time as time_module
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_date, parse_datetime
+
+SCHEDULE_VERSION_KEY = 'calendar:version:{user_id}'
+WINDOW_CACHE_KEY = 'calendar:window:{user_id}:{version}:{scope}:{start}:{end}'
+JOINS_CACHE_KEY = 'calendar:joins:{user_id}:{version}:{start}:{end}'
+WINDOW_CACHE_TIMEOUT = 60 * 60
+
+# Widest window served; FullCalendar's month grid is 42 days
+MAX_WINDOW_DAYS = 100
+
+CONTRACT_STATUSES = ('Finalized', 'In Progress', 'Awaiting Review', 'Completed')
+INTERVIEW_STATUSES = ('scheduled', 'rescheduled')
+
+# Scopes: 'contracts' is the worker calendar (daily contract events only);
+# 'schedule' is the dashboard calendar (the worker's contracts plus interviews)
+SCOPES = ('contracts', 'schedule')
+
+# Video interviews can be joined from this many minutes before the start
+JOIN_EARLY_MINUTES = 5
+
+DEFAULT_START_TIME = time(9, 0)
+DEFAULT_END_TIME = time(17, 0)
+
+CONTRACT_COLORS = (
+    '#3b82f6',  # Blue
+    '#10b981',  # Green
+    '#f59e0b',  # Orange
+    '#8b5cf6',  # Purple
+    '#ef4444',  # Red
+    '#06b6d4',  # Cyan
+    '#ec4899',  # Pink
+    '#f97316',  # Orange-red
+    '#14b8a6',  # Teal
+    '#a855f7',  # Purple-pink
+    '#84cc16',  # Lime
+    '#f43f5e',  # Rose
+    '#6366f1',  # Indigo
+    '#eab308',  # Yellow
+    '#22c55e',  # Green-lime
+)
+
+INTERVIEW_COLORS = {
+    # interview_type: (background, border)
+    'video': ('#3b82f6', '#2563eb'),
+    'phone': ('#8b5cf6', '#7c3aed'),
+    'in_person': ('#f59e0b', '#d97706'),
+}
+
+
+class CalendarWindowError(ValueError):
+    """Raised for a malformed start/end."""
+
+
+def get_schedule_version(user_id):
+    key = SCHEDULE_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        # Start from the clock so an evicted counter never revives old windows
+        cache.add(key, int(time_module.time() * 1000), timeout=None)
+        version = cache.get(key) or 0
+    return version
+
+
+def bump_schedule_version(*user_ids):
+    """Invalidate every cached calendar window of these users."""
+    for user_id in {user_id for user_id in user_ids if user_id}:
+        key = SCHEDULE_VERSION_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, int(time_module.time() * 1000), timeout=None)
+
+
+def _parse_day(value):
+    """A date from FullCalendar's 'YYYY-MM-DD' or ISO datetime (with offset or 'Z')."""
+    day = parse_date(value)
+    if day:
+        return day
+    moment = parse_datetime(value.replace('Z', '+00:00'))
+    if moment is None:
+        raise CalendarWindowError(f"Invalid date '{value}'")
+    return moment.date()
+
+
+def parse_window(start=None, end=None, max_days=MAX_WINDOW_DAYS):
+    """
+    (start_date, end_date) inclusive from FullCalendar's start/end params,
+    defaulting to the current month and capped at max_days.
+    """
+    try:
+        if start and end:
+            start_date, end_date = _parse_day(start), _parse_day(end)
+        else:
+            today = timezone.localdate()
+            start_date = today.replace(day=1)
+            end_date = (start_date + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    except ValueError as e:
+        raise CalendarWindowError(str(e))
+    if end_date < start_date:
+        raise CalendarWindowError("end is before start")
+    return start_date, min(end_date, start_date + timedelta(days=max_days - 1))
+
+
+def window_contracts(worker_id, start_date, end_date, statuses=CONTRACT_STATUSES):
+    """A worker's contracts overlapping the inclusive window, oldest first."""
+    from .models import Contract
+
+    return Contract.objects.filter(
+        worker_id=worker_id,
+        status__in=statuses,
+        start_date__lte=end_date,
+    ).filter(
+        Q(end_date__gte=start_date) | Q(end_date__isnull=True)
+    ).select_related('job', 'client').order_by('start_date', 'start_time')
+
+
+def contract_color(contract):
+    """Same job, same color."""
+    return CONTRACT_COLORS[contract.job_id % len(CONTRACT_COLORS)]
+
+
+def contract_day_events(contract, start_date=None, end_date=None):
+    """
+    One event per working day of the contract, showing the daily hours,
+    for the days inside the optional window. Contracts without both dates
+    have no events.
+    """
+    if not contract.start_date or not contract.end_date:
+        return []
+
+    first = max(contract.start_date, start_date) if start_date else contract.start_date
+    last = min(contract.end_date, end_date) if end_date else contract.end_date
+    start_time = contract.start_time or DEFAULT_START_TIME
+    end_time = contract.end_time or DEFAULT_END_TIME
+    color = contract_color(contract)
+    # Shared by every day of the contract
+    props = {
+        'contractId': contract.pk,
+        'status': contract.status,
+        'client': contract.client.get_full_name() or contract.client.username,
+        'rate': str(contract.agreed_rate) if contract.agreed_rate else 'N/A',
+        'description': contract.job_description[:100] if contract.job_description else '',
+        'workHours': f"{start_time.strftime('%I:%M %p')} - {end_time.strftime('%I:%M %p')}",
+    }
+    title = contract.job_title or contract.job.title
+    starts, ends = start_time.strftime('%H:%M:%S'), end_time.strftime('%H:%M:%S')
+
+    events = []
+    for offset in range((last - first).days + 1):
+        day = first + timedelta(days=offset)
+        events.append({
+            'id': f"{contract.pk}_{day.strftime('%Y%m%d')}",
+            'title': title,
+            'start': f"{day}T{starts}",
+            'end': f"{day}T{ends}",
+            'backgroundColor': color,
+            'borderColor': color,
+            'textColor': '#ffffff',
+            'extendedProps': props,
+        })
+    return events
+
+
+def interview_event(interview, user):
+    """FullCalendar event for an interview as seen by `user` (the applicant or the employer)."""
+    application = interview.application
+    if application.worker_id == user.pk:
+        other = application.job.owner
+        title_prefix = "Interview with"
+    else:
+        other = application.worker
+        title_prefix = "Interview:"
+    background, border = INTERVIEW_COLORS.get(interview.interview_type, INTERVIEW_COLORS['in_person'])
+    start = interview.scheduled_datetime
+    end = start + timedelta(minutes=interview.duration_minutes)
+
+    event = {
+        'id': f'interview_{interview.id}',
+        'title': f'{title_prefix} {other.get_full_name() or other.username}',
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'backgroundColor': background,
+        'borderColor': border,
+        'url': f'/job_application/{application.id}/',
+        'extendedProps': {
+            'type': 'interview',
+            'interview_type': interview.get_interview_type_display(),
+            'interview_id': interview.id,
+            'video_room_url': interview.video_room_url if interview.interview_type == 'video' else None,
+            'job_title': application.job.title,
+            'status': interview.get_status_display(),
+            'can_join': False,
+        }
+    }
+    return event
+
+
+def _window_interviews(user, start_date, end_date):
+    """The user's interviews (as applicant or employer) inside the inclusive window."""
+    from .models import InterviewSchedule
+
+    tz = timezone.get_current_timezone()
+    return InterviewSchedule.objects.filter(
+        Q(application__worker=user) | Q(application__job__owner=user),
+        status__in=INTERVIEW_STATUSES,
+        scheduled_datetime__gte=timezone.make_aware(datetime.combine(start_date, time.min), tz),
+        scheduled_datetime__lt=timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz),
+    )
+
+
+def build_events(user, start_date, end_date, scope):
+    """Events for one window, straight from the database."""
+    events = []
+    if scope == 'contracts' or user.role == 'worker':
+        for contract in window_contracts(user.pk, start_date, end_date):
+            events.extend(contract_day_events(contract, start_date, end_date))
+
+    if scope == 'schedule':
+        interviews = _window_interviews(user, start_date, end_date).select_related(
+            'application__worker', 'application__job__owner',
+        ).order_by('scheduled_datetime')
+        events.extend(interview_event(interview, user) for interview in interviews)
+    return events
+
+
+def build_joins(user, start_date, end_date):
+    """{event id: (join_from, join_until, join_url)} for the window's video interviews."""
+    rows = _window_interviews(user, start_date, end_date).filter(
+        interview_type='video',
+    ).values_list('id', 'scheduled_datetime', 'duration_minutes')
+    joins = {}
+    for interview_id, start, duration in rows:
+        join_from = start - timedelta(minutes=JOIN_EARLY_MINUTES)
+        join_until = start + timedelta(minutes=duration)
+        joins[f'interview_{interview_id}'] = (
+            join_from.timestamp(), join_until.timestamp(), f'/interview/{interview_id}/join/',
+        )
+    return joins
+
+
+def _cached(key, build):
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, timeout=WINDOW_CACHE_TIMEOUT)
+    return value
+
+
+def get_events(user, version, start_date, end_date, scope):
+    """The window's events, from the cache where possible."""
+    key = WINDOW_CACHE_KEY.format(
+        user_id=user.pk, version=version, scope=scope, start=start_date, end=end_date,
+    )
+    return _cached(key, lambda: build_events(user, start_date, end_date, scope))
+
+
+def get_joins(user, version, start_date, end_date, scope):
+    """The window's join windows, from the cache where possible; none for the contracts scope."""
+    if scope != 'schedule':
+        return {}
+    key = JOINS_CACHE_KEY.format(user_id=user.pk, version=version, start=start_date, end=end_date)
+    return _cached(key, lambda: build_joins(user, start_date, end_date))
+
+
+def calendar_response(request, scope):
+    """
+    The user's events for the requested window as a JSON response with an
+    ETag; 304 when the client's copy is still current.
+    """
+    try:
+        start_date, end_date = parse_window(request.GET.get('start'), request.GET.get('end'))
+    except CalendarWindowError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    user = request.user
+    version = get_schedule_version(user.pk)
+    joins = get_joins(user, version, start_date, end_date, scope)
+    now = timezone.now().timestamp()
+    joinable_now = sorted(
+        event_id for event_id, (join_from, join_until, _) in joins.items()
+        if join_from <= now <= join_until
+    )
+    etag = '"%s"' % hashlib.md5(
+        f"{user.pk}:{version}:{scope}:{start_date}:{end_date}:{joinable_now}".encode()
+    ).hexdigest()
+
+    # Decided before any events are built or read from the cache
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+
+    events = get_events(user, version, start_date, end_date, scope)
+    if joinable_now:
+        joinable_now = set(joinable_now)
+        events = [
+            {
+                **event,
+                'url': joins[event['id']][2],
+                'extendedProps': {**event['extendedProps'], 'can_join': True},
+            } if event['id'] in joinable_now else event
+            for event in events
+        ]
+
+    response = JsonResponse(events, safe=False)
+    response['ETag'] = etag
+    # Always revalidate; unchanged windows then cost a 304
+    response['Cache-Control'] = 'private, no-cache'
+    return response
@@ -0,0 +1,211 @@
+"""
+Per-user iCalendar (.ics) feeds of contracts and interviews.
+
+Calendar apps subscribe to /calendar/<token>.ics and poll it every few
+minutes, so the feed is built to be cheap when nothing changed:
+
+- the token resolves to a user through the cache (CalendarFeed on a miss)
+- the ETag is the user's schedule version from jobs.calendar_events, which
+  the Contract and InterviewSchedule signals bump once the change commits,
+  so an unchanged feed answers 304 without touching the database and a
+  poll mid-transaction can't cache old rows under the new version
+- a changed feed is streamed one VEVENT at a time straight off the query
+  and the chunks are cached under the new version for the next poll; links
+  in the body are absolute, so bodies and ETags are kept per host
+
+A contract with daily hours is a single VEVENT with a daily RRULE rather
+than one event per day; a contract without hours is an all-day event
+spanning its dates.
+"""
+from datetime import datetime, timedelta
+import hashlib
+import secrets
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from icalendar import Event, Timezone, vRecur
+
+from .calendar_events import CONTRACT_STATUSES, INTERVIEW_STATUSES
+from .schedule_conflicts import ONGOING_CONTRACT_DAYS, effective_end_date
+
+FEED_TOKEN_KEY = 'calendar:feed:token:{token}'
+# Bodies carry absolute links, so they are cached per host (site)
+FEED_BODY_KEY = 'calendar:feed:body:{user_id}:{version}:{site}'
+FEED_CACHE_TIMEOUT = 60 * 60 * 6
+
+# Past events kept in the feed
+FEED_PAST_DAYS = 90
+
+# Suggested poll interval for clients that honour REFRESH-INTERVAL
+FEED_REFRESH_MINUTES = 15
+
+# Bump when the feed format changes so cached bodies and ETags roll over
+FEED_FORMAT = 1
+
+PRODID = '-//Trabaholink//Schedule//EN'
+UID_DOMAIN = 'trabaholink'
+
+
+def generate_token():
+    return secrets.token_urlsafe(24)
+
+
+def get_feed_token(user):
+    """The user's feed token, created on first use."""
+    from .models import CalendarFeed
+
+    feed, _ = CalendarFeed.objects.get_or_create(user=user, defaults={'token': generate_token()})
+    return feed.token
+
+
+def rotate_feed_token(user):
+    """Replace the user's token; the old feed URL stops working once this commits."""
+    from .models import CalendarFeed
+
+    token = generate_token()
+    with transaction.atomic():
+        old = CalendarFeed.objects.select_for_update().filter(user=user).values_list('token', flat=True).first()
+        CalendarFeed.objects.update_or_create(user=user, defaults={'token': token})
+        if old:
+            # After the new row is visible, so a poll in between can't re-cache the old token
+            transaction.on_commit(lambda: cache.delete(FEED_TOKEN_KEY.format(token=old)))
+    return token
+
+
+def resolve_feed_token(token):
+    """User id for a feed token, or None."""
+    from .models import CalendarFeed
+
+    key = FEED_TOKEN_KEY.format(token=token)
+    user_id = cache.get(key)
+    if user_id is None:
+        user_id = CalendarFeed.objects.filter(token=token).values_list('user_id', flat=True).first()
+        if user_id is None:
+            return None
+        cache.set(key, user_id, timeout=FEED_CACHE_TIMEOUT)
+    return user_id
+
+
+def site_key(base_url):
+    return hashlib.md5(base_url.encode()).hexdigest()[:12]
+
+
+def feed_etag(user_id, version, base_url):
+    return f'"ics-{FEED_FORMAT}-{user_id}-{version}-{site_key(base_url)}"'
+
+
+def _name(user):
+    return user.get_full_name() or user.username
+
+
+def contract_vevent(contract, user_id, tz, base_url):
+    event = Event()
+    event.add('uid', f'contract-{contract.pk}@{UID_DOMAIN}')
+    event.add('dtstamp', contract.updated_at or timezone.now())
+    title = contract.job_title or contract.job.title
+    if user_id == contract.worker_id:
+        event.add('summary', title)
+        other = f"Client: {_name(contract.client)}"
+    else:
+        event.add('summary', f"{title} ({_name(contract.worker)})")
+        other = f"Worker: {_name(contract.worker)}"
+    rate = f"Rate: {contract.agreed_rate}" if contract.agreed_rate else None
+    event.add('description', '\n'.join(filter(None, [other, f"Status: {contract.status}", rate])))
+    event.add('url', f'{base_url}/contract/{contract.pk}/')
+    event.add('status', 'CONFIRMED')
+
+    last_day = effective_end_date(contract.start_date, contract.end_date)
+    if contract.start_time and contract.end_time and contract.start_time < contract.end_time:
+        event.add('dtstart', datetime.combine(contract.start_date, contract.start_time, tzinfo=tz))
+        event.add('dtend', datetime.combine(contract.start_date, contract.end_time, tzinfo=tz))
+        if last_day > contract.start_date:
+            until = datetime.combine(last_day, contract.end_time, tzinfo=tz).astimezone(ZoneInfo('UTC'))
+            event.add('rrule', vRecur(freq='DAILY', until=until))
+    else:
+        event.add('dtstart', contract.start_date)
+        event.add('dtend', last_day + timedelta(days=1))
+    return event
+
+
+def interview_vevent(interview, user_id, base_url):
+    application = interview.application
+    other = application.job.owner if application.worker_id == user_id else application.worker
+    event = Event()
+    event.add('uid', f'interview-{interview.pk}@{UID_DOMAIN}')
+    event.add('dtstamp', interview.updated_at)
+    event.add('summary', f"Interview: {application.job.title} with {_name(other)}")
+    event.add('dtstart', interview.scheduled_datetime)
+    event.add('dtend', interview.scheduled_datetime + timedelta(minutes=interview.duration_minutes))
+    event.add('description', interview.get_interview_type_display())
+    if interview.interview_type == 'video' and interview.video_room_url:
+        event.add('location', interview.video_room_url)
+    elif interview.interview_type == 'in_person' and interview.location_address:
+        event.add('location', interview.location_address)
+    elif interview.interview_type == 'phone' and interview.phone_number:
+        event.add('location', interview.phone_number)
+    event.add('url', f'{base_url}/job_application/{application.pk}/')
+    return event
+
+
+def feed_chunks(user_id, base_url):
+    """The feed body as an iterator of byte chunks, one per component; links are under base_url."""
+    from .models import Contract, InterviewSchedule
+
+    tz = ZoneInfo(settings.TIME_ZONE)
+    since = timezone.localdate() - timedelta(days=FEED_PAST_DAYS)
+
+    yield (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        f"PRODID:{PRODID}\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        "METHOD:PUBLISH\r\n"
+        "X-WR-CALNAME:Trabaholink\r\n"
+        f"X-WR-TIMEZONE:{settings.TIME_ZONE}\r\n"
+        f"REFRESH-INTERVAL;VALUE=DURATION:PT{FEED_REFRESH_MINUTES}M\r\n"
+        f"X-PUBLISHED-TTL:PT{FEED_REFRESH_MINUTES}M\r\n"
+    ).encode()
+    yield Timezone.from_tzid(settings.TIME_ZONE).to_ical()
+
+    contracts = Contract.objects.filter(
+        Q(worker_id=user_id) | Q(client_id=user_id),
+        status__in=CONTRACT_STATUSES,
+        start_date__isnull=False,
+    ).filter(
+        Q(end_date__gte=since) | Q(end_date__isnull=True, start_date__gte=since - timedelta(days=ONGOING_CONTRACT_DAYS))
+    ).select_related('job', 'worker', 'client').order_by('start_date')
+    for contract in contracts.iterator(chunk_size=200):
+        yield contract_vevent(contract, user_id, tz, base_url).to_ical()
+
+    interviews = InterviewSchedule.objects.filter(
+        Q(application__worker_id=user_id) | Q(application__job__owner_id=user_id),
+        status__in=INTERVIEW_STATUSES,
+        scheduled_datetime__gte=timezone.now() - timedelta(days=FEED_PAST_DAYS),
+    ).select_related('application__worker', 'application__job__owner').order_by('scheduled_datetime')
+    for interview in interviews.iterator(chunk_size=200):
+        yield interview_vevent(interview, user_id, base_url).to_ical()
+
+    yield b"END:VCALENDAR\r\n"
+
+
+def get_feed_body(user_id, version, base_url):
+    """
+    Iterator over the feed's bytes: the cached chunks for this schedule
+    version, or a live render that fills the cache once fully consumed.
+    """
+    key = FEED_BODY_KEY.format(user_id=user_id, version=version, site=site_key(base_url))
+    cached = cache.get(key)
+    if cached is not None:
+        return iter(cached)
+
+    def render():
+        chunks = []
+        for chunk in feed_chunks(user_id, base_url):
+            chunks.append(chunk)
+            yield chunk
+        cache.set(key, chunks, timeout=FEED_CACHE_TIMEOUT)
+    return render()
@@ -1,5 +1,6 @@
 from django import forms
 from .models import Job, JobApplication, Contract, ProgressLog, JobOffer, WorkerAvailability
+from .schedule_conflicts import worker_conflicts
 from django.forms.widgets import ClearableFileInput
 
 class MultipleFileInput(ClearableFileInput):
@@ -203,13 +204,17 @@ class ContractForm(forms.ModelForm):
             if self.instance and self.instance.worker:
                 worker = self.instance.worker
                 
-                # Check for schedule conflicts with existing contracts
-                conflicts = self.instance.check_time_conflict()
+                # Check for schedule conflicts with existing contracts, using
+                # the submitted schedule (the instance isn't updated until after clean)
+                conflicts = worker_conflicts(
+                    worker.pk, start_date, end_date, start_time, end_time,
+                    exclude_contract_id=self.instance.pk,
+                )
                 if conflicts:
                     conflict_details = []
                     for conflict in conflicts[:3]:  # Show first 3 conflicts
                         conflict_details.append(
-                            f"• {conflict['job_title']} ({conflict['dates']}, {conflict['times']})"
+                            f"• {conflict.job_title} ({conflict.dates}, {conflict.times})"
                         )
                     
                     error_msg = "Schedule conflict detected with existing contracts:\n" + "\n".join(conflict_details)
@@ -224,7 +229,8 @@ class ContractForm(forms.ModelForm):
                     start_date=start_date,
                     end_date=end_date,
                     start_time=start_time,
-                    end_time=end_time
+                    end_time=end_time,
+                    exclude_contract_id=self.instance.pk
                 )
                 
                 if not availability_check['available']:
@@ -346,13 +352,17 @@ class ContractDraftForm(forms.ModelForm):
             if self.instance and self.instance.worker:
                 worker = self.instance.worker
                 
-                # Check for schedule conflicts with existing contracts
-                conflicts = self.instance.check_time_conflict()
+                # Check for schedule conflicts with existing contracts, using
+                # the submitted schedule (the instance isn't updated until after clean)
+                conflicts = worker_conflicts(
+                    worker.pk, start_date, end_date, start_time, end_time,
+                    exclude_contract_id=self.instance.pk,
+                )
                 if conflicts:
                     conflict_details = []
                     for conflict in conflicts[:3]:  # Show first 3 conflicts
                         conflict_details.append(
-                            f"• {conflict['job_title']} ({conflict['dates']}, {conflict['times']})"
+                            f"• {conflict.job_title} ({conflict.dates}, {conflict.times})"
                         )
                     
                     error_msg = "⚠️ Schedule conflict with existing contracts:\n" + "\n".join(conflict_details)
@@ -367,7 +377,8 @@ class ContractDraftForm(forms.ModelForm):
                     start_date=start_date,
                     end_date=end_date,
                     start_time=start_time,
-                    end_time=end_time
+                    end_time=end_time,
+                    exclude_contract_id=self.instance.pk
                 )
                 
                 if not availability_check['available']:
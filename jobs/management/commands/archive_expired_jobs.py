@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from jobs.activity_summary import rebuild_summaries
 from jobs.models import Job
 
 
@@ -39,7 +40,9 @@ class Command(BaseCommand):
                 )
         else:
             # Archive the expired jobs
+            owner_ids = list(expired_jobs.order_by().values_list('owner_id', flat=True).distinct())
             expired_jobs.update(is_active=False)
+            rebuild_summaries(owner_ids)
             
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully archived {count} expired job posting(s).')
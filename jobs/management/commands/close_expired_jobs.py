@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from jobs.activity_summary import rebuild_summaries
 from jobs.models import Job
 
 
@@ -15,7 +16,9 @@ class Command(BaseCommand):
         
         count = expired_jobs.count()
         if count > 0:
+            owner_ids = list(expired_jobs.order_by().values_list('owner_id', flat=True).distinct())
             expired_jobs.update(is_active=False)
+            rebuild_summaries(owner_ids)
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully closed {count} expired job(s)')
             )
@@ -0,0 +1,38 @@
+"""
+Management command to recompute UserActivitySummary counters from the
+source tables and repair any that drifted
+"""
+from django.core.management.base import BaseCommand
+from jobs.activity_summary import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = 'Recompute per-user dashboard counters and fix rows that drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Only reconcile this user id (repeatable)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted summaries without writing them'
+        )
+
+    def handle(self, *args, **options):
+        changed = rebuild_summaries(options['user_ids'], dry_run=options['dry_run'])
+
+        if not changed:
+            self.stdout.write(self.style.SUCCESS('All activity summaries are up to date'))
+            return
+
+        verb = 'Would fix' if options['dry_run'] else 'Fixed'
+        self.stdout.write(
+            self.style.WARNING(f'{verb} {len(changed)} activity summary(ies)')
+        )
+        for user_id in sorted(changed)[:50]:
+            self.stdout.write(f'  - user #{user_id}')
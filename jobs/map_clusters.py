@@ -0,0 +1,198 @@
+"""
+Server-side clustering of active job and service markers for the map.
+
+Points are aggregated in SQL with ST_SnapToGrid on a grid aligned to
+fixed tiles (360 / 2**zoom degrees square). A request's bbox is split
+into those tiles and each (tile, zoom, filter) result is cached, so
+panning mostly hits the cache. Cached tiles are invalidated together by
+bumping MAP_VERSION_KEY whenever a job or service is created, deleted,
+moved or (de)activated (see jobs.signals and jobs.tasks_expiry).
+"""
+from django.core.cache import cache
+from django.db import connection
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+MAP_VERSION_KEY = 'map_clusters:version'
+TILE_CACHE_TIMEOUT = 600
+
+MIN_ZOOM = 0
+MAX_ZOOM = 20
+
+# Grid cells per tile edge; 4 cells on a 256px tile is ~64px per cluster
+CELLS_PER_TILE = 4
+
+# Refuse bboxes that would need more tiles than this
+MAX_TILES = 64
+
+KIND_FILTERS = ('all', 'job', 'service')
+
+CLUSTER_SQL = """
+WITH points AS (
+    {branches}
+)
+SELECT
+    ST_X(ST_Centroid(ST_Collect(geom))) AS lng,
+    ST_Y(ST_Centroid(ST_Collect(geom))) AS lat,
+    count(*) AS total,
+    count(*) FILTER (WHERE kind = 'job') AS jobs,
+    count(*) FILTER (WHERE kind = 'service') AS services,
+    CASE WHEN count(*) = 1 THEN min(kind) END AS single_kind,
+    CASE WHEN count(*) = 1 THEN min(id) END AS single_id
+FROM points
+GROUP BY ST_SnapToGrid(geom, %s)
+"""
+
+JOB_BRANCH = """
+    SELECT 'job' AS kind, id, location::geometry AS geom
+    FROM jobs_job
+    WHERE is_active
+      AND (expires_at IS NULL OR expires_at > now())
+      AND {bbox_filter}
+      {category}
+"""
+
+# Geography && uses the GiST index on jobs_job.location. Geography boxes
+# can't span a hemisphere, so the first few zoom levels (which cover most of
+# the world anyway) compare as geometry instead.
+JOB_BBOX_GEOGRAPHY = "location && ST_MakeEnvelope(%s, %s, %s, %s, 4326)::geography"
+JOB_BBOX_GEOMETRY = "location::geometry && ST_MakeEnvelope(%s, %s, %s, %s, 4326)"
+GEOGRAPHY_MIN_ZOOM = 3
+
+SERVICE_BRANCH = """
+    SELECT 'service' AS kind, id, location AS geom
+    FROM services_servicepost
+    WHERE is_active
+      AND location && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
+"""
+
+
+class BBoxError(ValueError):
+    """Raised for a malformed or oversized bbox/zoom."""
+
+
+def get_map_version():
+    version = cache.get(MAP_VERSION_KEY)
+    if version is None:
+        cache.add(MAP_VERSION_KEY, 1, timeout=None)
+        version = cache.get(MAP_VERSION_KEY) or 1
+    return version
+
+
+def bump_map_version():
+    """Invalidate every cached cluster tile."""
+    try:
+        cache.incr(MAP_VERSION_KEY)
+    except ValueError:
+        cache.set(MAP_VERSION_KEY, 1, timeout=None)
+
+
+def parse_bbox(value):
+    """'west,south,east,north' -> tuple of floats, clamped to the world."""
+    try:
+        west, south, east, north = (float(v) for v in value.split(','))
+    except (AttributeError, ValueError):
+        raise BBoxError("bbox must be 'west,south,east,north'")
+    west, east = max(west, -180.0), min(east, 180.0)
+    south, north = max(south, -90.0), min(north, 90.0)
+    if west >= east or south >= north:
+        raise BBoxError("bbox is empty")
+    return west, south, east, north
+
+
+def tiles_for_bbox(bbox, zoom):
+    """Indices (x, y) of the fixed tiles covering the bbox at this zoom."""
+    size = tile_size(zoom)
+    west, south, east, north = bbox
+    xs = range(math.floor((west + 180) / size), math.ceil((east + 180) / size))
+    ys = range(math.floor((south + 90) / size), math.ceil((north + 90) / size))
+    if len(xs) * len(ys) > MAX_TILES:
+        raise BBoxError("bbox too large for this zoom level")
+    return [(x, y) for x in xs for y in ys]
+
+
+def tile_size(zoom):
+    return 360.0 / (2 ** zoom)
+
+
+def tile_bounds(x, y, zoom):
+    size = tile_size(zoom)
+    west, south = x * size - 180, y * size - 90
+    return west, south, west + size, south + size
+
+
+def query_tile(x, y, zoom, kind='all', category_id=None):
+    """Cluster features for one tile straight from the database."""
+    west, south, east, north = tile_bounds(x, y, zoom)
+    # Keep points on the tile's east/north edge out of this tile
+    east_in, north_in = east - 1e-9, north - 1e-9
+
+    branches, params = [], []
+    if kind in ('all', 'job'):
+        category = 'AND category_id = %s' if category_id else ''
+        bbox_filter = JOB_BBOX_GEOGRAPHY if zoom >= GEOGRAPHY_MIN_ZOOM else JOB_BBOX_GEOMETRY
+        branches.append(JOB_BRANCH.format(bbox_filter=bbox_filter, category=category))
+        params += [west, south, east_in, north_in]
+        if category_id:
+            params.append(category_id)
+    # Job categories don't apply to service posts
+    if kind in ('all', 'service') and not category_id:
+        branches.append(SERVICE_BRANCH)
+        params += [west, south, east_in, north_in]
+    if not branches:
+        return []
+
+    sql = CLUSTER_SQL.format(branches='\n    UNION ALL\n'.join(branches))
+    params.append(tile_size(zoom) / CELLS_PER_TILE)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    features = []
+    for lng, lat, total, jobs, services, single_kind, single_id in rows:
+        properties = {'count': total, 'jobs': jobs, 'services': services}
+        if single_id is not None:
+            properties.update(kind=single_kind, id=single_id)
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [round(lng, 6), round(lat, 6)]},
+            'properties': properties,
+        })
+    return features
+
+
+def get_clusters(bbox, zoom, kind='all', category_id=None):
+    """
+    GeoJSON FeatureCollection of clusters covering `bbox` at `zoom`.
+
+    Tiles are read from the cache in one get_many and only missing tiles
+    are queried.
+    """
+    if not MIN_ZOOM <= zoom <= MAX_ZOOM:
+        raise BBoxError(f"zoom must be between {MIN_ZOOM} and {MAX_ZOOM}")
+    if kind not in KIND_FILTERS:
+        raise BBoxError(f"type must be one of {', '.join(KIND_FILTERS)}")
+
+    version = get_map_version()
+    tiles = tiles_for_bbox(bbox, zoom)
+    keys = {
+        tile: f'map_clusters:v{version}:{zoom}:{tile[0]}:{tile[1]}:{kind}:{category_id or ""}'
+        for tile in tiles
+    }
+    cached = cache.get_many(list(keys.values()))
+
+    features, missing = [], {}
+    for tile, key in keys.items():
+        if key in cached:
+            features.extend(cached[key])
+        else:
+            tile_features = query_tile(*tile, zoom, kind, category_id)
+            missing[key] = tile_features
+            features.extend(tile_features)
+    if missing:
+        cache.set_many(missing, timeout=TILE_CACHE_TIMEOUT)
+
+    return {'type': 'FeatureCollection', 'features': features}
@@ -0,0 +1,73 @@
+# Full-text search column, trigger and indexes for Job
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+SEARCH_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION jobs_job_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', concat_ws(' ', NEW.title, NEW.title_en)), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.title_tl, '')), 'A') ||
+        setweight(to_tsvector('english', concat_ws(' ',
+            NEW.tasks, NEW.tasks_en, NEW.required_skills, NEW.required_skills_en)), 'B') ||
+        setweight(to_tsvector('simple', concat_ws(' ', NEW.tasks_tl, NEW.required_skills_tl)), 'B') ||
+        setweight(to_tsvector('english', concat_ws(' ', NEW.description, NEW.description_en)), 'C') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description_tl, '')), 'C') ||
+        setweight(to_tsvector('simple', concat_ws(' ',
+            NEW.municipality, NEW.barangay, NEW.subdivision, NEW.street,
+            (SELECT name FROM jobs_jobcategory WHERE id = NEW.category_id),
+            (SELECT concat_ws(' ', first_name, last_name) FROM users_customuser WHERE id = NEW.owner_id)
+        )), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_job_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF
+        title, title_en, title_tl, description, description_en, description_tl,
+        tasks, tasks_en, tasks_tl, required_skills, required_skills_en, required_skills_tl,
+        municipality, barangay, subdivision, street, category_id, owner_id
+    ON jobs_job
+    FOR EACH ROW EXECUTE FUNCTION jobs_job_search_vector_update();
+
+-- Backfill existing rows through the trigger
+UPDATE jobs_job SET title = title;
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS jobs_job_search_vector_trigger ON jobs_job;
+DROP FUNCTION IF EXISTS jobs_job_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0026_merge_20260119_0700'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(SEARCH_TRIGGER_SQL, DROP_SEARCH_TRIGGER_SQL),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='jobs_job_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['municipality'], name='jobs_job_municipality_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['barangay'], name='jobs_job_barangay_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Guarantee GiST indexes for the radius (ST_DWithin) queries.
+#
+# jobs_job.location is a geography column, so a plain GiST index serves
+# ST_DWithin directly. services_servicepost.location and
+# users_notificationpreference.notification_location are geometry (SRID
+# 4326) and are queried as `column::geography`; they need an expression
+# index on that cast for the planner to use it.
+#
+# The services and notification preference tables are not created by
+# migrations in this repository, so each statement is guarded on the table
+# existing and skips creation when an equivalent index is already there.
+
+from django.db import migrations
+
+
+def _ensure_gist_sql(table, index_name, expression, match):
+    return f"""
+DO $$
+BEGIN
+    IF to_regclass('{table}') IS NOT NULL AND NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE tablename = '{table}' AND indexdef ILIKE '%USING gist ({match})%'
+    ) THEN
+        CREATE INDEX {index_name} ON {table} USING GIST ({expression});
+    END IF;
+END
+$$;
+"""
+
+
+CREATE_SQL = [
+    _ensure_gist_sql('jobs_job', 'jobs_job_location_gist', 'location', 'location'),
+    _ensure_gist_sql(
+        'services_servicepost', 'services_servicepost_location_geog_gist',
+        '(location::geography)', '((location)::geography)',
+    ),
+    _ensure_gist_sql(
+        'users_notificationpreference', 'users_notifpref_location_geog_gist',
+        '(notification_location::geography)', '((notification_location)::geography)',
+    ),
+]
+
+DROP_SQL = [
+    "DROP INDEX IF EXISTS jobs_job_location_gist;",
+    "DROP INDEX IF EXISTS services_servicepost_location_geog_gist;",
+    "DROP INDEX IF EXISTS users_notifpref_location_geog_gist;",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0027_job_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
@@ -0,0 +1,47 @@
+# Denormalized per-user dashboard counters
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0029_workerrecommendation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivitySummary',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='activity_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('jobs_total', models.IntegerField(default=0)),
+                ('jobs_active', models.IntegerField(default=0)),
+                ('applications_received_total', models.IntegerField(default=0)),
+                ('applications_received_pending', models.IntegerField(default=0)),
+                ('applications_received_rejected', models.IntegerField(default=0)),
+                ('applications_sent_total', models.IntegerField(default=0)),
+                ('applications_sent_pending', models.IntegerField(default=0)),
+                ('applications_sent_rejected', models.IntegerField(default=0)),
+                ('applications_sent_archived', models.IntegerField(default=0)),
+                ('client_contracts_open', models.IntegerField(default=0)),
+                ('client_contracts_in_progress', models.IntegerField(default=0)),
+                ('client_contracts_completed', models.IntegerField(default=0)),
+                ('client_contracts_cancelled', models.IntegerField(default=0)),
+                ('worker_contracts_open', models.IntegerField(default=0)),
+                ('worker_contracts_in_progress', models.IntegerField(default=0)),
+                ('worker_contracts_completed', models.IntegerField(default=0)),
+                ('worker_contracts_cancelled', models.IntegerField(default=0)),
+                ('offers_sent_total', models.IntegerField(default=0)),
+                ('offers_sent_pending', models.IntegerField(default=0)),
+                ('offers_received_total', models.IntegerField(default=0)),
+                ('offers_received_pending', models.IntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'User activity summaries',
+            },
+        ),
+    ]
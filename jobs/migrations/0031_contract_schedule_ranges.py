@@ -0,0 +1,58 @@
+# Generated range columns on jobs_contract for the schedule conflict engine
+# (jobs.schedule_conflicts).
+#
+# schedule_dates covers [start_date, end_date]; a contract without an end
+# date is treated as ongoing for 30 days (ONGOING_CONTRACT_DAYS). PostgreSQL
+# has no built-in time range type, so `timerange` is created here;
+# schedule_times is NULL for contracts without daily hours or with hours
+# that wrap past midnight, which the engine treats as all day.
+#
+# The columns are maintained by PostgreSQL and are not model fields. The
+# partial GiST index needs btree_gist for the worker_id column, and its
+# status list must match ACTIVE_CONTRACT_STATUSES.
+
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations
+
+
+CREATE_SQL = """
+DO $$
+BEGIN
+    CREATE TYPE timerange AS RANGE (subtype = time);
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END
+$$;
+
+ALTER TABLE jobs_contract
+    ADD COLUMN schedule_dates daterange GENERATED ALWAYS AS (
+        CASE WHEN start_date IS NOT NULL THEN
+            daterange(start_date, GREATEST(COALESCE(end_date, start_date + 30), start_date), '[]')
+        END
+    ) STORED,
+    ADD COLUMN schedule_times timerange GENERATED ALWAYS AS (
+        CASE WHEN start_time < end_time THEN timerange(start_time, end_time) END
+    ) STORED;
+
+CREATE INDEX jobs_contract_schedule_gist ON jobs_contract
+    USING GIST (worker_id, schedule_dates)
+    WHERE status IN ('Finalized', 'In Progress', 'Awaiting Review');
+"""
+
+DROP_SQL = """
+DROP INDEX IF EXISTS jobs_contract_schedule_gist;
+ALTER TABLE jobs_contract DROP COLUMN IF EXISTS schedule_times, DROP COLUMN IF EXISTS schedule_dates;
+DROP TYPE IF EXISTS timerange;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0030_useractivitysummary'),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.RunSQL(CREATE_SQL, DROP_SQL),
+    ]
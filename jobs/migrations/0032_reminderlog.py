@@ -0,0 +1,43 @@
+# Sent-reminder log for jobs.reminders, plus the date indexes it selects on
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0031_contract_schedule_ranges'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=30)),
+                ('date', models.DateField()),
+                ('sent_at', models.DateTimeField(auto_now_add=True)),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reminder_logs', to='jobs.contract')),
+                ('interview', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reminder_logs', to='jobs.interviewschedule')),
+            ],
+            options={
+                'constraints': [
+                    models.UniqueConstraint(condition=models.Q(('contract__isnull', False)), fields=('contract', 'kind', 'date'), name='jobs_reminder_contract_uniq'),
+                    models.UniqueConstraint(condition=models.Q(('interview__isnull', False)), fields=('interview', 'kind', 'date'), name='jobs_reminder_interview_uniq'),
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['start_date'], name='jobs_contract_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['end_date'], name='jobs_contract_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewschedule',
+            index=models.Index(fields=['scheduled_datetime'], name='jobs_interview_when_idx'),
+        ),
+    ]
@@ -1,12 +1,13 @@
-from django.db import models
+from django.db import models, router, transaction
 from django.contrib.auth import get_user_model
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.conf import settings
 from django.contrib.gis.db import models as gis_models
-from better_profanity import profanity
-from admin_dashboard.utils import load_banned_words
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from admin_dashboard.moderation_utils import censor_text
 from django.urls import reverse
 from django.utils import timezone
 from simple_history.models import HistoricalRecords
@@ -18,6 +19,25 @@ from .validators import validate_video_file
 
 CustomUser = get_user_model()
 
+
+class ActivityCountedModel(models.Model):
+    """
+    Base for models counted in UserActivitySummary (jobs.activity_summary).
+
+    save() runs in a transaction so the row change and the counter deltas
+    its signals apply commit or roll back together. Deletes already run in
+    the deletion collector's transaction.
+    """
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+
 class GeneralCategory(models.Model):
     """
     Broad job categories for notification filtering
@@ -75,7 +95,7 @@ class JobCategory(models.Model):
         # Final fallback to base name field
         return self.name if self.name else "Unnamed Category"
 
-class Job(models.Model):
+class Job(ActivityCountedModel):
     owner = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="posted_jobs")
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True, default="")
@@ -137,8 +157,18 @@ class Job(models.Model):
         default=0,
         help_text="Number of unique reports received for this job posting"
     )
+
+    # Full-text search document, maintained by a database trigger (see jobs.search)
+    search_vector = SearchVectorField(null=True, editable=False)
     
-    history = HistoricalRecords()
+    history = HistoricalRecords(excluded_fields=['search_vector'])
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_vector'], name='jobs_job_search_gin'),
+            GinIndex(fields=['municipality'], name='jobs_job_municipality_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['barangay'], name='jobs_job_barangay_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.owner.username}"
@@ -224,11 +254,16 @@ class Job(models.Model):
     def deactivate_expired_jobs(cls):
         """Deactivate all expired jobs"""
         from django.utils import timezone
+        from .activity_summary import rebuild_summaries
         expired_jobs = cls.objects.filter(
             is_active=True,
             expires_at__lte=timezone.now()
         )
+        owner_ids = list(expired_jobs.order_by().values_list('owner_id', flat=True).distinct())
         count = expired_jobs.update(is_active=False)
+        if count:
+            # Bulk update skips the signals that maintain jobs_active
+            rebuild_summaries(owner_ids)
         return count
 
     def save(self, *args, **kwargs):
@@ -251,16 +286,8 @@ class Job(models.Model):
             except Job.DoesNotExist:
                 pass
         
-        # Load banned words
-        banned_words = load_banned_words()
-
-        # Censor single words using better-profanity
-        profanity.load_censor_words([word for word in banned_words if ' ' not in word])
-        self.description = profanity.censor(self.description)
-
-        for phrase in banned_words:
-            if ' ' in phrase:  
-                self.description = self.description.replace(phrase, '*' * len(phrase))
+        # Censor moderated words and phrases
+        self.description = censor_text(self.description)
         
         # Set expires_at based on posting_duration_days if not already set
         if not self.expires_at and self.posting_duration_days:
@@ -276,7 +303,7 @@ class JobImage(models.Model):
     def __str__(self):
         return f"Image for {self.job.title}"
 
-class JobApplication(models.Model):
+class JobApplication(ActivityCountedModel):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="applications")
     worker = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="job_applications")
     message = models.TextField(blank=True, null=True, help_text="Optional message to employer")
@@ -373,7 +400,7 @@ class JobApplication(models.Model):
         return None
 
 
-class JobOffer(models.Model):
+class JobOffer(ActivityCountedModel):
     """
     Represents a job offer sent by an employer to a worker.
     This bridges the gap between application acceptance and contract creation.
@@ -592,7 +619,7 @@ class JobOffer(models.Model):
         ordering = ['-created_at']
 
 
-class Contract(models.Model):
+class Contract(ActivityCountedModel):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="contracts")
     worker = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="contracts")
     client = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="client_contracts")
@@ -676,6 +703,13 @@ class Contract(models.Model):
     client_accepted = models.BooleanField(default=False)
     is_finalized = models.BooleanField(default=False, help_text="True when both parties accept")
     is_draft = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            # Day-ahead reminder selection (jobs.reminders)
+            models.Index(fields=['start_date'], name='jobs_contract_start_idx'),
+            models.Index(fields=['end_date'], name='jobs_contract_end_idx'),
+        ]
     
     def finalize_contract(self):
         self.is_draft = False
@@ -703,43 +737,19 @@ class Contract(models.Model):
         self.save()
     
     def check_time_conflict(self):
-        """Check if this contract conflicts with worker's existing contracts"""
-        if not self.start_date or not self.end_date or not self.start_time or not self.end_time:
+        """
+        Check if this contract conflicts with worker's existing contracts.
+        Returns a list of conflict dicts (see Conflict.as_dict) or None.
+        """
+        from .schedule_conflicts import worker_conflicts
+        if not self.start_date:
             return None
         
-        # Get all active contracts for this worker (excluding this contract)
-        worker_contracts = Contract.objects.filter(
-            worker=self.worker,
-            status__in=['Finalized', 'In Progress', 'Awaiting Review']
-        ).exclude(pk=self.pk)
-        
-        conflicts = []
-        for contract in worker_contracts:
-            if not contract.start_date or not contract.end_date or not contract.start_time or not contract.end_time:
-                continue
-            
-            # Check if date ranges overlap
-            date_overlap = (
-                self.start_date <= contract.end_date and 
-                self.end_date >= contract.start_date
-            )
-            
-            if date_overlap:
-                # Check if time ranges overlap
-                time_overlap = (
-                    self.start_time < contract.end_time and 
-                    self.end_time > contract.start_time
-                )
-                
-                if time_overlap:
-                    conflicts.append({
-                        'contract': contract,
-                        'job_title': contract.job_title or contract.job.title,
-                        'dates': f"{contract.start_date} to {contract.end_date}",
-                        'times': f"{contract.start_time.strftime('%I:%M %p')} - {contract.end_time.strftime('%I:%M %p')}"
-                    })
-        
-        return conflicts if conflicts else None
+        conflicts = worker_conflicts(
+            self.worker_id, self.start_date, self.end_date,
+            self.start_time, self.end_time, exclude_contract_id=self.pk,
+        )
+        return [conflict.as_dict() for conflict in conflicts] or None
     
     @staticmethod
     def get_worker_schedule(worker, start_date=None, end_date=None):
@@ -756,47 +766,16 @@ class Contract(models.Model):
         
         return contracts.order_by('start_date', 'start_time')
     
-    def get_calendar_event_data(self):
+    def get_calendar_event_data(self, start_date=None, end_date=None):
         """
-        Return contract data in FullCalendar format with DAILY recurring events.
-        This creates one event per day showing actual work hours, perfect for week view.
+        Return contract data in FullCalendar format with DAILY recurring events,
+        one per day showing actual work hours, optionally clipped to a window.
+        See jobs.calendar_events.
         """
         if not self.start_date or not self.end_date:
             return None
-        
-        from datetime import datetime, time as dt_time, timedelta
-        
-        start_time = self.start_time or dt_time(9, 0)  # Default 9:00 AM
-        end_time = self.end_time or dt_time(17, 0)  # Default 5:00 PM
-        
-        events = []
-        current_date = self.start_date
-        
-        # Generate unique color for this contract based on job ID
-        color = self._get_contract_color()
-        
-        # Create one event per day showing daily work hours
-        while current_date <= self.end_date:
-            events.append({
-                'id': f"{self.pk}_{current_date.strftime('%Y%m%d')}",
-                'title': self.job_title or self.job.title,
-                'start': f"{current_date}T{start_time.strftime('%H:%M:%S')}",
-                'end': f"{current_date}T{end_time.strftime('%H:%M:%S')}",
-                'backgroundColor': color,
-                'borderColor': color,
-                'textColor': '#ffffff',
-                'extendedProps': {
-                    'contractId': self.pk,
-                    'status': self.status,
-                    'client': self.client.get_full_name() or self.client.username,
-                    'rate': str(self.agreed_rate) if self.agreed_rate else 'N/A',
-                    'description': self.job_description[:100] if self.job_description else '',
-                    'workHours': f"{start_time.strftime('%I:%M %p')} - {end_time.strftime('%I:%M %p')}"
-                }
-            })
-            current_date += timedelta(days=1)
-        
-        return events
+        from .calendar_events import contract_day_events
+        return contract_day_events(self, start_date, end_date)
     
     def _get_status_color(self):
         """Get color based on contract status (kept for backward compatibility)"""
@@ -815,28 +794,8 @@ class Contract(models.Model):
         Generate a unique, distinct color for each contract.
         Uses job ID to ensure same job always gets same color.
         """
-        # Palette of distinct, professional colors
-        color_palette = [
-            '#3b82f6',  # Blue
-            '#10b981',  # Green
-            '#f59e0b',  # Orange
-            '#8b5cf6',  # Purple
-            '#ef4444',  # Red
-            '#06b6d4',  # Cyan
-            '#ec4899',  # Pink
-            '#f97316',  # Orange-red
-            '#14b8a6',  # Teal
-            '#a855f7',  # Purple-pink
-            '#84cc16',  # Lime
-            '#f43f5e',  # Rose
-            '#6366f1',  # Indigo
-            '#eab308',  # Yellow
-            '#22c55e',  # Green-lime
-        ]
-        
-        # Use job ID to pick color (same job always same color)
-        index = self.job.id % len(color_palette)
-        return color_palette[index]
+        from .calendar_events import contract_color
+        return contract_color(self)
     
     def __str__(self):
         return f"Contract for {self.job.title} - {self.worker.username}"
@@ -944,6 +903,9 @@ class InterviewSchedule(models.Model):
         ordering = ['-scheduled_datetime']
         verbose_name = "Interview Schedule"
         verbose_name_plural = "Interview Schedules"
+        indexes = [
+            models.Index(fields=['scheduled_datetime'], name='jobs_interview_when_idx'),
+        ]
     
     def __str__(self):
         return f"Interview for {self.application.worker.username} - {self.application.job.title} on {self.scheduled_datetime.strftime('%b %d, %Y at %I:%M %p')}"
@@ -998,147 +960,27 @@ def notify_users_about_new_job(sender, instance, created, **kwargs):
 @receiver(post_save, sender=Job)
 def notify_workers_about_new_job(sender, instance, created, **kwargs):
     """
-    Send notifications to WORKERS based on their notification preferences.
-    OPTIMIZATION: Checks category FIRST (cheap), then distance (expensive).
-    Only workers (role='worker') receive job notifications.
+    Queue notifications to WORKERS based on their notification preferences.
+    Matching (category + per-worker radius) and delivery happen in the
+    fanout_new_job_notifications Celery task, so posting a job only pays for
+    enqueueing. Only workers (role='worker') receive job notifications.
     """
     import logging
+    from django.db import transaction
     logger = logging.getLogger(__name__)
-    
-    # Debug: Log all job saves
-    logger.info(f"[NOTIFICATION] Job saved: {instance.title} (ID: {instance.pk})")
-    logger.info(f"[NOTIFICATION]   - Created: {created}")
-    logger.info(f"[NOTIFICATION]   - Has location: {bool(instance.location)}")
-    
-    if not created:
-        logger.info(f"[NOTIFICATION]   - SKIP: Job was updated, not created")
-        return
-    
-    if not instance.location:
-        logger.info(f"[NOTIFICATION]   - SKIP: Job has no location")
-        return
-    
-    if created and instance.location:
-        from users.models import NotificationPreference
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        logger.info(f"[NOTIFICATION] New job created: {instance.title} (ID: {instance.pk})")
-        logger.info(f"[NOTIFICATION] Job location: {instance.location}")
-        logger.info(f"[NOTIFICATION] Job category: {instance.category}")
-        
-        # Get job's general category once
-        job_general_category = instance.category.general_category if instance.category else None
-        logger.info(f"[NOTIFICATION] Job general category: {job_general_category}")
-        
-        # Get all active notification preferences with location set (WORKERS ONLY)
-        preferences = NotificationPreference.objects.filter(
-            is_active=True,
-            notification_location__isnull=False,
-            user__role='worker'  # Only notify workers
-        ).exclude(user=instance.owner).select_related('user').prefetch_related('preferred_categories')
-        
-        logger.info(f"[NOTIFICATION] Found {preferences.count()} active worker preferences")
-        
-        notifications_sent = 0
-        for pref in preferences:
-            logger.info(f"[NOTIFICATION] Checking worker: {pref.user.username}")
-            logger.info(f"[NOTIFICATION]   - Radius: {pref.notification_radius_km} km")
-            logger.info(f"[NOTIFICATION]   - Location: {pref.notification_location}")
-            logger.info(f"[NOTIFICATION]   - Categories count: {pref.preferred_categories.count()}")
-            
-            # STEP 1: Check category FIRST (fast database lookup, no calculations)
-            if pref.preferred_categories.exists():
-                # Worker has category preferences - check if job matches
-                if not job_general_category:
-                    logger.info(f"[NOTIFICATION]   - SKIP: Job has no general category")
-                    continue  # Job has no category, skip this worker
-                
-                if not pref.preferred_categories.filter(id=job_general_category.id).exists():
-                    logger.info(f"[NOTIFICATION]   - SKIP: Category mismatch")
-                    continue  # Job category doesn't match worker's preferences, skip
-                
-                logger.info(f"[NOTIFICATION]   - PASS: Category matches!")
-            else:
-                logger.info(f"[NOTIFICATION]   - PASS: Worker accepts all categories")
-            
-            # STEP 2: Only calculate distance if category matches (or worker accepts all categories)
-            # This is expensive (GIS calculation), so we do it last
-            distance_km = float(pref.notification_radius_km) if pref.notification_radius_km else 5.0
-            
-            # Calculate distance between job and worker's notification location
-            try:
-                actual_distance = instance.location.distance(pref.notification_location)
-                
-                # Handle both Distance object and float (geography field returns float in meters)
-                if hasattr(actual_distance, 'm'):
-                    distance_meters = actual_distance.m
-                else:
-                    # Already in meters (geography field)
-                    distance_meters = float(actual_distance)
-                
-                logger.info(f"[NOTIFICATION]   - Distance: {distance_meters:.2f}m ({distance_meters/1000:.2f}km)")
-                logger.info(f"[NOTIFICATION]   - Max radius: {distance_km}km ({distance_km * 1000}m)")
-                
-                # Convert to meters for comparison
-                if distance_meters <= (distance_km * 1000):
-                    logger.info(f"[NOTIFICATION]   - ✅ SENDING notification!")
-                    # Job matches category AND is within radius - send notification
-                    send_job_notification(pref.user, instance, distance_km)
-                    notifications_sent += 1
-                else:
-                    logger.info(f"[NOTIFICATION]   - SKIP: Outside radius")
-            except (AttributeError, TypeError) as e:
-                logger.error(f"[NOTIFICATION]   - ERROR: Distance calculation failed: {e}")
-                # Skip if distance calculation fails
-                continue
-        
-        logger.info(f"[NOTIFICATION] Total notifications sent: {notifications_sent}")
 
+    if not created or not instance.location:
+        return
 
-def send_job_notification(worker, job, radius_km):
-    """Helper function to create job notification"""
-    # Calculate actual distance for display
-    from django.contrib.gis.measure import D
-    from users.models import NotificationPreference
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    try:
-        pref = NotificationPreference.objects.get(user=worker)
-        if pref.notification_location and job.location:
-            distance_obj = job.location.distance(pref.notification_location)
-            
-            # Handle both Distance object and float (geography field returns float in meters)
-            if hasattr(distance_obj, 'm'):
-                distance_meters = distance_obj.m
-            else:
-                distance_meters = float(distance_obj)
-            
-            distance_km = distance_meters / 1000  # Convert meters to km
-            
-            logger.info(f"[NOTIFICATION] Creating notification for {worker.username}: {distance_km:.1f}km away")
-            
-            Notification.objects.create(
-                user=worker,
-                message=f"🎯 New job: '{job.title}' posted {distance_km:.1f}km from your location! {job.category.name if job.category else ''}",
-                notif_type="job_post",
-                object_id=job.pk,
-            )
-            logger.info(f"[NOTIFICATION] ✅ Notification created successfully!")
-    except Exception as e:
-        logger.error(f"[NOTIFICATION] ERROR creating notification: {e}")
-        # Fallback notification without distance
+    def _dispatch():
+        from jobs.tasks_notifications import fanout_new_job_notifications
         try:
-            Notification.objects.create(
-                user=worker,
-                message=f"🎯 New job: '{job.title}' has been posted near you. Click to view details.",
-                notif_type="job_post",
-                object_id=job.pk,
-            )
-            logger.info(f"[NOTIFICATION] ✅ Fallback notification created")
-        except Exception as e2:
-            logger.error(f"[NOTIFICATION] ❌ Failed to create fallback notification: {e2}")
+            fanout_new_job_notifications.delay(instance.pk)
+        except Exception as e:
+            logger.error(f"[NOTIFICATION] Failed to queue fanout for job {instance.pk}: {e}")
+
+    # Wait for the job row to be committed so the worker can see it
+    transaction.on_commit(_dispatch)
 
 
 class WorkerAvailability(models.Model):
@@ -1208,80 +1050,181 @@ class WorkerAvailability(models.Model):
         return availability.order_by('day_of_week', 'start_time')
     
     @staticmethod
-    def check_availability_for_contract(worker, start_date, end_date, start_time, end_time):
+    def check_availability_for_contract(worker, start_date, end_date, start_time, end_time, exclude_contract_id=None):
         """
         Check if worker is available for the proposed contract schedule.
         Priority: Check TIME conflicts first (most important), then availability slots.
         Returns a dict with 'available' (bool) and 'conflicts' (list of conflicting days).
-        """
-        from datetime import timedelta
-        
-        conflicts = []
-        current_date = start_date
         
-        # Get all active contracts for this worker
-        existing_contracts = Contract.objects.filter(
-            worker=worker,
-            status__in=['Finalized', 'In Progress', 'Awaiting Review']
-        ).exclude(start_date__isnull=True).exclude(end_date__isnull=True)
-        
-        while current_date <= end_date:
-            day_of_week = current_date.weekday()  # 0=Monday, 6=Sunday
-            
-            # PRIORITY 1: Check for time conflicts with existing contracts on this date
-            has_time_conflict = False
-            for contract in existing_contracts:
-                # Check if this contract overlaps with current_date
-                if contract.start_date <= current_date <= contract.end_date:
-                    # Check if times conflict (same date, overlapping times)
-                    if contract.start_time and contract.end_time:
-                        # Time ranges overlap if: start_time < other.end_time AND end_time > other.start_time
-                        if start_time < contract.end_time and end_time > contract.start_time:
-                            has_time_conflict = True
-                            conflicts.append({
-                                'date': current_date,
-                                'reason': f'Time conflict with "{contract.job_title or contract.job.title}" ({contract.start_time.strftime("%I:%M %p")} - {contract.end_time.strftime("%I:%M %p")})'
-                            })
-                            break  # One conflict per day is enough
-            
-            # Skip further checks if time conflict found (most important)
-            if has_time_conflict:
-                current_date += timedelta(days=1)
-                continue
-            
-            # PRIORITY 2: Check worker's availability settings for this day
-            day_availability = WorkerAvailability.objects.filter(
-                worker=worker,
-                day_of_week=day_of_week,
-                is_available=True
-            )
-            
-            if not day_availability.exists():
-                conflicts.append({
-                    'date': current_date,
-                    'reason': 'Worker not available on this day of week'
-                })
-            else:
-                # Check if requested time falls within any availability slot
-                has_matching_slot = False
-                for slot in day_availability:
-                    # Time must be fully within the slot
-                    if start_time >= slot.start_time and end_time <= slot.end_time:
-                        has_matching_slot = True
-                        break
-                
-                if not has_matching_slot:
-                    # Show available times for this day
-                    available_times = [f"{slot.start_time.strftime('%I:%M %p')}-{slot.end_time.strftime('%I:%M %p')}" 
-                                      for slot in day_availability]
-                    conflicts.append({
-                        'date': current_date,
-                        'reason': f'Time {start_time.strftime("%I:%M %p")}-{end_time.strftime("%I:%M %p")} not in available slots: {", ".join(available_times)}'
-                    })
-            
-            current_date += timedelta(days=1)
+        Evaluated against the worker's cached weekly availability bitmap and
+        one contract-overlap query, regardless of the schedule's length.
+        """
+        from .availability import check_schedule
         
+        conflicts = check_schedule(
+            getattr(worker, 'pk', worker), start_date, end_date,
+            start_time, end_time, exclude_contract_id
+        )
         return {
             'available': len(conflicts) == 0,
             'conflicts': conflicts
         }
+
+
+class WorkerRecommendation(models.Model):
+    """
+    Precomputed top-N job recommendations per worker.
+
+    Written by jobs.tasks_recommendations (periodic full refresh plus
+    incremental scoring of new jobs) and read by the worker dashboard and
+    the recommended-jobs API in a single indexed query.
+    """
+    worker = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name="job_recommendations"
+    )
+    job = models.ForeignKey(
+        Job,
+        on_delete=models.CASCADE,
+        related_name="recommendations"
+    )
+    score = models.FloatField()
+    distance_km = models.FloatField(null=True, blank=True)
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['worker', 'job']
+        indexes = [
+            models.Index(fields=['worker', '-score'], name='jobs_rec_worker_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.worker} -> {self.job_id} ({self.score:.2f})"
+
+
+class UserActivitySummary(models.Model):
+    """
+    Denormalized per-user counters for the dashboards and stats APIs.
+
+    Kept current incrementally by the save/delete signals in jobs.signals
+    (see jobs.activity_summary for the counter definitions) and repaired by
+    the reconcile_activity_summaries management command. Counters are plain
+    integers so a drifted decrement can never make the user's save fail.
+    """
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="activity_summary"
+    )
+
+    # Jobs posted by the user
+    jobs_total = models.IntegerField(default=0)
+    jobs_active = models.IntegerField(default=0)
+
+    # Applications received on the user's jobs
+    applications_received_total = models.IntegerField(default=0)
+    applications_received_pending = models.IntegerField(default=0)
+    applications_received_rejected = models.IntegerField(default=0)
+
+    # Applications the user sent
+    applications_sent_total = models.IntegerField(default=0)
+    applications_sent_pending = models.IntegerField(default=0)
+    applications_sent_rejected = models.IntegerField(default=0)
+    applications_sent_archived = models.IntegerField(default=0)
+
+    # Contracts where the user is the client ("open" = not completed/cancelled)
+    client_contracts_open = models.IntegerField(default=0)
+    client_contracts_in_progress = models.IntegerField(default=0)
+    client_contracts_completed = models.IntegerField(default=0)
+    client_contracts_cancelled = models.IntegerField(default=0)
+
+    # Contracts where the user is the worker
+    worker_contracts_open = models.IntegerField(default=0)
+    worker_contracts_in_progress = models.IntegerField(default=0)
+    worker_contracts_completed = models.IntegerField(default=0)
+    worker_contracts_cancelled = models.IntegerField(default=0)
+
+    # Job offers (deprecated flow, still reported by the stats API)
+    offers_sent_total = models.IntegerField(default=0)
+    offers_sent_pending = models.IntegerField(default=0)
+    offers_received_total = models.IntegerField(default=0)
+    offers_received_pending = models.IntegerField(default=0)
+
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "User activity summaries"
+
+    def __str__(self):
+        return f"Activity summary for {self.user}"
+
+    @property
+    def jobs_inactive(self):
+        return max(self.jobs_total - self.jobs_active, 0)
+
+
+class ReminderLog(models.Model):
+    """
+    One reminder that has been sent, keyed on what it was about.
+
+    `date` is the day the reminder concerns (a contract's start or end date,
+    an interview's day), so a reminder goes out once per occurrence however
+    often jobs.reminders runs, and again if the contract is rescheduled.
+    The partial unique keys double as the index for the anti-join that
+    selects due reminders.
+    """
+    kind = models.CharField(max_length=30)
+    date = models.DateField()
+    contract = models.ForeignKey(
+        Contract,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="reminder_logs"
+    )
+    interview = models.ForeignKey(
+        InterviewSchedule,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="reminder_logs"
+    )
+    sent_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['contract', 'kind', 'date'],
+                condition=models.Q(contract__isnull=False),
+                name='jobs_reminder_contract_uniq',
+            ),
+            models.UniqueConstraint(
+                fields=['interview', 'kind', 'date'],
+                condition=models.Q(interview__isnull=False),
+                name='jobs_reminder_interview_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        target = f"contract {self.contract_id}" if self.contract_id else f"interview {self.interview_id}"
+        return f"{self.kind} for {target} on {self.date}"
+
+
+class CalendarFeed(models.Model):
+    """
+    Secret token for a user's iCalendar feed at /calendar/<token>.ics
+    (jobs.calendar_feed). Rotating the token revokes old subscriptions.
+    """
+    user = models.OneToOneField(
+        CustomUser,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="calendar_feed"
+    )
+    token = models.CharField(max_length=64, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Calendar feed for {self.user}"
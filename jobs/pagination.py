@@ -0,0 +1,162 @@
+"""
+Database-side pagination helpers for the job listing.
+
+- ApproximateCountPaginator: takes the total from the planner's row
+  estimate when it is large, an exact COUNT(*) when it is small, and caches
+  the result briefly under a key built from the caller's filter inputs
+- Keyset cursors: for the default newest-first and distance sorts, the
+  "next" link carries the last row's sort key so the following page is an
+  index range scan instead of an ever-growing OFFSET. Distances are keyed
+  in whole metres (DISTANCE_KEY) so ties compare exactly, and rows without
+  a location sort last.
+"""
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import connections
+from django.db.models import F, IntegerField, Q
+from django.db.models.functions import Cast
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+import base64
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_TIMEOUT = 60
+
+# Below this planner estimate an exact COUNT(*) is cheap enough
+EXACT_COUNT_THRESHOLD = 1000
+
+# Annotation holding the distance sort key: the `distance` annotation rounded
+# to whole metres (float equality on computed distances is not reliable)
+DISTANCE_KEY = 'distance_m'
+
+# Sort name -> (ordering, sort-key field); the id tie-breaker keeps keysets stable
+KEYSET_SORTS = {
+    'date_desc': (('-created_at', '-id'), 'created_at'),
+    'distance': ((F(DISTANCE_KEY).asc(nulls_last=True), 'id'), DISTANCE_KEY),
+}
+
+
+def _planner_estimate(queryset):
+    """Row estimate from EXPLAIN for the queryset, or None if unavailable."""
+    sql, params = queryset.query.sql_with_params()
+    connection = connections[queryset.db]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+    except Exception as e:
+        logger.debug(f"EXPLAIN row estimate failed: {e}")
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def count_key(params):
+    """Stable cache key part for a set of filter inputs ({name: value})."""
+    normalized = sorted((name, str(value).strip()) for name, value in params.items() if value not in (None, ''))
+    return hashlib.md5(json.dumps(normalized).encode()).hexdigest()
+
+
+def approximate_count(queryset, key=None):
+    """
+    Cached total for a queryset: estimated when large, exact when small.
+
+    `key` identifies the filtered set (see count_key()) and should be given
+    whenever the query has time-dependent parameters such as now(); the SQL
+    digest it otherwise falls back to changes on every call for those.
+    """
+    queryset = queryset.order_by()
+    if key is None:
+        sql, params = queryset.query.sql_with_params()
+        key = hashlib.md5(f'{sql}|{params!r}'.encode()).hexdigest()
+    cache_key = f'approx_count:{queryset.model._meta.label_lower}:{key}'
+
+    count = cache.get(cache_key)
+    if count is None:
+        estimate = _planner_estimate(queryset)
+        if estimate is None or estimate < EXACT_COUNT_THRESHOLD:
+            count = queryset.count()
+        else:
+            count = estimate
+        cache.set(cache_key, count, timeout=COUNT_CACHE_TIMEOUT)
+    return count
+
+
+class ApproximateCountPaginator(Paginator):
+    """Paginator whose total comes from approximate_count(), cached under count_key."""
+
+    def __init__(self, object_list, per_page, count_key=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_key = count_key
+
+    @cached_property
+    def count(self):
+        return approximate_count(self.object_list, key=self.count_key)
+
+
+class KeysetPage(Page):
+    """A page fetched by cursor; has_next comes from an N+1 fetch, not the count."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        return self.number + 1
+
+
+def encode_cursor(value, pk, page_number):
+    payload = json.dumps({'v': value, 'id': pk, 'p': page_number})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return (value, id, page_number) or None for a malformed cursor."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return data['v'], int(data['id']), int(data['p'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def with_distance_key(queryset):
+    """Annotate DISTANCE_KEY from the queryset's `distance` annotation."""
+    return queryset.annotate(**{DISTANCE_KEY: Cast('distance', IntegerField())})
+
+
+def cursor_for(sort, obj, page_number):
+    """Cursor pointing just past `obj` for the given keyset sort."""
+    if sort == 'distance':
+        value = getattr(obj, DISTANCE_KEY)
+    else:
+        value = obj.created_at.isoformat()
+    return encode_cursor(value, obj.pk, page_number)
+
+
+def keyset_filter(sort, value, pk):
+    """Q selecting rows strictly after (value, pk) in the sort's ordering."""
+    if sort == 'distance':
+        # Rows without a location (NULL key) come last, ordered by id
+        after_nulls = Q(**{f'{DISTANCE_KEY}__isnull': True, 'id__gt': pk})
+        if value is None:
+            return after_nulls
+        if not isinstance(value, int):
+            return None
+        return (
+            Q(**{f'{DISTANCE_KEY}__gt': value})
+            | Q(**{DISTANCE_KEY: value, 'id__gt': pk})
+            | Q(**{f'{DISTANCE_KEY}__isnull': True})
+        )
+
+    created_at = parse_datetime(value) if isinstance(value, str) else None
+    if created_at is None:
+        return None
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
@@ -0,0 +1,210 @@
+"""
+Job recommendations for workers.
+
+Each candidate job is scored per worker from four signals, each in [0, 1]:
+- category: the job's general category is one the worker subscribed to in
+  NotificationPreference (no subscriptions = mild interest in everything)
+- skills: overlap between the worker's skill names and the job's title and
+  required skills
+- distance: closeness to the worker's notification (or profile) location,
+  relative to their notification radius
+- recency: exponential decay on the job's age
+
+Scores are precomputed into WorkerRecommendation by
+jobs.tasks_recommendations; request paths only read that table.
+"""
+from dataclasses import dataclass, field
+from django.db.models import Q
+from django.utils import timezone
+import math
+import re
+
+import numpy as np
+
+from geo.haversine import haversine_km, parse_point
+
+TOP_N = 20
+
+# Newest active jobs considered in a full refresh
+CANDIDATE_LIMIT = 500
+
+WEIGHTS = {
+    'category': 0.30,
+    'skills': 0.30,
+    'distance': 0.25,
+    'recency': 0.15,
+}
+
+# Category signal when the worker has not picked any categories
+UNSUBSCRIBED_CATEGORY_SCORE = 0.5
+
+# Neutral distance signal when either side has no location
+UNKNOWN_DISTANCE_SCORE = 0.3
+
+DEFAULT_RADIUS_KM = 10.0
+RECENCY_HALF_LIFE_DAYS = 7.0
+
+_TOKEN_RE = re.compile(r'[a-z]{3,}')
+
+
+def tokenize(text):
+    return set(_TOKEN_RE.findall((text or '').lower()))
+
+
+@dataclass
+class WorkerProfile:
+    user_id: int
+    category_ids: set = field(default_factory=set)
+    skill_tokens: set = field(default_factory=set)
+    coords: tuple = None
+    radius_km: float = DEFAULT_RADIUS_KM
+
+
+@dataclass
+class Candidates:
+    """Column arrays for a batch of candidate jobs."""
+    ids: list
+    owner_ids: np.ndarray
+    category_ids: np.ndarray
+    lats: np.ndarray
+    lngs: np.ndarray
+    has_location: np.ndarray
+    age_days: np.ndarray
+    skill_tokens: list
+
+
+def active_jobs():
+    from .models import Job
+    return Job.objects.filter(is_active=True).filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
+    )
+
+
+def load_candidates(queryset):
+    """Build Candidates from a Job queryset with one query."""
+    rows = list(queryset.values_list(
+        'id', 'owner_id', 'category__general_category_id', 'latitude', 'longitude',
+        'location', 'created_at', 'title', 'required_skills',
+    ))
+    now = timezone.now()
+    ids, owners, categories, lats, lngs, located, ages, skills = [], [], [], [], [], [], [], []
+    for pk, owner_id, category_id, lat, lng, location, created_at, title, required_skills in rows:
+        if lat is None or lng is None:
+            point = parse_point(location)
+            lat, lng = point if point else (0.0, 0.0)
+            located.append(point is not None)
+        else:
+            located.append(True)
+        ids.append(pk)
+        owners.append(owner_id)
+        categories.append(category_id or 0)
+        lats.append(lat)
+        lngs.append(lng)
+        ages.append(max((now - created_at).total_seconds(), 0) / 86400)
+        skills.append(tokenize(f"{title} {required_skills}"))
+
+    return Candidates(
+        ids=ids,
+        owner_ids=np.array(owners, dtype=np.int64),
+        category_ids=np.array(categories, dtype=np.int64),
+        lats=np.array(lats, dtype=np.float64),
+        lngs=np.array(lngs, dtype=np.float64),
+        has_location=np.array(located, dtype=bool),
+        age_days=np.array(ages, dtype=np.float64),
+        skill_tokens=skills,
+    )
+
+
+def load_profiles(worker_ids):
+    """WorkerProfile for each worker id, with a fixed number of queries."""
+    from users.models import CustomUser, NotificationPreference, Skill
+
+    profiles = {pk: WorkerProfile(user_id=pk) for pk in worker_ids}
+
+    for user_id, location in CustomUser.objects.filter(pk__in=worker_ids).values_list('pk', 'location'):
+        profiles[user_id].coords = parse_point(location)
+
+    preferences = NotificationPreference.objects.filter(
+        user_id__in=worker_ids
+    ).prefetch_related('preferred_categories')
+    for pref in preferences:
+        profile = profiles[pref.user_id]
+        profile.category_ids = {c.pk for c in pref.preferred_categories.all()}
+        profile.radius_km = float(pref.notification_radius_km or DEFAULT_RADIUS_KM)
+        point = parse_point(pref.notification_location)
+        if point:
+            profile.coords = point
+
+    skills = Skill.objects.filter(user_id__in=worker_ids).exclude(status='unverified')
+    for user_id, name in skills.values_list('user_id', 'name'):
+        profiles[user_id].skill_tokens |= tokenize(name)
+
+    return profiles
+
+
+def score_candidates(profile, candidates):
+    """(scores, distances_km) arrays for every candidate job for one worker."""
+    count = len(candidates.ids)
+    if not count:
+        return np.zeros(0), np.zeros(0)
+
+    if profile.category_ids:
+        category = np.isin(candidates.category_ids, list(profile.category_ids)).astype(np.float64)
+    else:
+        category = np.full(count, UNSUBSCRIBED_CATEGORY_SCORE)
+
+    if profile.skill_tokens:
+        skills = np.array([
+            len(profile.skill_tokens & tokens) / len(profile.skill_tokens)
+            for tokens in candidates.skill_tokens
+        ])
+    else:
+        skills = np.zeros(count)
+
+    if profile.coords:
+        distances = haversine_km(*profile.coords, candidates.lats, candidates.lngs)
+        distance = np.where(
+            candidates.has_location,
+            np.exp(-distances / max(profile.radius_km, 0.5)),
+            UNKNOWN_DISTANCE_SCORE,
+        )
+        distances = np.where(candidates.has_location, distances, np.nan)
+    else:
+        distances = np.full(count, np.nan)
+        distance = np.full(count, UNKNOWN_DISTANCE_SCORE)
+
+    recency = np.exp(-candidates.age_days * math.log(2) / RECENCY_HALF_LIFE_DAYS)
+
+    scores = (
+        WEIGHTS['category'] * category
+        + WEIGHTS['skills'] * skills
+        + WEIGHTS['distance'] * distance
+        + WEIGHTS['recency'] * recency
+    )
+    # Never recommend a worker's own postings
+    scores[candidates.owner_ids == profile.user_id] = -1.0
+    return scores, distances
+
+
+def get_recommended_jobs(user, limit=10):
+    """
+    Top stored recommendations for `user` that are still open, as Job
+    objects annotated with `recommendation_score` and `distance_km`.
+    """
+    from .models import WorkerRecommendation
+
+    now = timezone.now()
+    recommendations = WorkerRecommendation.objects.filter(
+        worker=user,
+        job__is_active=True,
+    ).filter(
+        Q(job__expires_at__isnull=True) | Q(job__expires_at__gt=now)
+    ).select_related('job__category', 'job__owner').order_by('-score')[:limit]
+
+    jobs = []
+    for recommendation in recommendations:
+        job = recommendation.job
+        job.recommendation_score = round(recommendation.score, 3)
+        job.distance_km = round(recommendation.distance_km, 2) if recommendation.distance_km is not None else None
+        jobs.append(job)
+    return jobs
@@ -0,0 +1,184 @@
+"""
+Day-ahead schedule reminders.
+
+Each ReminderKind names the rows it is about (contracts starting or
+ending soon, interviews tomorrow) and the notifications each row turns
+into. A run handles every kind with:
+
+1. one SELECT of the due rows, on the source's date index, with an
+   anti-join against ReminderLog so rows already reminded are skipped
+2. one INSERT ... ON CONFLICT DO NOTHING RETURNING into ReminderLog: the
+   unique keys stop a concurrent run from logging the same reminder, and
+   only the rows this run actually logged are reminded, so an overlapping
+   run neither sends twice nor drops rows the other run didn't see
+3. one bulk notification INSERT (Notification.objects.bulk_send)
+
+A new kind is one more entry in REMINDER_KINDS; it only needs an indexed
+date filter on its source so it does not add a table scan.
+"""
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Callable, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Contracts that still need reminders ('Accepted' is set by finalize_contract)
+CONTRACT_STATUSES = ('Accepted', 'Finalized', 'In Progress', 'Awaiting Review')
+INTERVIEW_STATUSES = ('scheduled', 'rescheduled')
+
+CONTRACT_FIELDS = (
+    'id', 'worker_id', 'client_id', 'job__title', 'start_date', 'end_date',
+    'worker__first_name', 'worker__last_name', 'worker__username',
+)
+INTERVIEW_FIELDS = (
+    'id', 'scheduled_datetime', 'interview_type', 'application__worker_id',
+    'application__job__owner_id', 'application__job__title',
+    'application__worker__first_name', 'application__worker__last_name',
+    'application__worker__username',
+)
+
+# Rows that hit a unique key (logged by another run) are skipped, not errors
+LOG_SQL = """
+INSERT INTO {table} ("kind", "date", "sent_at", {column})
+SELECT %(kind)s, %(date)s, %(sent_at)s, source_id FROM unnest(%(ids)s) AS source_id
+ON CONFLICT DO NOTHING
+RETURNING {column}
+"""
+
+
+@dataclass(frozen=True)
+class ReminderKind:
+    name: str
+    # ReminderLog foreign key the kind is logged against: 'contract' or 'interview'
+    source: str
+    notif_type: str
+    days_ahead: int
+    # (target_date) -> queryset of source rows the reminder is due for
+    select: Callable
+    fields: Tuple[str, ...]
+    # (row values) -> [(user_id, message), ...]
+    build: Callable
+
+
+def _full_name(row, prefix):
+    name = f"{row[prefix + 'first_name']} {row[prefix + 'last_name']}".strip()
+    return name or row[prefix + 'username']
+
+
+def _contracts_on(date_field):
+    def select(target):
+        from .models import Contract
+        return Contract.objects.filter(status__in=CONTRACT_STATUSES, **{date_field: target})
+    return select
+
+
+def _interviews_on(target):
+    from .models import InterviewSchedule
+
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(target, time.min), tz)
+    return InterviewSchedule.objects.filter(
+        status__in=INTERVIEW_STATUSES,
+        scheduled_datetime__gte=start,
+        scheduled_datetime__lt=start + timedelta(days=1),
+    )
+
+
+def _contract_start(row):
+    title = row['job__title']
+    return [
+        (row['worker_id'], f"⏰ Reminder: Your contract '{title}' starts tomorrow ({row['start_date'].strftime('%b %d, %Y')}). Get ready!"),
+        (row['client_id'], f"⏰ Reminder: Contract with {_full_name(row, 'worker__')} for '{title}' starts tomorrow."),
+    ]
+
+
+def _contract_end_3d(row):
+    return [
+        (row['worker_id'], f"⏳ Deadline Alert: Your contract '{row['job__title']}' ends in 3 days ({row['end_date'].strftime('%b %d, %Y')}). Please complete all work."),
+    ]
+
+
+def _contract_end_1d(row):
+    title = row['job__title']
+    return [
+        (row['worker_id'], f"🚨 Urgent: Your contract '{title}' ends tomorrow! Please ensure all deliverables are submitted."),
+        (row['client_id'], f"🚨 Reminder: Contract with {_full_name(row, 'worker__')} for '{title}' ends tomorrow."),
+    ]
+
+
+def _interview_1d(row):
+    title = row['application__job__title']
+    at = timezone.localtime(row['scheduled_datetime']).strftime('%I:%M %p')
+    kind = row['interview_type'].replace('_', ' ')
+    return [
+        (row['application__worker_id'], f"📅 Reminder: Your {kind} interview for '{title}' is tomorrow at {at}."),
+        (row['application__job__owner_id'], f"📅 Reminder: {kind.capitalize()} interview with {_full_name(row, 'application__worker__')} for '{title}' is tomorrow at {at}."),
+    ]
+
+
+REMINDER_KINDS = (
+    ReminderKind('contract_start_1d', 'contract', 'schedule_reminder', 1,
+                 _contracts_on('start_date'), CONTRACT_FIELDS, _contract_start),
+    ReminderKind('contract_end_3d', 'contract', 'schedule_deadline', 3,
+                 _contracts_on('end_date'), CONTRACT_FIELDS, _contract_end_3d),
+    ReminderKind('contract_end_1d', 'contract', 'schedule_deadline', 1,
+                 _contracts_on('end_date'), CONTRACT_FIELDS, _contract_end_1d),
+    ReminderKind('interview_1d', 'interview', 'interview', 1,
+                 _interviews_on, INTERVIEW_FIELDS, _interview_1d),
+)
+
+
+def due_reminders(kind, today):
+    """(target date, rows) for the rows of `kind` due on `today` that have not been reminded yet."""
+    from .models import ReminderLog
+
+    target = today + timedelta(days=kind.days_ahead)
+    already_sent = ReminderLog.objects.filter(kind=kind.name, date=target, **{kind.source: OuterRef('pk')})
+    return target, list(kind.select(target).filter(~Exists(already_sent)).values(*kind.fields))
+
+
+def log_reminders(kind, target, ids):
+    """Log `kind` for the source ids; returns the ids logged now (not by another run)."""
+    from .models import ReminderLog
+
+    sql = LOG_SQL.format(
+        table=connection.ops.quote_name(ReminderLog._meta.db_table),
+        column=connection.ops.quote_name(ReminderLog._meta.get_field(kind.source).column),
+    )
+    params = {'kind': kind.name, 'date': target, 'sent_at': timezone.now(), 'ids': list(ids)}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return {row[0] for row in cursor.fetchall()}
+
+
+def send_reminders(kind, today):
+    """Send one kind's due reminders; returns how many rows were reminded."""
+    from notifications.models import Notification
+
+    target, rows = due_reminders(kind, today)
+    if not rows:
+        return 0
+
+    with transaction.atomic():
+        logged = log_reminders(kind, target, [row['id'] for row in rows])
+        if len(logged) < len(rows):
+            # Another run logged the rest first; it sends those
+            logger.info(f"[REMINDERS] {kind.name} for {target}: {len(rows) - len(logged)} already logged by another run")
+        rows = [row for row in rows if row['id'] in logged]
+        Notification.objects.bulk_send(
+            Notification(user_id=user_id, notif_type=kind.notif_type, object_id=row['id'], message=message)
+            for row in rows
+            for user_id, message in kind.build(row)
+        )
+    return len(rows)
+
+
+def send_due_reminders(today=None, kinds=REMINDER_KINDS):
+    """Run every reminder kind for `today` (default: local today); returns {kind: count}."""
+    today = today or timezone.localdate()
+    return {kind.name: send_reminders(kind, today) for kind in kinds}
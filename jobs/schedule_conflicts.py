@@ -0,0 +1,163 @@
+"""
+Contract schedule conflict engine.
+
+Every contract row carries two generated range columns (migration
+0031_contract_schedule_ranges):
+
+- schedule_dates daterange: [start_date, end_date]; a contract with no
+  end date is treated as ongoing for ONGOING_CONTRACT_DAYS
+- schedule_times timerange: [start_time, end_time); NULL when the contract
+  has no daily hours (or they wrap past midnight), meaning "all day"
+
+Two schedules conflict when their date ranges overlap and their daily
+hours overlap, with a missing side counting as all day. An overlap check is
+a single `&&` query on the partial GiST index over (worker_id,
+schedule_dates), for one worker or a batch of candidate workers.
+"""
+from dataclasses import asdict, dataclass
+from datetime import date, time, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.db import connection
+
+# Contract statuses that occupy the worker's calendar; the partial index
+# jobs_contract_schedule_gist uses the same list
+ACTIVE_CONTRACT_STATUSES = ('Finalized', 'In Progress', 'Awaiting Review')
+
+# Must match the schedule_dates expression in migration 0031
+ONGOING_CONTRACT_DAYS = 30
+
+CONFLICT_SQL = """
+SELECT c.id, c.worker_id, c.status,
+       COALESCE(NULLIF(c.job_title, ''), j.title) AS job_title,
+       COALESCE(NULLIF(TRIM(u.first_name || ' ' || u.last_name), ''), u.username) AS client_name,
+       c.start_date, c.end_date, c.start_time, c.end_time,
+       lower(c.schedule_dates * daterange(%(start)s, %(end)s, '[]')) AS overlap_start,
+       upper(c.schedule_dates * daterange(%(start)s, %(end)s, '[]')) - 1 AS overlap_end
+FROM {contract_table} c
+JOIN {job_table} j ON j.id = c.job_id
+JOIN {user_table} u ON u.id = c.client_id
+WHERE c.worker_id = ANY(%(worker_ids)s)
+  AND c.status IN ({statuses})
+  AND c.schedule_dates && daterange(%(start)s, %(end)s, '[]')
+  {times_clause}
+  {exclude_clause}
+ORDER BY c.worker_id, c.start_date, c.start_time NULLS FIRST, c.id
+"""
+
+TIMES_CLAUSE = "AND (c.schedule_times IS NULL OR c.schedule_times && timerange(%(start_time)s, %(end_time)s))"
+EXCLUDE_CLAUSE = "AND c.id <> %(exclude_id)s"
+
+
+@dataclass
+class Conflict:
+    """One existing contract that overlaps a proposed schedule."""
+    contract_id: int
+    worker_id: int
+    status: str
+    job_title: str
+    client_name: str
+    start_date: date
+    end_date: Optional[date]
+    start_time: Optional[time]
+    end_time: Optional[time]
+    # Days on which the two schedules overlap
+    overlap_start: date
+    overlap_end: date
+
+    @property
+    def dates(self):
+        end = self.end_date.strftime('%b %d, %Y') if self.end_date else 'Ongoing'
+        return f"{self.start_date.strftime('%b %d, %Y')} - {end}"
+
+    @property
+    def times(self):
+        if self.start_time and self.end_time:
+            return f"{self.start_time.strftime('%I:%M %p')} - {self.end_time.strftime('%I:%M %p')}"
+        return "All day"
+
+    def covers(self, day):
+        return self.overlap_start <= day <= self.overlap_end
+
+    def as_dict(self):
+        """JSON-friendly representation for API responses."""
+        data = asdict(self)
+        for key, value in data.items():
+            if isinstance(value, (date, time)):
+                data[key] = value.isoformat()
+        data['dates'] = self.dates
+        data['times'] = self.times
+        return data
+
+
+def effective_end_date(start_date, end_date=None):
+    """The last day a schedule occupies, mirroring the schedule_dates column."""
+    if end_date is None:
+        end_date = start_date + timedelta(days=ONGOING_CONTRACT_DAYS)
+    return max(end_date, start_date)
+
+
+def find_conflicts(
+    worker_ids: Iterable[int],
+    start_date: date,
+    end_date: Optional[date] = None,
+    start_time: Optional[time] = None,
+    end_time: Optional[time] = None,
+    exclude_contract_id: Optional[int] = None,
+) -> Dict[int, List[Conflict]]:
+    """
+    Active contracts of each worker that overlap the proposed schedule, as
+    {worker_id: [Conflict, ...]}; workers without conflicts are absent.
+    """
+    from django.contrib.auth import get_user_model
+    from .models import Contract, Job
+
+    worker_ids = list(worker_ids)
+    if not worker_ids or start_date is None:
+        return {}
+
+    params = {
+        'worker_ids': worker_ids,
+        'start': start_date,
+        'end': effective_end_date(start_date, end_date),
+    }
+    # Proposed hours that are missing or wrap midnight count as all day
+    times_clause = ''
+    if start_time and end_time and start_time < end_time:
+        times_clause = TIMES_CLAUSE
+        params.update(start_time=start_time, end_time=end_time)
+    exclude_clause = ''
+    if exclude_contract_id:
+        exclude_clause = EXCLUDE_CLAUSE
+        params['exclude_id'] = int(exclude_contract_id)
+
+    sql = CONFLICT_SQL.format(
+        contract_table=connection.ops.quote_name(Contract._meta.db_table),
+        job_table=connection.ops.quote_name(Job._meta.db_table),
+        user_table=connection.ops.quote_name(get_user_model()._meta.db_table),
+        statuses=', '.join(f"'{status}'" for status in ACTIVE_CONTRACT_STATUSES),
+        times_clause=times_clause,
+        exclude_clause=exclude_clause,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    conflicts = {}
+    for row in rows:
+        conflict = Conflict(*row)  # Column order matches the dataclass
+        conflicts.setdefault(conflict.worker_id, []).append(conflict)
+    return conflicts
+
+
+def worker_conflicts(worker_id, start_date, end_date=None, start_time=None,
+                     end_time=None, exclude_contract_id=None) -> List[Conflict]:
+    """find_conflicts for a single worker, as a list."""
+    return find_conflicts(
+        [worker_id], start_date, end_date, start_time, end_time, exclude_contract_id
+    ).get(worker_id, [])
+
+
+def conflicting_worker_ids(worker_ids, start_date, end_date=None, start_time=None, end_time=None):
+    """Ids of the candidate workers who are already booked for the schedule."""
+    return set(find_conflicts(worker_ids, start_date, end_date, start_time, end_time))
@@ -4,7 +4,12 @@ Schedule management and conflict detection utilities for worker contracts.
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
 from django.db.models import Q
+
+import numpy as np
+
+from .calendar_events import window_contracts
 from .models import Contract
+from .schedule_conflicts import Conflict, worker_conflicts
 
 
 def check_schedule_conflicts(
@@ -14,96 +19,41 @@ def check_schedule_conflicts(
     start_time: Optional[datetime.time] = None,
     end_time: Optional[datetime.time] = None,
     exclude_contract_id: Optional[int] = None
-) -> Tuple[bool, List[Contract], str]:
+) -> Tuple[bool, List[Conflict], str]:
     """
     Check if a new contract conflicts with existing active contracts.
-    Priority: Check TIME conflicts first (most important), then date overlap.
+    Dates and daily hours must both overlap; see jobs.schedule_conflicts.
     
     Args:
         worker_id: ID of the worker
         start_date: Proposed start date
-        end_date: Proposed end date (optional)
-        start_time: Proposed daily start time (optional)
+        end_date: Proposed end date (optional, ongoing for 30 days if omitted)
+        start_time: Proposed daily start time (optional, all day if omitted)
         end_time: Proposed daily end time (optional)
         exclude_contract_id: Contract ID to exclude from check (for updates)
     
     Returns:
-        Tuple of (has_conflict, conflicting_contracts, warning_message)
+        Tuple of (has_conflict, conflicts, warning_message)
     """
-    # Get active contracts for the worker
-    active_contracts = Contract.objects.filter(
-        worker_id=worker_id,
-        status__in=['Finalized', 'In Progress', 'Awaiting Review']
-    ).exclude(
-        start_date__isnull=True
+    conflicts = worker_conflicts(
+        worker_id, start_date, end_date, start_time, end_time, exclude_contract_id
     )
     
-    if exclude_contract_id:
-        active_contracts = active_contracts.exclude(id=exclude_contract_id)
-    
-    conflicting_contracts = []
-    
-    for contract in active_contracts:
-        # Check for overlap
-        contract_start = contract.start_date
-        contract_end = contract.end_date
-        
-        # If no end date specified, assume ongoing (30 days buffer)
-        if not end_date:
-            check_end = start_date + timedelta(days=30)
-        else:
-            check_end = end_date
-        
-        # First check: Do dates overlap?
-        dates_overlap = False
-        
-        if not contract_end:
-            # Ongoing contract - check if new contract starts before or during
-            if start_date <= contract_start + timedelta(days=30):
-                dates_overlap = True
-        else:
-            # Check for date range overlap
-            if (start_date <= contract_end and check_end >= contract_start):
-                dates_overlap = True
-        
-        # Only check time conflicts if dates overlap AND both contracts have times
-        if dates_overlap:
-            if start_time and end_time and contract.start_time and contract.end_time:
-                # PRIORITY: Check if times overlap
-                # Times overlap if: start_time < other.end_time AND end_time > other.start_time
-                times_overlap = (start_time < contract.end_time and end_time > contract.start_time)
-                
-                if times_overlap:
-                    # TRUE CONFLICT: Same dates AND overlapping times
-                    conflicting_contracts.append(contract)
-                # else: Same dates but different times = NO CONFLICT
-            else:
-                # No times specified = assume conflict (conservative approach)
-                conflicting_contracts.append(contract)
-    
-    has_conflict = len(conflicting_contracts) > 0
-    
-    if has_conflict:
-        conflict_details = []
-        for contract in conflicting_contracts:
-            end_str = contract.end_date.strftime('%b %d, %Y') if contract.end_date else 'Ongoing'
-            time_str = ""
-            if contract.start_time and contract.end_time:
-                time_str = f" • {contract.start_time.strftime('%I:%M %p')} - {contract.end_time.strftime('%I:%M %p')}"
-            conflict_details.append(
-                f"{contract.job.title} ({contract.start_date.strftime('%b %d, %Y')} - {end_str}){time_str}"
-            )
-        
+    if conflicts:
+        conflict_details = [
+            f"{conflict.job_title} ({conflict.dates}) • {conflict.times}"
+            for conflict in conflicts
+        ]
         warning_message = (
             f"⚠️ Time Conflict Detected!\n\n"
-            f"This contract has time conflicts with {len(conflicting_contracts)} existing contract(s):\n"
+            f"This contract has time conflicts with {len(conflicts)} existing contract(s):\n"
             f"• " + "\n• ".join(conflict_details) + "\n\n"
             f"The work hours overlap on the same dates. Please adjust the schedule or work times."
         )
     else:
         warning_message = ""
     
-    return has_conflict, conflicting_contracts, warning_message
+    return bool(conflicts), conflicts, warning_message
 
 
 def get_worker_schedule(worker_id: int, start_date: datetime.date, end_date: datetime.date) -> List[Dict]:
@@ -118,15 +68,7 @@ def get_worker_schedule(worker_id: int, start_date: datetime.date, end_date: dat
     Returns:
         List of contract dictionaries with schedule info
     """
-    contracts = Contract.objects.filter(
-        worker_id=worker_id,
-        status__in=['Finalized', 'In Progress', 'Awaiting Review', 'Completed']
-    ).exclude(
-        start_date__isnull=True
-    ).filter(
-        Q(start_date__lte=end_date) &
-        (Q(end_date__gte=start_date) | Q(end_date__isnull=True))
-    ).select_related('job', 'client').order_by('start_date')
+    contracts = window_contracts(worker_id, start_date, end_date)
     
     # Vibrant, contrasting colors for different contracts
     vibrant_colors = [
@@ -237,6 +179,69 @@ def get_upcoming_deadlines(worker_id: int, days_ahead: int = 7) -> List[Dict]:
     return deadlines
 
 
+# Contracts that count towards a worker's workload
+WORKLOAD_STATUSES = ['In Progress', 'Awaiting Review']
+
+# Longest range workload_range answers in one call
+MAX_WORKLOAD_DAYS = 366
+
+
+def workload_level(contract_count: int) -> Tuple[str, str]:
+    """(level, message) for a number of concurrent contracts."""
+    if contract_count == 0:
+        return 'none', 'No active contracts'
+    if contract_count == 1:
+        return 'light', '1 active contract'
+    if contract_count == 2:
+        return 'moderate', '2 active contracts'
+    return 'heavy', f'{contract_count} active contracts'
+
+
+def workload_range(worker_id: int, start_date: datetime.date, end_date: datetime.date) -> Dict:
+    """
+    Calculate workload for every day of an inclusive date range.
+
+    Contracts overlapping the range are fetched in one query; per-day
+    counts come from a difference array (+1 on a contract's first day in
+    range, -1 after its last) and a cumulative sum. Contracts without an
+    end date count until the end of the range.
+
+    Returns:
+        Dictionary with 'days' (date, contract_count, level, message per day)
+        and the overlapping 'contracts'
+    """
+    days = (end_date - start_date).days + 1
+    if days <= 0:
+        return {'start': start_date, 'end': end_date, 'days': [], 'contracts': []}
+
+    contracts = list(Contract.objects.filter(
+        worker_id=worker_id,
+        status__in=WORKLOAD_STATUSES,
+        start_date__lte=end_date,
+    ).filter(
+        Q(end_date__gte=start_date) | Q(end_date__isnull=True)
+    ).order_by('start_date').values('id', 'job__title', 'client__username', 'start_date', 'end_date'))
+
+    diff = np.zeros(days + 1, dtype=np.int32)
+    for contract in contracts:
+        first = max((contract['start_date'] - start_date).days, 0)
+        last = min((contract['end_date'] - start_date).days, days - 1) if contract['end_date'] else days - 1
+        diff[first] += 1
+        diff[last + 1] -= 1
+    counts = np.cumsum(diff[:-1]).tolist()
+
+    workload = []
+    for offset, count in enumerate(counts):
+        level, message = workload_level(count)
+        workload.append({
+            'date': start_date + timedelta(days=offset),
+            'contract_count': count,
+            'level': level,
+            'message': message,
+        })
+    return {'start': start_date, 'end': end_date, 'days': workload, 'contracts': contracts}
+
+
 def calculate_workload(worker_id: int, date: datetime.date) -> Dict:
     """
     Calculate workload for a specific date.
@@ -248,34 +253,12 @@ def calculate_workload(worker_id: int, date: datetime.date) -> Dict:
     Returns:
         Dictionary with workload info
     """
-    active_contracts = Contract.objects.filter(
-        worker_id=worker_id,
-        status__in=['In Progress', 'Awaiting Review'],
-        start_date__lte=date
-    ).filter(
-        Q(end_date__gte=date) | Q(end_date__isnull=True)
-    ).select_related('job', 'client')
-    
-    contract_count = active_contracts.count()
-    
-    # Determine workload level
-    if contract_count == 0:
-        level = 'none'
-        message = 'No active contracts'
-    elif contract_count == 1:
-        level = 'light'
-        message = '1 active contract'
-    elif contract_count == 2:
-        level = 'moderate'
-        message = '2 active contracts'
-    else:
-        level = 'heavy'
-        message = f'{contract_count} active contracts'
-    
+    workload = workload_range(worker_id, date, date)
+    day = workload['days'][0]
     return {
-        'date': date,
-        'contract_count': contract_count,
-        'level': level,
-        'message': message,
-        'contracts': list(active_contracts.values('id', 'job__title', 'client__username'))
+        **day,
+        'contracts': [
+            {key: contract[key] for key in ('id', 'job__title', 'client__username')}
+            for contract in workload['contracts']
+        ],
     }
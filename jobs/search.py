@@ -0,0 +1,73 @@
+"""
+Full-text job search.
+
+Job.search_vector is kept up to date by a database trigger (see migration
+0027_job_search_vector) and covers the English and Tagalog variants of
+title, tasks, required_skills and description, plus the address, category
+and owner name. English text is stemmed with the 'english' configuration;
+Tagalog has no Postgres dictionary so it is indexed with 'simple'.
+
+Misspelled municipality/barangay names fall back to trigram similarity
+(pg_trgm's `%` operator, default threshold 0.3).
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from rest_framework import filters
+
+
+def build_search_query(keyword):
+    """Match the keyword against both the stemmed and unstemmed lexemes."""
+    return (
+        SearchQuery(keyword, config='english', search_type='websearch')
+        | SearchQuery(keyword, config='simple', search_type='websearch')
+    )
+
+
+def search_jobs(queryset, keyword):
+    """
+    Filter a Job queryset by a free-text keyword and annotate `rank`.
+
+    Callers decide whether to order by rank; JobListView does so unless the
+    user picked another sort.
+    """
+    keyword = (keyword or '').strip()
+    if not keyword:
+        return queryset
+
+    query = build_search_query(keyword)
+    location_similarity = Greatest(
+        TrigramSimilarity('municipality', keyword),
+        TrigramSimilarity('barangay', keyword),
+    )
+    return queryset.annotate(
+        rank=SearchRank(F('search_vector'), query) + location_similarity,
+    ).filter(
+        Q(search_vector=query)
+        | Q(municipality__trigram_similar=keyword)
+        | Q(barangay__trigram_similar=keyword)
+    )
+
+
+class JobSearchFilter(filters.BaseFilterBackend):
+    """
+    DRF filter backend for full-text job search.
+
+    Reads `q` like the HTML job list (and `search` for older API clients)
+    and orders by relevance unless an explicit `ordering` was requested.
+    """
+
+    search_params = ('q', 'search')
+
+    def filter_queryset(self, request, queryset, view):
+        keyword = next(
+            (request.query_params[p] for p in self.search_params if request.query_params.get(p)),
+            None,
+        )
+        if not keyword:
+            return queryset
+
+        queryset = search_jobs(queryset, keyword)
+        if not request.query_params.get('ordering'):
+            queryset = queryset.order_by('-rank', '-created_at')
+        return queryset
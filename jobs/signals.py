@@ -1,9 +1,76 @@
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from jobs.models import JobApplication, Contract
+from jobs.models import Job, JobApplication, JobOffer, Contract, InterviewSchedule, WorkerAvailability
+from services.models import ServicePost
 from notifications.models import Notification
 from datetime import datetime, timedelta
 from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Job)
+def schedule_job_expiry_trigger(sender, instance, **kwargs):
+    """Queue an exact-time expiry trigger when a job is about to expire."""
+    update_fields = kwargs.get('update_fields')
+    if update_fields and not {'expires_at', 'is_active'} & set(update_fields):
+        return
+    if not instance.is_active or not instance.expires_at:
+        return
+
+    from django.db import transaction
+    from .tasks_expiry import schedule_job_expiry
+
+    def _dispatch():
+        try:
+            schedule_job_expiry(instance)
+        except Exception:
+            logger.exception(f"Error scheduling expiry for job {instance.pk}")
+
+    transaction.on_commit(_dispatch)
+
+
+# Fields that change whether/where a marker appears on the map
+MAP_FIELDS = {'is_active', 'location', 'expires_at', 'category'}
+
+
+def _map_columns(sender):
+    return [f.attname for f in sender._meta.concrete_fields if f.name in MAP_FIELDS]
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_save, sender=ServicePost)
+def snapshot_map_fields(sender, instance, update_fields=None, **kwargs):
+    """Remember a row's marker columns so edits that leave the marker alone keep the tile cache."""
+    if instance._state.adding or (update_fields and not MAP_FIELDS & set(update_fields)):
+        return
+    instance._map_before = sender._base_manager.filter(pk=instance.pk).values(*_map_columns(sender)).first()
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=ServicePost)
+def invalidate_map_clusters_on_save(sender, instance, created, **kwargs):
+    """Drop cached map cluster tiles when a marker appears, moves or disappears."""
+    if not created:
+        if '_map_before' not in instance.__dict__:
+            return
+        before = instance.__dict__.pop('_map_before')
+        if before is not None and all(getattr(instance, column) == value for column, value in before.items()):
+            return
+
+    from django.db import transaction
+    from .map_clusters import bump_map_version
+    transaction.on_commit(bump_map_version)
+
+
+@receiver(post_delete, sender=Job)
+@receiver(post_delete, sender=ServicePost)
+def invalidate_map_clusters_on_delete(sender, instance, **kwargs):
+    from django.db import transaction
+    from .map_clusters import bump_map_version
+    transaction.on_commit(bump_map_version)
+
 
 @receiver(post_save, sender=JobApplication)
 def notify_job_owner_on_application(sender, instance, created, **kwargs):
@@ -29,6 +96,102 @@ def notify_job_owner_on_application(sender, instance, created, **kwargs):
         )
 
 
+@receiver(post_save, sender=JobApplication)
+def drop_recommendation_on_application(sender, instance, created, **kwargs):
+    """A job the worker applied to is no longer a recommendation."""
+    if created:
+        from jobs.models import WorkerRecommendation
+        WorkerRecommendation.objects.filter(worker_id=instance.worker_id, job_id=instance.job_id).delete()
+
+
+def _tracks_summary(sender, update_fields):
+    from .activity_summary import TRACKED_FIELDS
+    return not update_fields or bool(TRACKED_FIELDS[sender.__name__] & set(update_fields))
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_save, sender=JobApplication)
+@receiver(pre_save, sender=Contract)
+@receiver(pre_save, sender=JobOffer)
+def snapshot_activity_counters(sender, instance, update_fields=None, **kwargs):
+    """Remember the counted columns of a row before it changes."""
+    if not instance._state.adding and _tracks_summary(sender, update_fields):
+        from .activity_summary import snapshot
+        instance._activity_before = snapshot(sender, instance.pk)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=JobApplication)
+@receiver(post_save, sender=Contract)
+@receiver(post_save, sender=JobOffer)
+def update_activity_counters(sender, instance, created, update_fields=None, **kwargs):
+    """Apply the change in counted columns to the affected users' UserActivitySummary."""
+    if not _tracks_summary(sender, update_fields):
+        return
+    if not created and '_activity_before' not in instance.__dict__:
+        return
+    from .activity_summary import apply_deltas, diff, snapshot
+    before = instance.__dict__.pop('_activity_before', None)
+    deltas = diff(sender.__name__, before, snapshot(sender, instance.pk))
+    if deltas:
+        apply_deltas(deltas)
+
+
+@receiver(pre_delete, sender=Job)
+@receiver(pre_delete, sender=JobApplication)
+@receiver(pre_delete, sender=Contract)
+@receiver(pre_delete, sender=JobOffer)
+def snapshot_activity_counters_on_delete(sender, instance, **kwargs):
+    from .activity_summary import snapshot
+    instance._activity_before = snapshot(sender, instance.pk)
+
+
+@receiver(post_delete, sender=Job)
+@receiver(post_delete, sender=JobApplication)
+@receiver(post_delete, sender=Contract)
+@receiver(post_delete, sender=JobOffer)
+def update_activity_counters_on_delete(sender, instance, **kwargs):
+    from .activity_summary import apply_deltas, diff
+    deltas = diff(sender.__name__, instance.__dict__.pop('_activity_before', None), None)
+    if deltas:
+        # Never create rows here: the user may be the one being deleted
+        apply_deltas(deltas, create_missing=False)
+
+
+@receiver(post_save, sender=WorkerAvailability)
+@receiver(post_delete, sender=WorkerAvailability)
+def invalidate_availability_bitmap(sender, instance, **kwargs):
+    """Drop the worker's cached weekly availability bitmap after an edit."""
+    from django.db import transaction
+    from .availability import invalidate_availability
+    # Again after commit, in case a reader re-cached the old rows meanwhile
+    invalidate_availability(instance.worker_id)
+    transaction.on_commit(lambda: invalidate_availability(instance.worker_id))
+
+
+@receiver(post_save, sender=Contract)
+@receiver(post_delete, sender=Contract)
+def bump_contract_calendar_version(sender, instance, **kwargs):
+    """Drop both parties' cached calendar windows after a contract change."""
+    from django.db import transaction
+    from .calendar_events import bump_schedule_version
+    # After commit, so a concurrent reader can't cache pre-commit rows under the new version
+    user_ids = (instance.worker_id, instance.client_id)
+    transaction.on_commit(lambda: bump_schedule_version(*user_ids))
+
+
+@receiver(post_save, sender=InterviewSchedule)
+@receiver(post_delete, sender=InterviewSchedule)
+def bump_interview_calendar_version(sender, instance, **kwargs):
+    """Drop the applicant's and the employer's cached calendar windows."""
+    from django.db import transaction
+    from .calendar_events import bump_schedule_version
+    application = JobApplication.objects.filter(pk=instance.application_id).values('worker_id', 'job__owner_id').first()
+    if application:
+        user_ids = (application['worker_id'], application['job__owner_id'])
+        transaction.on_commit(lambda: bump_schedule_version(*user_ids))
+
+
 @receiver(post_save, sender=Contract)
 def notify_contract_schedule_updates(sender, instance, created, **kwargs):
     """Notify users about contract schedule-related events"""
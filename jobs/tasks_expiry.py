@@ -0,0 +1,90 @@
+"""
+Celery tasks for deactivating job postings when they expire.
+
+A beat-scheduled sweep deactivates anything overdue and queues exact-time
+ETA triggers for jobs expiring before the next sweep. Keeping ETAs inside
+one sweep interval avoids long-lived ETA messages being redelivered by the
+Redis broker's visibility timeout.
+"""
+from celery import shared_task
+from datetime import timedelta
+from django.core.cache import cache
+from django.utils import timezone
+from jobs.activity_summary import rebuild_summaries
+from jobs.map_clusters import bump_map_version
+from jobs.models import Job
+from Trabaholink.cache import release_lock
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Must match the beat schedule for 'sweep-expired-jobs' in Trabaholink/celery.py
+EXPIRY_SWEEP_INTERVAL = timedelta(minutes=15)
+
+EXPIRY_LOCK_KEY = 'lock:sweep_expired_jobs'
+EXPIRY_LOCK_TIMEOUT = 600
+
+
+def schedule_job_expiry(job):
+    """Queue an exact-time trigger if the job expires before the next sweep."""
+    if not job.is_active or not job.expires_at:
+        return False
+
+    now = timezone.now()
+    if job.expires_at > now + EXPIRY_SWEEP_INTERVAL:
+        return False  # The sweep that runs closer to the deadline will schedule it
+
+    expire_job.apply_async(args=[job.pk], eta=max(job.expires_at, now))
+    return True
+
+
+@shared_task(ignore_result=True)
+def expire_job(job_id):
+    """Deactivate a single job at its expires_at (no-op if it was extended or closed)."""
+    count = Job.objects.filter(
+        pk=job_id,
+        is_active=True,
+        expires_at__lte=timezone.now()
+    ).update(is_active=False)
+
+    if count:
+        bump_map_version()
+        rebuild_summaries(list(Job.objects.filter(pk=job_id).values_list('owner_id', flat=True)))
+        logger.info(f"Job {job_id} expired and was deactivated")
+    return count
+
+
+@shared_task
+def sweep_expired_jobs():
+    """
+    Deactivate overdue jobs and schedule triggers for the next interval.
+
+    Guarded by a cache lock so only one worker runs the sweep at a time.
+    """
+    token = uuid.uuid4().hex
+    if not cache.add(EXPIRY_LOCK_KEY, token, timeout=EXPIRY_LOCK_TIMEOUT):
+        logger.info("Expired job sweep already running elsewhere, skipping")
+        return {'success': False, 'reason': 'locked'}
+
+    try:
+        deactivated = Job.deactivate_expired_jobs()
+        if deactivated:
+            bump_map_version()
+
+        now = timezone.now()
+        upcoming = Job.objects.filter(
+            is_active=True,
+            expires_at__gt=now,
+            expires_at__lte=now + EXPIRY_SWEEP_INTERVAL
+        ).values_list('pk', 'expires_at')
+
+        scheduled = 0
+        for job_id, expires_at in upcoming:
+            expire_job.apply_async(args=[job_id], eta=expires_at)
+            scheduled += 1
+
+        logger.info(f"Expired job sweep: {deactivated} deactivated, {scheduled} triggers scheduled")
+        return {'success': True, 'deactivated': deactivated, 'scheduled': scheduled}
+    finally:
+        release_lock(cache, EXPIRY_LOCK_KEY, token)
@@ -0,0 +1,169 @@
+"""
+Celery tasks for fanning out new-job notifications to nearby workers.
+"""
+from celery import shared_task
+from django.db.models import BooleanField, Exists, FloatField, Max, OuterRef, Q
+from django.db.models.expressions import RawSQL
+from geo.haversine import bounding_box, parse_point, rank_by_distance
+from jobs.models import Job
+from notifications.models import Notification
+from users.models import NotificationPreference
+from utils_gis import gis_enabled
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of notifications written (and pushed) per round-trip
+FANOUT_CHUNK_SIZE = 1000
+
+
+def get_matching_preferences(job, skip_notified=False):
+    """
+    Return (user_id, distance_m) rows for every worker who should hear about `job`.
+
+    Everything is decided in a single PostGIS query:
+    - per-preference radius via ST_DWithin on geography (metres)
+    - category match via EXISTS on the preferred_categories join table
+      (no preferred categories = worker accepts all categories)
+    - with skip_notified, workers already notified about this job are
+      excluded so a retried fanout does not send duplicates
+
+    Without PostGIS (see utils_gis.gis_enabled) the category/notified
+    filters and a bounding box on the notification_latitude/longitude
+    columns stay in SQL and the exact radius check runs in geo.haversine;
+    the result is then a list rather than a queryset.
+    """
+    through = NotificationPreference.preferred_categories.through
+    general_category_id = job.category.general_category_id if job.category else None
+
+    has_categories = Exists(through.objects.filter(notificationpreference_id=OuterRef('pk')))
+    category_match = Q(~has_categories)
+    if general_category_id:
+        category_match |= Q(Exists(through.objects.filter(
+            notificationpreference_id=OuterRef('pk'),
+            generalcategory_id=general_category_id,
+        )))
+
+    preferences = (
+        NotificationPreference.objects
+        .filter(is_active=True, notification_location__isnull=False, user__role='worker')
+        .exclude(user_id=job.owner_id)
+        .filter(category_match)
+    )
+    if skip_notified:
+        preferences = preferences.exclude(Exists(Notification.objects.filter(
+            user_id=OuterRef('user_id'),
+            notif_type="job_post",
+            object_id=job.pk,
+        )))
+
+    if not gis_enabled():
+        return _match_preferences_haversine(job, preferences)
+
+    lat, lng = job_coordinates(job)
+    job_point = f'SRID=4326;POINT({lng} {lat})'
+    within_radius = RawSQL(
+        "ST_DWithin(users_notificationpreference.notification_location::geography, "
+        "%s::geography, users_notificationpreference.notification_radius_km * 1000)",
+        (job_point,),
+        output_field=BooleanField(),
+    )
+    distance_m = RawSQL(
+        "ST_Distance(users_notificationpreference.notification_location::geography, %s::geography)",
+        (job_point,),
+        output_field=FloatField(),
+    )
+
+    return (
+        preferences
+        .filter(within_radius)
+        .annotate(distance_m=distance_m)
+        .values_list('user_id', 'distance_m')
+        .order_by()
+    )
+
+
+def job_coordinates(job):
+    """(lat, lng) of a job from its float columns or its location, or None."""
+    if job.latitude is not None and job.longitude is not None:
+        return job.latitude, job.longitude
+    return parse_point(job.location)
+
+
+def _match_preferences_haversine(job, preferences):
+    """
+    Radius check for non-GIS deployments. Only preferences inside the
+    bounding box of the widest matching radius are loaded; each one's own
+    radius is then applied in one vectorized pass.
+    """
+    coords = job_coordinates(job)
+    if not coords:
+        return []
+    widest_km = preferences.aggregate(widest=Max('notification_radius_km'))['widest']
+    if not widest_km:
+        return []
+    min_lat, max_lat, min_lng, max_lng = bounding_box(*coords, float(widest_km))
+    candidates = preferences.filter(
+        notification_latitude__range=(min_lat, max_lat),
+        notification_longitude__range=(min_lng, max_lng),
+    ).values_list('user_id', 'notification_latitude', 'notification_longitude', 'notification_radius_km')
+    rows = [
+        (user_id, lat, lng, float(radius_km))
+        for user_id, lat, lng, radius_km in candidates.iterator(chunk_size=FANOUT_CHUNK_SIZE)
+    ]
+    return [(user_id, km * 1000) for user_id, km in rank_by_distance(rows, *coords)]
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def fanout_new_job_notifications(self, job_id):
+    """
+    Notify every matching worker about a newly posted job.
+
+    Dispatched from the Job post_save signal so the request path only pays
+    for enqueueing. Matching happens in one query and notifications are
+    written through Notification.objects.bulk_notify in chunks of
+    FANOUT_CHUNK_SIZE (which also honours NotificationSettings).
+    """
+    try:
+        job = Job.objects.select_related('category').get(pk=job_id)
+    except Job.DoesNotExist:
+        logger.warning(f"[NOTIFICATION] Job {job_id} no longer exists, skipping fanout")
+        return {'success': False, 'reason': 'Job not found'}
+
+    if not job_coordinates(job) or not job.is_active:
+        return {'success': True, 'sent': 0}
+
+    category_name = job.category.name if job.category else ''
+    matches = get_matching_preferences(job, skip_notified=self.request.retries > 0)
+    sent = 0
+    distances = {}
+
+    def _flush():
+        created = Notification.objects.bulk_notify(
+            list(distances),
+            "job_post",
+            lambda user_id: f"🎯 New job: '{job.title}' posted {distances[user_id] / 1000:.1f}km from your location! {category_name}",
+            object_id=job.pk,
+            batch_size=FANOUT_CHUNK_SIZE,
+        )
+        distances.clear()
+        return len(created)
+
+    try:
+        rows = matches.iterator(chunk_size=FANOUT_CHUNK_SIZE) if hasattr(matches, 'iterator') else matches
+        for user_id, distance_m in rows:
+            distances[user_id] = distance_m
+            if len(distances) >= FANOUT_CHUNK_SIZE:
+                sent += _flush()
+
+        if distances:
+            sent += _flush()
+    except Exception as exc:
+        logger.exception(f"[NOTIFICATION] Fanout failed for job {job_id} after {sent} notifications")
+        raise self.retry(exc=exc)
+
+    logger.info(f"[NOTIFICATION] Job {job_id} fanout complete: {sent} workers notified")
+
+    from jobs.tasks_recommendations import recommend_new_job
+    recommend_new_job.delay(job.pk)
+    return {'success': True, 'sent': sent}
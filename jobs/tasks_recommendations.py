@@ -0,0 +1,123 @@
+"""
+Celery tasks that precompute worker job recommendations.
+
+- refresh_worker_recommendations: periodic full rebuild of every recently
+  active worker's top-N list against the newest open jobs
+- recommend_new_job: incremental; scores one new job for the workers it
+  was fanned out to and merges it into their lists
+
+Scoring lives in jobs.recommendations.
+"""
+from celery import shared_task
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+import logging
+
+import numpy as np
+
+from jobs.models import Job, JobApplication, WorkerRecommendation
+from jobs.recommendations import (CANDIDATE_LIMIT, TOP_N, active_jobs, load_candidates,
+                                  load_profiles, score_candidates)
+from users.models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+REFRESH_BATCH_SIZE = 200
+
+# Workers who have not logged in for this long are skipped by the full refresh
+ACTIVE_WORKER_WINDOW = timedelta(days=30)
+
+
+def _recommendation_rows(worker_id, candidates, scores, distances, limit=TOP_N):
+    """WorkerRecommendation objects for the worker's best `limit` positive scores."""
+    order = np.argsort(-scores, kind='stable')[:limit]
+    rows = []
+    for i in order:
+        if scores[i] <= 0:
+            break
+        distance = distances[i]
+        rows.append(WorkerRecommendation(
+            worker_id=worker_id,
+            job_id=candidates.ids[i],
+            score=float(scores[i]),
+            distance_km=None if np.isnan(distance) else float(distance),
+        ))
+    return rows
+
+
+def trim_recommendations(worker_ids):
+    """Keep only each worker's TOP_N highest scores."""
+    overflow = WorkerRecommendation.objects.filter(worker_id__in=worker_ids).annotate(
+        rank=Window(RowNumber(), partition_by=[F('worker_id')], order_by=F('score').desc())
+    ).filter(rank__gt=TOP_N).values_list('pk', flat=True)
+    WorkerRecommendation.objects.filter(pk__in=list(overflow)).delete()
+
+
+@shared_task(ignore_result=True)
+def refresh_worker_recommendations(worker_ids=None):
+    """Rebuild recommendation lists for the given (or all recently active) workers."""
+    if worker_ids is None:
+        worker_ids = list(CustomUser.objects.filter(
+            role='worker',
+            is_active=True,
+            last_login__gte=timezone.now() - ACTIVE_WORKER_WINDOW,
+        ).values_list('pk', flat=True))
+
+    candidates = load_candidates(active_jobs().order_by('-created_at')[:CANDIDATE_LIMIT])
+    index = {job_id: i for i, job_id in enumerate(candidates.ids)}
+    stored = 0
+
+    for start in range(0, len(worker_ids), REFRESH_BATCH_SIZE):
+        batch = worker_ids[start:start + REFRESH_BATCH_SIZE]
+        profiles = load_profiles(batch)
+
+        applied = {}
+        for worker_id, job_id in JobApplication.objects.filter(
+            worker_id__in=batch, job_id__in=candidates.ids
+        ).values_list('worker_id', 'job_id'):
+            applied.setdefault(worker_id, []).append(index[job_id])
+
+        rows = []
+        for worker_id in batch:
+            scores, distances = score_candidates(profiles[worker_id], candidates)
+            if worker_id in applied:
+                scores[applied[worker_id]] = -1.0
+            rows.extend(_recommendation_rows(worker_id, candidates, scores, distances))
+
+        with transaction.atomic():
+            WorkerRecommendation.objects.filter(worker_id__in=batch).delete()
+            WorkerRecommendation.objects.bulk_create(rows, batch_size=1000)
+        stored += len(rows)
+
+    logger.info(f"Recommendations refreshed for {len(worker_ids)} workers ({stored} rows)")
+    return {'workers': len(worker_ids), 'rows': stored}
+
+
+@shared_task(ignore_result=True)
+def recommend_new_job(job_id):
+    """Merge a newly posted job into the lists of the workers it matches."""
+    from jobs.tasks_notifications import get_matching_preferences
+
+    try:
+        job = Job.objects.select_related('category').get(pk=job_id, is_active=True)
+    except Job.DoesNotExist:
+        return {'workers': 0}
+
+    worker_ids = [user_id for user_id, _ in get_matching_preferences(job)]
+    candidates = load_candidates(Job.objects.filter(pk=job_id))
+
+    for start in range(0, len(worker_ids), REFRESH_BATCH_SIZE):
+        batch = worker_ids[start:start + REFRESH_BATCH_SIZE]
+        profiles = load_profiles(batch)
+        rows = []
+        for worker_id in batch:
+            scores, distances = score_candidates(profiles[worker_id], candidates)
+            rows.extend(_recommendation_rows(worker_id, candidates, scores, distances, limit=1))
+        with transaction.atomic():
+            WorkerRecommendation.objects.bulk_create(rows, ignore_conflicts=True)
+            trim_recommendations(batch)
+
+    return {'workers': len(worker_ids)}
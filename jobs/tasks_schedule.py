@@ -2,10 +2,9 @@
 Celery tasks for contract schedule notifications and reminders.
 """
 from celery import shared_task
-from datetime import datetime, timedelta
 from django.utils import timezone
-from django.db.models import Q
 from jobs.models import Contract
+from jobs.reminders import send_due_reminders
 from notifications.models import Notification
 import logging
 
@@ -15,109 +14,27 @@ logger = logging.getLogger(__name__)
 @shared_task
 def send_daily_schedule_reminders():
     """
-    Daily task to check contracts and send reminders for:
+    Daily task sending day-ahead reminders (see jobs.reminders):
     - Contracts starting tomorrow
     - Contracts ending in 3 days
     - Contracts ending tomorrow
+    - Interviews tomorrow
+
+    Each reminder is sent once per occurrence, so re-running the task the
+    same day sends nothing new.
     """
-    today = timezone.now().date()
-    tomorrow = today + timedelta(days=1)
-    three_days = today + timedelta(days=3)
-    
+    today = timezone.localdate()
     logger.info(f"Running daily schedule reminders for {today}")
-    
-    # Get active contracts
-    active_contracts = Contract.objects.filter(
-        status__in=['Accepted', 'In Progress', 'Finalized', 'Awaiting Review']
-    ).select_related('worker', 'client', 'job')
-    
-    # Contracts starting tomorrow
-    starting_tomorrow = active_contracts.filter(start_date=tomorrow)
-    
-    for contract in starting_tomorrow:
-        # Check if notification already sent today
-        existing_notification = Notification.objects.filter(
-            user=contract.worker,
-            object_id=contract.id,
-            notif_type="schedule_reminder",
-            created_at__date=today
-        ).exists()
-        
-        if not existing_notification:
-            Notification.objects.create(
-                user=contract.worker,
-                notif_type="schedule_reminder",
-                object_id=contract.id,
-                message=f"⏰ Reminder: Your contract '{contract.job.title}' starts tomorrow ({contract.start_date.strftime('%b %d, %Y')}). Get ready!",
-            )
-            
-            Notification.objects.create(
-                user=contract.client,
-                notif_type="schedule_reminder",
-                object_id=contract.id,
-                message=f"⏰ Reminder: Contract with {contract.worker.get_full_name() or contract.worker.username} for '{contract.job.title}' starts tomorrow.",
-            )
-            
-            logger.info(f"Sent start reminder for contract {contract.id}")
-    
-    # Contracts ending in 3 days
-    ending_in_three = active_contracts.filter(end_date=three_days)
-    
-    for contract in ending_in_three:
-        existing_notification = Notification.objects.filter(
-            user=contract.worker,
-            object_id=contract.id,
-            notif_type="schedule_deadline",
-            created_at__date=today,
-            message__contains="3 days"
-        ).exists()
-        
-        if not existing_notification:
-            Notification.objects.create(
-                user=contract.worker,
-                notif_type="schedule_deadline",
-                object_id=contract.id,
-                message=f"⏳ Deadline Alert: Your contract '{contract.job.title}' ends in 3 days ({contract.end_date.strftime('%b %d, %Y')}). Please complete all work.",
-            )
-            
-            logger.info(f"Sent 3-day deadline reminder for contract {contract.id}")
-    
-    # Contracts ending tomorrow
-    ending_tomorrow = active_contracts.filter(end_date=tomorrow)
-    
-    for contract in ending_tomorrow:
-        existing_notification = Notification.objects.filter(
-            user=contract.worker,
-            object_id=contract.id,
-            notif_type="schedule_deadline",
-            created_at__date=today,
-            message__contains="tomorrow"
-        ).exists()
-        
-        if not existing_notification:
-            Notification.objects.create(
-                user=contract.worker,
-                notif_type="schedule_deadline",
-                object_id=contract.id,
-                message=f"🚨 Urgent: Your contract '{contract.job.title}' ends tomorrow! Please ensure all deliverables are submitted.",
-            )
-            
-            Notification.objects.create(
-                user=contract.client,
-                notif_type="schedule_deadline",
-                object_id=contract.id,
-                message=f"🚨 Reminder: Contract with {contract.worker.get_full_name() or contract.worker.username} for '{contract.job.title}' ends tomorrow.",
-            )
-            
-            logger.info(f"Sent urgent deadline reminder for contract {contract.id}")
-    
-    logger.info(f"Daily schedule reminders completed. Start: {starting_tomorrow.count()}, End-3d: {ending_in_three.count()}, End-1d: {ending_tomorrow.count()}")
-    
+
+    sent = send_due_reminders(today)
+
+    logger.info(f"Daily schedule reminders completed: {sent}")
     return {
         'success': True,
-        'contracts_starting': starting_tomorrow.count(),
-        'contracts_ending_3d': ending_in_three.count(),
-        'contracts_ending_1d': ending_tomorrow.count(),
+        'contracts_starting': sent['contract_start_1d'],
+        'contracts_ending_3d': sent['contract_end_3d'],
+        'contracts_ending_1d': sent['contract_end_1d'],
+        'interviews': sent['interview_1d'],
     }
 
 
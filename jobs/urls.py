@@ -88,6 +88,8 @@ urlpatterns = [
     
     # Calendar and Schedule APIs
     path('api/worker/calendar/', views.worker_calendar_api, name="worker_calendar_api"),
+    path('api/calendar/feed/', views.calendar_feed_link, name="calendar_feed_link"),
+    path('calendar/<str:token>.ics', views.calendar_feed, name="calendar_feed"),
     path('api/schedule/check-conflict/', views.check_contract_conflict, name="api_check_conflict"),
     
     # Worker Availability Management
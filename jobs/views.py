@@ -8,9 +8,11 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.gis.db.models.functions import Distance
 from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
 from django.core.paginator import Paginator
 from django.core.exceptions import ValidationError
-from django.db.models import Q, Count
+from django.db.models import BooleanField, Q, Count
+from django.db.models.expressions import RawSQL
 from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse, reverse_lazy
@@ -23,12 +25,20 @@ from django.views.decorators.http import require_POST
 from django.views.generic import CreateView, DeleteView, DetailView, ListView, TemplateView, UpdateView
 
 from admin_dashboard.moderation_utils import check_for_banned_words
+from geo import lookup_barangay, lookup_municipality
+from geo.haversine import nearby, rank_by_distance
+from utils_gis import gis_enabled
 from notifications.models import Notification
 from services.models import ServicePost
 
 from .forms import ContractDraftForm, JobApplicationForm, JobForm, JobImageForm
 from .models import (Contract, Feedback, Job, JobApplication, JobCategory,
                      JobImage, JobOffer, ProgressLog)
+from .activity_summary import get_activity_summary
+from .pagination import (KEYSET_SORTS, ApproximateCountPaginator, KeysetPage,
+                         count_key, cursor_for, decode_cursor, keyset_filter, with_distance_key)
+from .recommendations import get_recommended_jobs
+from .search import search_jobs
 from .utils import get_users_who_applied
 
 
@@ -118,6 +128,21 @@ class JobListView(ListView):
     template_name = "jobs/job_list.html"
     context_object_name = "jobs"
     paginate_by = 9
+    max_radius_km = 100
+    # Most jobs ranked by the NumPy engine for one non-GIS distance search
+    max_distance_candidates = 1000
+    # Query parameters that change which jobs match (and so the total count)
+    filter_params = ("category", "q", "lat", "lng", "radius_km", "urgency", "barangay")
+
+    def get_radius_km(self):
+        """Validated `radius_km` query parameter (capped), or None."""
+        try:
+            radius_km = float(self.request.GET.get("radius_km", ""))
+        except ValueError:
+            return None
+        if radius_km <= 0:
+            return None
+        return min(radius_km, self.max_radius_km)
 
     def get_queryset(self):
         # Filter for active jobs and exclude expired ones
@@ -126,12 +151,12 @@ class JobListView(ListView):
             is_active=True
         ).filter(
             Q(expires_at__isnull=True) | Q(expires_at__gt=now)
-        ).select_related("category")
+        ).select_related("category", "owner")
         request = self.request
 
         # Filters
         category_id = request.GET.get("category")
-        keyword = request.GET.get("q")
+        keyword = request.GET.get("q", "").strip()
         user_lat = request.GET.get("lat")
         user_lng = request.GET.get("lng")
         urgency = request.GET.get("urgency")
@@ -152,20 +177,9 @@ class JobListView(ListView):
             if model_urgency:
                 queryset = queryset.filter(urgency=model_urgency)
         
-        # Comprehensive keyword search across multiple fields
+        # Full-text search (with trigram fallback for location names)
         if keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=keyword) |
-                Q(description__icontains=keyword) |
-                Q(municipality__icontains=keyword) |
-                Q(barangay__icontains=keyword) |
-                Q(street__icontains=keyword) |
-                Q(subdivision__icontains=keyword) |
-                Q(category__name__icontains=keyword) |
-                Q(required_skills__icontains=keyword) |
-                Q(owner__first_name__icontains=keyword) |
-                Q(owner__last_name__icontains=keyword)
-            ).distinct()
+            queryset = search_jobs(queryset, keyword)
         
         # Removed min_budget and max_budget filters (simplified UI)
         # Don't filter by location fields from the location modal
@@ -173,37 +187,112 @@ class JobListView(ListView):
         # Search form uses 'q' parameter which is already handled above
         # This prevents "No Jobs Found" when using location modal
 
+        # Barangay filter (simple text search)
+        if barangay:
+            queryset = queryset.filter(barangay__icontains=barangay)
+
         self.user_location = None
+        self.user_coords = None
+        self.distances = None
+        self.ranked_pks = None
         # Handle GPS coordinates
         if user_lat and user_lng:
             try:
-                self.user_location = Point(float(user_lng), float(user_lat), srid=4326)
-                queryset = queryset.annotate(distance=Distance("location", self.user_location))
+                self.user_coords = (float(user_lat), float(user_lng))
             except (ValueError, TypeError):
-                self.user_location = None
-        
-        # Barangay filter (simple text search)
-        if barangay:
-            queryset = queryset.filter(barangay__icontains=barangay)
+                self.user_coords = None
+        self.radius_km = self.get_radius_km() if self.user_coords else None
+
+        if self.user_coords and gis_enabled():
+            self.user_location = Point(self.user_coords[1], self.user_coords[0], srid=4326)
+            queryset = queryset.annotate(distance=Distance("location", self.user_location))
+            # Radius bound: ST_DWithin on the geography column uses the GiST index
+            if self.radius_km:
+                queryset = queryset.filter(location__dwithin=(self.user_location, D(km=self.radius_km)))
+        elif self.user_coords and (self.radius_km or sort == "distance"):
+            # No PostGIS: bounding box in SQL, haversine over a capped candidate set in NumPy
+            ranked = nearby(
+                queryset, *self.user_coords,
+                radius_km=self.radius_km or self.max_radius_km, limit=self.max_distance_candidates,
+            )
+            self.distances = dict(ranked)
+            if sort == "distance":
+                self.ranked_pks = [pk for pk, _ in ranked]
+            else:
+                queryset = queryset.filter(pk__in=list(self.distances))
 
-        # Sorting
+        # Sorting; newest-first and distance sorts paginate by keyset
+        self.keyset_sort = None
         if sort == "budget_asc":
-            queryset = queryset.order_by("budget")
+            queryset = queryset.order_by("budget", "id")
         elif sort == "budget_desc":
-            queryset = queryset.order_by("-budget")
+            queryset = queryset.order_by("-budget", "-id")
         elif sort == "date_asc":
-            queryset = queryset.order_by("created_at")
+            queryset = queryset.order_by("created_at", "id")
         elif sort == "distance" and self.user_location:
-            queryset = queryset.order_by("distance")
-        else:  
-            queryset = queryset.order_by("-created_at")
-
-        # Cache queryset and annotate full address + distance
-        self._queryset = list(queryset)
-        for job in self._queryset:
+            self.keyset_sort = "distance"
+            queryset = with_distance_key(queryset)
+        elif self.ranked_pks is not None:
+            # Ordered by the ranked ids in paginate_queryset()
+            queryset = queryset.order_by()
+        elif keyword and "sort" not in request.GET:
+            queryset = queryset.order_by("-rank", "-created_at", "-id")
+        else:
+            self.keyset_sort = "date_desc"
+
+        if self.keyset_sort:
+            queryset = queryset.order_by(*KEYSET_SORTS[self.keyset_sort][0])
+        return queryset
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate in the database. A valid `cursor` (from the "next" link)
+        continues a keyset sort without OFFSET; otherwise fall back to page
+        numbers. A non-GIS distance sort pages through the ranked ids from
+        get_queryset() instead. Derived display fields are computed for the
+        page only.
+        """
+        if self.ranked_pks is not None:
+            # Non-GIS distance sort: page through the ranked ids, load only that page
+            paginator = Paginator(self.ranked_pks, page_size)
+            page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+            jobs = queryset.in_bulk(page.object_list)
+            page.object_list = [jobs[pk] for pk in page.object_list if pk in jobs]
+            return self.finish_page(paginator, page)
+
+        filters = {name: self.request.GET.get(name) for name in self.filter_params}
+        paginator = ApproximateCountPaginator(queryset, page_size, count_key=count_key(filters))
+        cursor = decode_cursor(self.request.GET.get("cursor", "")) if self.keyset_sort else None
+        condition = keyset_filter(self.keyset_sort, cursor[0], cursor[1]) if cursor else None
+
+        if condition is not None:
+            rows = list(queryset.filter(condition)[:page_size + 1])
+            page = KeysetPage(rows[:page_size], cursor[2], paginator, has_next=len(rows) > page_size)
+        else:
+            page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+            page.object_list = list(page.object_list)
+        return self.finish_page(paginator, page)
+
+    def finish_page(self, paginator, page):
+        """Set the page's derived display fields and the next keyset cursor."""
+        if self.user_coords and not self.user_location and self.distances is None:
+            self.distances = dict(rank_by_distance(
+                [(job.pk, job.latitude, job.longitude) for job in page.object_list], *self.user_coords
+            ))
+
+        for job in page.object_list:
             job.full_address = build_full_address(job)
-            job.distance_km = round(job.distance.km, 2) if hasattr(job, "distance") and job.distance else None
-        return self._queryset
+            if self.distances is not None:
+                distance_km = self.distances.get(job.pk)
+                job.distance_km = round(distance_km, 2) if distance_km is not None else None
+            else:
+                job.distance_km = round(job.distance.km, 2) if hasattr(job, "distance") and job.distance else None
+
+        self.next_cursor = None
+        if self.keyset_sort and page.has_next() and page.object_list:
+            self.next_cursor = cursor_for(self.keyset_sort, page.object_list[-1], page.number + 1)
+
+        return paginator, page, page.object_list, page.has_other_pages()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -211,8 +300,9 @@ class JobListView(ListView):
         context["request"] = self.request
         context["user_location"] = getattr(self, 'user_location', None)
 
-        # Use the already filtered jobs count (total after filtering)
-        context["jobs_count"] = len(getattr(self, '_queryset', []))
+        # Approximate total for the filtered jobs (cached, see jobs.pagination)
+        context["jobs_count"] = context["paginator"].count
+        context["next_cursor"] = getattr(self, "next_cursor", None)
 
         # Service filters based on ServicePost model fields
         service_filters = {"is_active": True}
@@ -231,10 +321,18 @@ class JobListView(ListView):
         # check if lat & lng are provided and annotate distance.
         user_lat = self.request.GET.get("lat")
         user_lng = self.request.GET.get("lng")
-        if user_lat and user_lng:
+        if user_lat and user_lng and gis_enabled():
             try:
                 user_loc = Point(float(user_lng), float(user_lat), srid=4326)
                 services_qs = services_qs.annotate(distance=Distance("location", user_loc))
+                radius_km = getattr(self, "radius_km", None)
+                if radius_km:
+                    # ServicePost.location is geometry; the cast matches its geography GiST index
+                    services_qs = services_qs.filter(RawSQL(
+                        "ST_DWithin(services_servicepost.location::geography, %s::geography, %s)",
+                        (user_loc.ewkt, radius_km * 1000),
+                        output_field=BooleanField(),
+                    ))
                 # Order by distance if needed (or leave the default ordering)
                 services_qs = services_qs.order_by("distance")
             except (ValueError, TypeError):
@@ -299,7 +397,31 @@ class JobDetailView(DetailView):
         return context
 
 # 🔹 Job Create View (with geolocation support)
-class JobCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class JobLocationMixin:
+    """Resolve job coordinates from the gazetteer, the map pin, or the municipality."""
+
+    def apply_location(self, job, form):
+        lat = self.request.POST.get("latitude")
+        lng = self.request.POST.get("longitude")
+        municipality = form.cleaned_data.get('municipality', '')
+        barangay = form.cleaned_data.get('barangay', '')
+
+        # Known barangay centroid first, then the user's pin, then the municipality
+        place = lookup_barangay(municipality, barangay)
+        if place:
+            coords = (place.lat, place.lng)
+        elif lat and lng:
+            coords = (float(lat), float(lng))
+        else:
+            place = lookup_municipality(municipality)
+            coords = (place.lat, place.lng) if place else None
+
+        if coords:
+            job.latitude, job.longitude = coords
+            job.location = Point(coords[1], coords[0], srid=4326)
+
+
+class JobCreateView(JobLocationMixin, LoginRequiredMixin, UserPassesTestMixin, CreateView):
     model = Job
     form_class = JobForm
     template_name = "jobs/job_form.html"
@@ -309,70 +431,6 @@ class JobCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         """Only clients can post jobs"""
         return self.request.user.role == 'client'
     
-    def _get_precise_coordinates(self, municipality, barangay):
-        """Get precise coordinates for specific barangay within a municipality."""
-        if not municipality or not barangay:
-            return None
-            
-        # Bacoor barangay coordinates (6 decimal places for precision)
-        bacoor_barangays = {
-            'molino': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 1': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 2': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 3': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 4': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 5': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 6': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 7': {'lat': 14.423512, 'lng': 120.982478},
-            'queens row': {'lat': 14.440013, 'lng': 120.974982},
-            'queens row central': {'lat': 14.440013, 'lng': 120.974982},
-            'queens row east': {'lat': 14.440013, 'lng': 120.974982},
-            'queens row west': {'lat': 14.440013, 'lng': 120.974982},
-            'salawag': {'lat': 14.417528, 'lng': 120.954983},
-            'springville': {'lat': 14.429045, 'lng': 120.991987},
-            'panapaan': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 1': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 2': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 3': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 4': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 5': {'lat': 14.452013, 'lng': 120.968041},
-            'tabing dagat': {'lat': 14.462015, 'lng': 120.959028},
-            'mabolo': {'lat': 14.414987, 'lng': 120.969964},
-            'mabolo 1': {'lat': 14.414987, 'lng': 120.969964},
-            'mabolo 2': {'lat': 14.414987, 'lng': 120.969964},
-            'mabolo 3': {'lat': 14.414987, 'lng': 120.969964},
-            'niog': {'lat': 14.420019, 'lng': 120.960047},
-            'niog 1': {'lat': 14.420019, 'lng': 120.960047},
-            'niog 2': {'lat': 14.420019, 'lng': 120.960047},
-            'niog 3': {'lat': 14.420019, 'lng': 120.960047},
-            'zapote': {'lat': 14.434567, 'lng': 120.975432},
-            'zapote 1': {'lat': 14.434567, 'lng': 120.975432},
-            'zapote 2': {'lat': 14.434567, 'lng': 120.975432},
-            'zapote 3': {'lat': 14.434567, 'lng': 120.975432},
-        }
-        
-        if municipality == 'bacoor' and barangay in bacoor_barangays:
-            return bacoor_barangays[barangay]
-        
-        return None
-    
-    def _get_municipality_coordinates(self, municipality):
-        """Get coordinates for municipality (fallback)."""
-        municipalities = {
-            'manila': {'lat': 14.599512, 'lng': 120.984222},
-            'quezon city': {'lat': 14.676041, 'lng': 121.043700},
-            'makati': {'lat': 14.554729, 'lng': 121.024445},
-            'pasig': {'lat': 14.576417, 'lng': 121.085098},
-            'taguig': {'lat': 14.517637, 'lng': 121.050935},
-            'bacoor': {'lat': 14.431095, 'lng': 120.968096},
-            'imus': {'lat': 14.429741, 'lng': 120.937028},
-            'dasmarinas': {'lat': 14.400415, 'lng': 120.985887},
-            'dasmariñas': {'lat': 14.400415, 'lng': 120.985887},
-            'cavite city': {'lat': 14.479142, 'lng': 120.897897},
-            'antipolo': {'lat': 14.593069, 'lng': 121.180027},
-        }
-        return municipalities.get(municipality)
-    
     def handle_no_permission(self):
         """Redirect workers who try to post jobs"""
         messages.error(self.request, "Only clients can post jobs. Workers can apply to jobs instead.")
@@ -413,32 +471,7 @@ class JobCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         job = form.save(commit=False)
         job.owner = self.request.user
 
-        # Enhanced location handling with barangay-level precision
-        lat = self.request.POST.get("latitude")
-        lng = self.request.POST.get("longitude")
-        municipality = form.cleaned_data.get('municipality', '').lower().strip()
-        barangay = form.cleaned_data.get('barangay', '').lower().strip()
-        
-        # Try to get precise coordinates from our database first
-        coords = self._get_precise_coordinates(municipality, barangay)
-        
-        if coords:
-            # Use our precise barangay-level coordinates
-            job.location = Point(coords['lng'], coords['lat'], srid=4326)
-            job.latitude = coords['lat']
-            job.longitude = coords['lng']
-        elif lat and lng:
-            # Fallback to user-provided coordinates
-            job.location = Point(float(lng), float(lat), srid=4326)
-            job.latitude = float(lat)
-            job.longitude = float(lng)
-        else:
-            # Last resort: use municipality-level coordinates
-            muni_coords = self._get_municipality_coordinates(municipality)
-            if muni_coords:
-                job.location = Point(muni_coords['lng'], muni_coords['lat'], srid=4326)
-                job.latitude = muni_coords['lat']
-                job.longitude = muni_coords['lng']
+        self.apply_location(job, form)
 
         job.save()
 
@@ -453,7 +486,7 @@ class JobCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
         return redirect(self.success_url)
 
 # 🔹 Job Update View (Only job owners can edit)
-class JobUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class JobUpdateView(JobLocationMixin, LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     model = Job
     form_class = JobForm
     template_name = "jobs/job_form.html"
@@ -461,70 +494,6 @@ class JobUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     def test_func(self):
         return self.request.user == self.get_object().owner
     
-    def _get_precise_coordinates(self, municipality, barangay):
-        """Get precise coordinates for specific barangay within a municipality."""
-        if not municipality or not barangay:
-            return None
-            
-        # Bacoor barangay coordinates (6 decimal places for precision)
-        bacoor_barangays = {
-            'molino': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 1': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 2': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 3': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 4': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 5': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 6': {'lat': 14.423512, 'lng': 120.982478},
-            'molino 7': {'lat': 14.423512, 'lng': 120.982478},
-            'queens row': {'lat': 14.440013, 'lng': 120.974982},
-            'queens row central': {'lat': 14.440013, 'lng': 120.974982},
-            'queens row east': {'lat': 14.440013, 'lng': 120.974982},
-            'queens row west': {'lat': 14.440013, 'lng': 120.974982},
-            'salawag': {'lat': 14.417528, 'lng': 120.954983},
-            'springville': {'lat': 14.429045, 'lng': 120.991987},
-            'panapaan': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 1': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 2': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 3': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 4': {'lat': 14.452013, 'lng': 120.968041},
-            'panapaan 5': {'lat': 14.452013, 'lng': 120.968041},
-            'tabing dagat': {'lat': 14.462015, 'lng': 120.959028},
-            'mabolo': {'lat': 14.414987, 'lng': 120.969964},
-            'mabolo 1': {'lat': 14.414987, 'lng': 120.969964},
-            'mabolo 2': {'lat': 14.414987, 'lng': 120.969964},
-            'mabolo 3': {'lat': 14.414987, 'lng': 120.969964},
-            'niog': {'lat': 14.420019, 'lng': 120.960047},
-            'niog 1': {'lat': 14.420019, 'lng': 120.960047},
-            'niog 2': {'lat': 14.420019, 'lng': 120.960047},
-            'niog 3': {'lat': 14.420019, 'lng': 120.960047},
-            'zapote': {'lat': 14.434567, 'lng': 120.975432},
-            'zapote 1': {'lat': 14.434567, 'lng': 120.975432},
-            'zapote 2': {'lat': 14.434567, 'lng': 120.975432},
-            'zapote 3': {'lat': 14.434567, 'lng': 120.975432},
-        }
-        
-        if municipality == 'bacoor' and barangay in bacoor_barangays:
-            return bacoor_barangays[barangay]
-        
-        return None
-    
-    def _get_municipality_coordinates(self, municipality):
-        """Get coordinates for municipality (fallback)."""
-        municipalities = {
-            'manila': {'lat': 14.599512, 'lng': 120.984222},
-            'quezon city': {'lat': 14.676041, 'lng': 121.043700},
-            'makati': {'lat': 14.554729, 'lng': 121.024445},
-            'pasig': {'lat': 14.576417, 'lng': 121.085098},
-            'taguig': {'lat': 14.517637, 'lng': 121.050935},
-            'bacoor': {'lat': 14.431095, 'lng': 120.968096},
-            'imus': {'lat': 14.429741, 'lng': 120.937028},
-            'dasmarinas': {'lat': 14.400415, 'lng': 120.985887},
-            'dasmariñas': {'lat': 14.400415, 'lng': 120.985887},
-            'cavite city': {'lat': 14.479142, 'lng': 120.897897},
-            'antipolo': {'lat': 14.593069, 'lng': 121.180027},
-        }
-        return municipalities.get(municipality)
-    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         if self.request.POST:
@@ -554,32 +523,7 @@ class JobUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
             )
             return self.form_invalid(form)
         
-        # Enhanced location handling with barangay-level precision
-        lat = self.request.POST.get("latitude")
-        lng = self.request.POST.get("longitude")
-        municipality = form.cleaned_data.get('municipality', '').lower().strip()
-        barangay = form.cleaned_data.get('barangay', '').lower().strip()
-        
-        # Try to get precise coordinates from our database first
-        coords = self._get_precise_coordinates(municipality, barangay)
-        
-        if coords:
-            # Use our precise barangay-level coordinates
-            form.instance.location = Point(coords['lng'], coords['lat'], srid=4326)
-            form.instance.latitude = coords['lat']
-            form.instance.longitude = coords['lng']
-        elif lat and lng:
-            # Fallback to user-provided coordinates
-            form.instance.location = Point(float(lng), float(lat), srid=4326)
-            form.instance.latitude = float(lat)
-            form.instance.longitude = float(lng)
-        else:
-            # Last resort: use municipality-level coordinates
-            muni_coords = self._get_municipality_coordinates(municipality)
-            if muni_coords:
-                form.instance.location = Point(muni_coords['lng'], muni_coords['lat'], srid=4326)
-                form.instance.latitude = muni_coords['lat']
-                form.instance.longitude = muni_coords['lng']
+        self.apply_location(form.instance, form)
         
         response = super().form_valid(form)
         
@@ -1406,9 +1350,11 @@ class EmployerDashboardView(LoginRequiredMixin, TemplateView):
     
     def dispatch(self, request, *args, **kwargs):
         # Check if user has posted any jobs
-        if not Job.objects.filter(owner=request.user).exists():
-            messages.info(request, "You need to post a job first to access the employer dashboard.")
-            return redirect('jobs:job_create')
+        if request.user.is_authenticated:
+            self.summary = get_activity_summary(request.user)
+            if not self.summary.jobs_total:
+                messages.info(request, "You need to post a job first to access the employer dashboard.")
+                return redirect('jobs:job_create')
         return super().dispatch(request, *args, **kwargs)
     
     def get_context_data(self, **kwargs):
@@ -1418,33 +1364,18 @@ class EmployerDashboardView(LoginRequiredMixin, TemplateView):
         # Get all user's jobs for filtering
         context['user_jobs'] = Job.objects.filter(owner=user).order_by('-created_at')
         
-        # Statistics
-        context['total_jobs'] = Job.objects.filter(owner=user).count()
-        context['active_jobs'] = Job.objects.filter(owner=user, is_active=True).count()
-        context['deactivated_jobs_count'] = Job.objects.filter(owner=user, is_active=False).count()
+        # Statistics, from the user's denormalized UserActivitySummary row
+        summary = self.summary
+        context['total_jobs'] = summary.jobs_total
+        context['active_jobs'] = summary.jobs_active
+        context['deactivated_jobs_count'] = summary.jobs_inactive
         # Total applications should count only Pending applications (those needing review)
-        total_apps = JobApplication.objects.filter(job__owner=user, status='Pending').count()
-        print(f"DEBUG EMPLOYER DASHBOARD: User={user.username}, Total Pending Apps={total_apps}")
-        context['total_applications'] = total_apps
-        context['pending_applications'] = JobApplication.objects.filter(
-            job__owner=user, 
-            status='Pending'
-        ).count()
-        context['rejected_applications'] = JobApplication.objects.filter(
-            job__owner=user,
-            status__iexact='rejected'
-        ).count()
-        context['active_contracts'] = Contract.objects.filter(
-            client=user
-        ).exclude(status__in=['Completed', 'Cancelled']).count()
-        context['completed_contracts'] = Contract.objects.filter(
-            client=user, 
-            status='Completed'
-        ).count()
-        context['cancelled_contracts'] = Contract.objects.filter(
-            client=user,
-            status='Cancelled'
-        ).count()
+        context['total_applications'] = summary.applications_received_pending
+        context['pending_applications'] = summary.applications_received_pending
+        context['rejected_applications'] = summary.applications_received_rejected
+        context['active_contracts'] = summary.client_contracts_open
+        context['completed_contracts'] = summary.client_contracts_completed
+        context['cancelled_contracts'] = summary.client_contracts_cancelled
         
         # Recent jobs
         context['recent_jobs'] = Job.objects.filter(owner=user).order_by('-created_at')[:5]
@@ -1468,8 +1399,9 @@ class EmployerDashboardView(LoginRequiredMixin, TemplateView):
             Q(contract__isnull=True) | 
             ~Q(contract__status__in=['Negotiation', 'Finalized', 'In Progress', 'Awaiting Review', 'Completed'])
         ).select_related('job', 'worker', 'offer', 'contract').order_by('-applied_at')[:50]
-        context['recent_applications'] = recent_applications_qs
-        context['applications_tab_count'] = recent_applications_qs.count()
+        # Evaluated once; the tab badge counts the same rows the tab lists
+        context['recent_applications'] = list(recent_applications_qs)
+        context['applications_tab_count'] = len(context['recent_applications'])
         
         # Rejected applications list
         context['rejected_applications_list'] = JobApplication.objects.filter(
@@ -1509,34 +1441,25 @@ class WorkerDashboardView(LoginRequiredMixin, TemplateView):
     
     def dispatch(self, request, *args, **kwargs):
         # Check if user has applied to any jobs
-        if not JobApplication.objects.filter(worker=request.user).exists():
-            messages.info(request, "You need to apply to a job first to access the worker dashboard.")
-            return redirect('jobs:job_list')
+        if request.user.is_authenticated:
+            self.summary = get_activity_summary(request.user)
+            if not self.summary.applications_sent_total:
+                messages.info(request, "You need to apply to a job first to access the worker dashboard.")
+                return redirect('jobs:job_list')
         return super().dispatch(request, *args, **kwargs)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
         
-        # Statistics
-        context['total_applications'] = JobApplication.objects.filter(worker=user).exclude(status__iexact='Archived').count()
-        context['pending_applications'] = JobApplication.objects.filter(
-            worker=user, 
-            status='Pending'
-        ).count()
-        context['rejected_applications'] = JobApplication.objects.filter(
-            worker=user,
-            status__iexact='rejected'
-        ).count()
-        context['active_contracts'] = Contract.objects.filter(worker=user).exclude(status__in=['Completed', 'Cancelled']).count()
-        context['completed_contracts'] = Contract.objects.filter(
-            worker=user, 
-            status='Completed'
-        ).count()
-        context['cancelled_contracts'] = Contract.objects.filter(
-            worker=user,
-            status='Cancelled'
-        ).count()
+        # Statistics, from the user's denormalized UserActivitySummary row
+        summary = self.summary
+        context['total_applications'] = summary.applications_sent_total - summary.applications_sent_archived
+        context['pending_applications'] = summary.applications_sent_pending
+        context['rejected_applications'] = summary.applications_sent_rejected
+        context['active_contracts'] = summary.worker_contracts_open
+        context['completed_contracts'] = summary.worker_contracts_completed
+        context['cancelled_contracts'] = summary.worker_contracts_cancelled
         
         # Recent applications
         recent_applications_qs = JobApplication.objects.filter(
@@ -1546,8 +1469,9 @@ class WorkerDashboardView(LoginRequiredMixin, TemplateView):
         ).exclude(
             contract__status__in=['Negotiation', 'Finalized', 'In Progress', 'Awaiting Review', 'Completed']
         ).select_related('job', 'contract').order_by('-applied_at')[:10]
-        context['recent_applications'] = recent_applications_qs
-        context['applications_tab_count'] = recent_applications_qs.count()
+        # Evaluated once; the tab badge counts the same rows the tab lists
+        context['recent_applications'] = list(recent_applications_qs)
+        context['applications_tab_count'] = len(context['recent_applications'])
         
         # JobOffer feature is deprecated - system now uses Contracts directly
         # context['pending_offers'] = JobOffer.objects.filter(
@@ -1569,17 +1493,25 @@ class WorkerDashboardView(LoginRequiredMixin, TemplateView):
             status='Cancelled'
         ).select_related('job', 'client').order_by('-updated_at')[:50]
         
-        # Available jobs (nearby) - exclude user's own jobs and jobs already applied to
-        now = timezone.now()
-        context['available_jobs'] = Job.objects.filter(
-            is_active=True
-        ).filter(
-            Q(expires_at__isnull=True) | Q(expires_at__gt=now)
-        ).exclude(
-            owner=user  # Exclude user's own jobs
-        ).exclude(
-            applications__worker=user  # Exclude jobs already applied to
-        ).order_by('-created_at')[:10]
+        # Recommended jobs, precomputed by jobs.tasks_recommendations
+        available_jobs = get_recommended_jobs(user, limit=10)
+        if not available_jobs:
+            # Nothing stored yet (new worker): newest open jobs, and build their list
+            from django.core.cache import cache
+            from .tasks_recommendations import refresh_worker_recommendations
+            if cache.add(f'recommendations:pending:{user.pk}', 1, timeout=300):
+                refresh_worker_recommendations.delay([user.pk])
+            now = timezone.now()
+            available_jobs = Job.objects.filter(
+                is_active=True
+            ).filter(
+                Q(expires_at__isnull=True) | Q(expires_at__gt=now)
+            ).exclude(
+                owner=user  # Exclude user's own jobs
+            ).exclude(
+                applications__worker=user  # Exclude jobs already applied to
+            ).select_related('category', 'owner').order_by('-created_at')[:10]
+        context['available_jobs'] = available_jobs
         
         # Calendar and schedule data
         from .schedule_utils import get_upcoming_deadlines
@@ -1802,7 +1734,8 @@ class ContractNegotiationView(LoginRequiredMixin, UpdateView):
                 start_date=contract.start_date,
                 end_date=contract.end_date,
                 start_time=contract.start_time,
-                end_time=contract.end_time
+                end_time=contract.end_time,
+                exclude_contract_id=contract.id
             )
             context['has_availability_conflicts'] = not availability_result['available']
             context['availability_conflicts'] = availability_result['conflicts']  # Show all conflicts
@@ -1906,7 +1839,7 @@ def accept_contract_terms(request, pk):
         if has_conflict:
             # Store conflict warning in session to display on contract page
             request.session['schedule_conflict_warning'] = warning_message
-            request.session['conflicting_contract_ids'] = [c.id for c in conflicting_contracts]
+            request.session['conflicting_contract_ids'] = [c.contract_id for c in conflicting_contracts]
             
             # Check if user confirmed they want to proceed despite conflict
             if request.POST.get("confirm_despite_conflict") != "on":
@@ -2202,8 +2135,7 @@ def feedback_form(request, contract_pk):
     receiver = contract.client if request.user == contract.worker else contract.worker
 
     if request.method == "POST":
-        from better_profanity import profanity
-        from admin_dashboard.utils import load_banned_words
+        from admin_dashboard.moderation_utils import censor_text
         
         rating = request.POST.get('rating')
         message = request.POST.get('message', '').strip()
@@ -2212,17 +2144,8 @@ def feedback_form(request, contract_pk):
             messages.error(request, "Please provide both rating and feedback message.")
             return redirect("jobs:feedback_form", contract_pk=contract_pk)
         
-        # Profanity filtering
-        banned_words = load_banned_words()
-        profanity.load_censor_words([word for word in banned_words if ' ' not in word])
-        
-        # Censor single words
-        censored_message = profanity.censor(message)
-        
-        # Censor multi-word phrases
-        for phrase in banned_words:
-            if ' ' in phrase:
-                censored_message = censored_message.replace(phrase, '*' * len(phrase))
+        # Profanity filtering (moderated words and phrases)
+        censored_message = censor_text(message)
         
         # Warn if censored
         if censored_message != message:
@@ -2501,14 +2424,15 @@ def check_contract_conflict(request):
         )
         
         conflicts_data = []
-        for contract in conflicting_contracts:
+        for conflict in conflicting_contracts:
             conflicts_data.append({
-                'id': contract.id,
-                'title': contract.job.title,
-                'start_date': contract.start_date.isoformat(),
-                'end_date': contract.end_date.isoformat() if contract.end_date else None,
-                'client': contract.client.get_full_name() or contract.client.username,
-                'status': contract.status,
+                'id': conflict.contract_id,
+                'title': conflict.job_title,
+                'start_date': conflict.start_date.isoformat(),
+                'end_date': conflict.end_date.isoformat() if conflict.end_date else None,
+                'times': conflict.times,
+                'client': conflict.client_name,
+                'status': conflict.status,
             })
         
         return JsonResponse({
@@ -2643,49 +2567,60 @@ class PrivacyPolicyView(TemplateView):
 def worker_calendar_api(request):
     """
     API endpoint to return worker's contracts in FullCalendar format.
-    Each contract generates multiple daily events showing actual work hours.
+    Each contract generates daily events showing actual work hours, for the
+    days in the requested start/end window (cached; supports ETag/304).
     """
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    worker = request.user
-    
-    # Get date range from query params (optional)
-    start_date = request.GET.get('start')
-    end_date = request.GET.get('end')
-    
-    # Convert to date objects if provided
-    if start_date:
-        start_date = datetime.fromisoformat(start_date.replace('Z', '')).date()
-    if end_date:
-        end_date = datetime.fromisoformat(end_date.replace('Z', '')).date()
-    
-    # Get worker's contracts
-    contracts = Contract.get_worker_schedule(worker, start_date, end_date)
-    
-    logger.info(f"Calendar API: Found {contracts.count()} contracts for {worker.username}")
-    
-    # Convert to calendar events (each contract returns a list of daily events)
-    events = []
-    for contract in contracts:
-        logger.info(f"Processing contract {contract.id}: {contract.job_title}, Status: {contract.status}, Dates: {contract.start_date} to {contract.end_date}, Times: {contract.start_time} - {contract.end_time}")
-        
-        event_data = contract.get_calendar_event_data()
-        if event_data:
-            # event_data is now a list of events (one per day)
-            if isinstance(event_data, list):
-                logger.info(f"Contract {contract.id} generated {len(event_data)} daily events")
-                events.extend(event_data)
-            else:
-                # Backward compatibility if old format
-                logger.info(f"Contract {contract.id} generated 1 event (old format)")
-                events.append(event_data)
-        else:
-            logger.warning(f"Contract {contract.id} returned no events (missing dates?)")
-    
-    logger.info(f"Calendar API: Returning {len(events)} total events")
-    
-    return JsonResponse(events, safe=False)
+    from .calendar_events import calendar_response
+    return calendar_response(request, 'contracts')
+
+
+def calendar_feed(request, token):
+    """
+    iCalendar feed of the token owner's contracts and interviews, for
+    subscribing from phone/desktop calendar apps. Unchanged feeds answer
+    304; see jobs.calendar_feed.
+    """
+    from django.http import Http404, StreamingHttpResponse
+    from django.utils.cache import get_conditional_response
+    from .calendar_events import get_schedule_version
+    from .calendar_feed import feed_etag, get_feed_body, resolve_feed_token
+
+    user_id = resolve_feed_token(token)
+    if user_id is None:
+        raise Http404("Unknown calendar feed")
+
+    version = get_schedule_version(user_id)
+    base_url = request.build_absolute_uri('/').rstrip('/')
+    etag = feed_etag(user_id, version, base_url)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+
+    response = StreamingHttpResponse(
+        get_feed_body(user_id, version, base_url),
+        content_type='text/calendar; charset=utf-8',
+    )
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    response['Content-Disposition'] = 'inline; filename="trabaholink.ics"'
+    return response
+
+
+@login_required
+def calendar_feed_link(request):
+    """
+    GET: the user's calendar feed URL (created on first use).
+    POST: rotate the token, revoking the old URL.
+    """
+    from .calendar_feed import get_feed_token, rotate_feed_token
+
+    token = rotate_feed_token(request.user) if request.method == 'POST' else get_feed_token(request.user)
+    url = request.build_absolute_uri(reverse('jobs:calendar_feed', args=[token]))
+    return JsonResponse({
+        'url': url,
+        'webcal_url': 'webcal://' + url.split('://', 1)[1],
+    })
 
 
 @login_required
@@ -0,0 +1,254 @@
+"""
+"Find available workers" search for clients.
+
+Answers questions like "which verified workers near this job are free on
+Tuesdays 8am-12pm next month" in three stages:
+
+1. spatial prefilter: workers within the radius, nearest MAX_CANDIDATES
+   only (ST_DWithin on the geography column, or geo.haversine without
+   PostGIS)
+2. availability: jobs.availability.evaluate_workers checks every candidate
+   against their cached weekly bitmap and the conflict engine in one pass
+3. ranking of the workers that are free enough, by free days, distance,
+   skill overlap and verification, with one skills query and one profile
+   query for the survivors
+"""
+from dataclasses import dataclass, field
+from datetime import date, time
+import math
+from typing import Optional
+
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_time
+
+from geo.haversine import parse_point, rank_by_distance
+from utils_gis import D, Distance, Point, gis_enabled
+
+from .recommendations import tokenize
+
+DEFAULT_RADIUS_KM = 10.0
+MAX_RADIUS_KM = 100.0
+
+# Nearest workers evaluated for availability
+MAX_CANDIDATES = 5000
+
+# Longest date range a search may span
+MAX_RANGE_DAYS = 366
+
+# Distances are reported rounded up to this, so repeated searches can't
+# pinpoint where a worker lives
+DISTANCE_BUCKET_KM = 1.0
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+WEIGHTS = {
+    'availability': 0.50,
+    'distance': 0.25,
+    'skills': 0.15,
+    'verified': 0.10,
+}
+
+WEEKDAY_NAMES = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+
+class WorkerSearchError(ValueError):
+    """Raised for missing or malformed search parameters."""
+
+
+@dataclass
+class WorkerSearch:
+    lat: float
+    lng: float
+    start_date: date
+    end_date: date
+    start_time: time
+    end_time: time
+    radius_km: float = DEFAULT_RADIUS_KM
+    weekdays: Optional[list] = None
+    skill_tokens: set = field(default_factory=set)
+    verified_only: bool = False
+    # Share of the requested days a worker must be free on
+    min_free_ratio: float = 1.0
+    limit: int = DEFAULT_LIMIT
+    exclude_user_id: Optional[int] = None
+
+
+def parse_weekdays(value):
+    """'tue,thu' or '1,3' -> [1, 3] (0=Monday), or None when empty."""
+    if not value:
+        return None
+    weekdays = set()
+    for part in value.split(','):
+        part = part.strip().lower()
+        if part[:3] in WEEKDAY_NAMES:
+            weekdays.add(WEEKDAY_NAMES.index(part[:3]))
+        elif part.isdigit() and int(part) < 7:
+            weekdays.add(int(part))
+        elif part:
+            raise WorkerSearchError(f"Unknown weekday '{part}'")
+    return sorted(weekdays) or None
+
+
+def _bounded_float(params, name, default, low, high):
+    try:
+        value = float(params.get(name) or default)
+    except ValueError:
+        raise WorkerSearchError(f"{name} must be a number")
+    return min(max(value, low), high)
+
+
+def parse_search(params, user=None):
+    """
+    Build a WorkerSearch from query parameters.
+
+    The search is centred on `job`, which must be one of the user's jobs;
+    its required skills are used when `skills` is not given. Arbitrary
+    coordinates are not accepted. `start_date`, `start_time` and
+    `end_time` are required; `end_date` defaults to `start_date`.
+    """
+    from .models import Job
+
+    try:
+        job = Job.objects.get(pk=int(params.get('job') or ''), owner=user)
+    except (Job.DoesNotExist, ValueError):
+        raise WorkerSearchError("Job not found")
+    if job.latitude is not None and job.longitude is not None:
+        coords = (job.latitude, job.longitude)
+    else:
+        coords = parse_point(job.location)
+    if not coords:
+        raise WorkerSearchError("Job has no location")
+    skills = params.get('skills') or f"{job.title} {job.required_skills}"
+
+    try:
+        start_date = parse_date(params.get('start_date') or '')
+        end_date = parse_date(params.get('end_date') or '') if params.get('end_date') else start_date
+        start_time = parse_time(params.get('start_time') or '')
+        end_time = parse_time(params.get('end_time') or '')
+    except ValueError as e:
+        # Well formed but impossible, e.g. 2030-02-30 or 25:00
+        raise WorkerSearchError(f"Invalid date or time: {e}")
+    if not (start_date and end_date and start_time and end_time):
+        raise WorkerSearchError("start_date, start_time and end_time are required (YYYY-MM-DD, HH:MM)")
+    if end_date < start_date:
+        raise WorkerSearchError("end_date is before start_date")
+    if (end_date - start_date).days >= MAX_RANGE_DAYS:
+        raise WorkerSearchError(f"Date range is limited to {MAX_RANGE_DAYS} days")
+
+    return WorkerSearch(
+        lat=coords[0],
+        lng=coords[1],
+        start_date=start_date,
+        end_date=end_date,
+        start_time=start_time,
+        end_time=end_time,
+        radius_km=_bounded_float(params, 'radius_km', DEFAULT_RADIUS_KM, 0.1, MAX_RADIUS_KM),
+        weekdays=parse_weekdays(params.get('weekdays')),
+        skill_tokens=tokenize(skills),
+        verified_only=params.get('verified') in ('1', 'true', 'True'),
+        min_free_ratio=_bounded_float(params, 'min_free_ratio', 1.0, 0.0, 1.0),
+        limit=int(_bounded_float(params, 'limit', DEFAULT_LIMIT, 1, MAX_LIMIT)),
+        exclude_user_id=getattr(user, 'pk', None),
+    )
+
+
+def candidate_workers(search):
+    """[(worker_id, distance_km), ...] within the radius, nearest first."""
+    from users.models import CustomUser
+
+    workers = CustomUser.objects.filter(is_active=True, role='worker', location__isnull=False)
+    if search.exclude_user_id:
+        workers = workers.exclude(pk=search.exclude_user_id)
+    if search.verified_only:
+        workers = workers.filter(Q(is_verified=True) | Q(is_verified_philsys=True))
+
+    if gis_enabled():
+        point = Point(search.lng, search.lat, srid=4326)
+        rows = (
+            workers
+            .filter(location__dwithin=(point, D(km=search.radius_km)))
+            .annotate(distance=Distance('location', point))
+            .order_by('distance')
+            .values_list('pk', 'distance')[:MAX_CANDIDATES]
+        )
+        return [(pk, distance.km) for pk, distance in rows]
+
+    # No PostGIS: the user location is text, so parse and rank in NumPy
+    rows = []
+    for pk, location in workers.order_by().values_list('pk', 'location').iterator(chunk_size=2000):
+        point = parse_point(location)
+        if point:
+            rows.append((pk, point[0], point[1]))
+    return rank_by_distance(rows, search.lat, search.lng, search.radius_km)[:MAX_CANDIDATES]
+
+
+def skill_overlap(worker_ids, tokens):
+    """{worker_id: share of `tokens` covered by the worker's non-rejected skills}."""
+    from users.models import Skill
+
+    if not tokens or not worker_ids:
+        return {}
+    matched = {}
+    rows = Skill.objects.filter(user_id__in=worker_ids).exclude(status='unverified').values_list('user_id', 'name')
+    for user_id, name in rows:
+        matched.setdefault(user_id, set()).update(tokenize(name) & tokens)
+    return {user_id: len(found) / len(tokens) for user_id, found in matched.items()}
+
+
+def distance_bucket(distance_km):
+    """Distance rounded up to the next DISTANCE_BUCKET_KM."""
+    return max(math.ceil(distance_km / DISTANCE_BUCKET_KM), 1) * DISTANCE_BUCKET_KM
+
+
+def search_available_workers(search):
+    """
+    Ranked workers for a WorkerSearch:
+    {'candidates': n evaluated, 'count': n free enough, 'results': [...]}.
+    Each result's distance_km is an upper bound (see distance_bucket).
+    """
+    from users.models import CustomUser
+    from .availability import evaluate_workers
+
+    distances = dict(candidate_workers(search))
+    availability = evaluate_workers(
+        distances, search.start_date, search.end_date,
+        search.start_time, search.end_time, search.weekdays,
+    )
+    free = [
+        worker_id for worker_id, stats in availability.items()
+        if stats['free'] and stats['free_ratio'] >= search.min_free_ratio
+    ]
+
+    skills = skill_overlap(free, search.skill_tokens)
+    verified = set(CustomUser.objects.filter(
+        Q(is_verified=True) | Q(is_verified_philsys=True), pk__in=free,
+    ).values_list('pk', flat=True)) if free else set()
+
+    scores = {}
+    for worker_id in free:
+        scores[worker_id] = (
+            WEIGHTS['availability'] * availability[worker_id]['free_ratio']
+            + WEIGHTS['distance'] * (1.0 - min(distances[worker_id] / search.radius_km, 1.0))
+            + WEIGHTS['skills'] * skills.get(worker_id, 0.0)
+            + WEIGHTS['verified'] * (worker_id in verified)
+        )
+    top = sorted(free, key=lambda worker_id: (-scores[worker_id], distances[worker_id]))[:search.limit]
+
+    profiles = CustomUser.objects.in_bulk(top)
+    results = []
+    for worker_id in top:
+        worker = profiles[worker_id]
+        results.append({
+            'id': worker_id,
+            'username': worker.username,
+            'full_name': worker.get_full_name() or worker.username,
+            'job_title': worker.job_title or '',
+            'profile_picture': worker.profile_picture.url if worker.profile_picture else None,
+            'is_verified': worker_id in verified,
+            'distance_km': distance_bucket(distances[worker_id]),
+            'skill_match': round(skills.get(worker_id, 0.0), 2),
+            'score': round(scores[worker_id], 4),
+            **availability[worker_id],
+        })
+    return {'candidates': len(distances), 'count': len(free), 'results': results}
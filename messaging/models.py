@@ -1,7 +1,6 @@
 from django.db import models
 from django.contrib.auth import get_user_model
-from better_profanity import profanity
-from admin_dashboard.utils import load_banned_words
+from admin_dashboard.moderation_utils import censor_text
 
 
 User = get_user_model()
@@ -44,11 +43,7 @@ class Message(models.Model):
     is_flagged = models.BooleanField(default=False)
 
     def save(self, *args, **kwargs):
-        banned_words = load_banned_words()
-        self.content = profanity.censor(self.content)
-        for phrase in banned_words:
-            if ' ' in phrase:  
-                self.content = self.content.replace(phrase, '*' * len(phrase))
+        self.content = censor_text(self.content)
 
         super().save(*args, **kwargs)
 
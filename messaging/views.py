@@ -97,8 +97,8 @@ def conversation_detail(request, conversation_id):
     receiver_id = conversation.user2.id if request.user == conversation.user1 else conversation.user1.id
     
     # Get banned words for frontend censoring
-    from admin_dashboard.models import ModeratedWord
-    banned_words = list(ModeratedWord.objects.filter(is_banned=True).values_list('word', flat=True))
+    from admin_dashboard.moderation_utils import get_matcher
+    banned_words = [word for _, word in get_matcher('banned').words.values()]
     banned_words_json = json.dumps(banned_words)
     
     # Mark notifications as read for this conversation
@@ -109,6 +109,8 @@ def conversation_detail(request, conversation_id):
         object_id=conversation_id,
         is_read=False
     ).update(is_read=True)
+    from notifications.navbar import invalidate_user_state
+    invalidate_user_state(request.user.pk)
 
     return render(request, "messaging/conversation_detail.html", {
         "conversation": conversation,
@@ -1,5 +1,17 @@
-def unread_notifications(request):
-    if request.user.is_authenticated:
-        count = request.user.notifications.filter(is_read=False).count()
-        return {'unread_notification_count': count}
-    return {'unread_notification_count': 0}
\ No newline at end of file
+from functools import partial
+from notifications.navbar import NavbarState, USER_STATE_DEFAULTS, ADMIN_STATE_DEFAULTS
+
+
+def navbar_state(request):
+    """
+    Navbar/sidebar values for every template (unread counts, dashboard
+    access, user guide status and admin pending counts).
+
+    Each value is a callable, so Django templates only compute it when a
+    template actually references it; see notifications.navbar for caching.
+    """
+    state = NavbarState(request.user)
+    return {
+        name: partial(state.get, name)
+        for name in (*USER_STATE_DEFAULTS, *ADMIN_STATE_DEFAULTS)
+    }
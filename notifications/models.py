@@ -11,6 +11,71 @@ logger = logging.getLogger(__name__)
 
 CustomUser = get_user_model()
 
+
+class NotificationManager(models.Manager):
+    def bulk_notify(self, users, notif_type, message, object_id=None, batch_size=1000):
+        """
+        Create the same kind of notification for many users at once.
+
+        `users` may be a user queryset, user instances or user ids. `message`
+        is either a string or a callable taking a user id and returning the
+        message for that user. Per batch this costs one NotificationSettings
+        query and one INSERT; websocket events are pushed together once the
+        surrounding transaction commits.
+
+        Returns the list of created notifications.
+        """
+        if isinstance(users, models.QuerySet):
+            user_ids = list(users.values_list('pk', flat=True))
+        else:
+            user_ids = [getattr(user, 'pk', user) for user in users]
+
+        return self.bulk_send((
+            self.model(
+                user_id=user_id,
+                notif_type=notif_type,
+                message=message(user_id) if callable(message) else message,
+                object_id=object_id,
+            )
+            for user_id in user_ids
+        ), batch_size=batch_size)
+
+    def bulk_send(self, notifications, batch_size=1000):
+        """
+        Save many unsaved Notification instances at once; unlike bulk_notify
+        each may have its own user, type, message and object. Notifications
+        the recipient has muted in NotificationSettings are dropped. Same
+        per-batch cost and realtime push as bulk_notify.
+
+        Returns the list of created notifications.
+        """
+        from django.db import transaction
+        from notifications.utils import push_realtime_notifications
+
+        notifications = list(notifications)
+        created = []
+        for start in range(0, len(notifications), batch_size):
+            chunk = notifications[start:start + batch_size]
+
+            # Resolve should_notify for the whole chunk in one query
+            notif_settings = {
+                row.user_id: row
+                for row in NotificationSettings.objects.filter(user_id__in={n.user_id for n in chunk})
+            }
+            batch = [
+                notif for notif in chunk
+                if notif.user_id not in notif_settings
+                or notif_settings[notif.user_id].should_notify(notif.notif_type)
+            ]
+            created.extend(self.bulk_create(batch))
+
+        if created:
+            from notifications.navbar import invalidate_user_state
+            invalidate_user_state(*{notif.user_id for notif in created})
+            transaction.on_commit(lambda: push_realtime_notifications(created))
+        return created
+
+
 class Notification(models.Model):
     NOTIF_TYPES = [
         ("job_post", "New Job Posting"),
@@ -37,6 +102,8 @@ class Notification(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     object_id = models.IntegerField(null=True, blank=True) 
 
+    objects = NotificationManager()
+
     def save(self, *args, **kwargs):
         # Check if user has notification settings and if they want this type
         try:
@@ -189,6 +256,9 @@ class Notification(models.Model):
             is_archived=False
         )
         count = old_notifications.update(is_archived=True)
+        if count:
+            from notifications.navbar import invalidate_user_state
+            invalidate_user_state(user.pk)
         return count
     
     @property
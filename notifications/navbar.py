@@ -0,0 +1,156 @@
+"""
+Cached per-user "navbar state" shared by every rendered page.
+
+One context processor (notifications.context_processors.navbar_state)
+replaces the old unread-count, dashboard-access, user-guide and admin
+pending-count processors. Values are only computed when a template
+actually touches one of them, and are cached per user until a relevant
+model changes (see notifications.signals) or NAVBAR_CACHE_TIMEOUT passes.
+"""
+from django.core.cache import cache, caches
+from Trabaholink.cache import get_or_set_single_flight
+import logging
+
+logger = logging.getLogger(__name__)
+
+NAVBAR_CACHE_TIMEOUT = 300
+
+USER_STATE_KEY = 'navbar:user:{user_id}'
+ADMIN_STATE_KEY = 'navbar:admin'
+METRICS_KEY = 'navbar:metrics:{name}'
+
+# Values templates see for anonymous users (and non-admins for admin counts)
+USER_STATE_DEFAULTS = {
+    'unread_notification_count': 0,
+    'unread_notifications_count': 0,
+    'has_job_postings': False,
+    'has_job_applications': False,
+    'user_guide': None,
+    'user_guide_enabled': False,
+}
+
+ADMIN_STATE_DEFAULTS = {
+    'pending_skills_count': 0,
+    'pending_reports_count': 0,
+    'pending_flagged_chats_count': 0,
+    'pending_services_count': 0,
+}
+
+
+def _record(name):
+    """Count cache hits/misses so the hit ratio can be monitored."""
+    counters = caches['counters']
+    key = METRICS_KEY.format(name=name)
+    try:
+        counters.incr(key)
+    except ValueError:
+        counters.add(key, 0, timeout=None)
+        try:
+            counters.incr(key)
+        except ValueError:
+            pass
+    except Exception as e:
+        logger.debug(f"Navbar metrics update failed: {e}")
+
+
+def get_metrics():
+    """Return navbar cache hit/miss counters and hit ratio."""
+    counters = caches['counters']
+    hits = counters.get(METRICS_KEY.format(name='hits')) or 0
+    misses = counters.get(METRICS_KEY.format(name='misses')) or 0
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+    }
+
+
+def compute_user_state(user):
+    """Per-user values: unread notifications, dashboard access and guide status."""
+    from jobs.models import Job, JobApplication
+    from notifications.models import Notification
+    from users.models import UserGuideStatus
+
+    unread = Notification.objects.filter(user=user, is_read=False)
+    guide_status, _ = UserGuideStatus.objects.get_or_create(
+        user=user,
+        defaults={
+            'auto_popup_enabled': True,
+            'pages_completed': {},
+        }
+    )
+    return {
+        'unread_notification_count': unread.count(),
+        'unread_notifications_count': unread.filter(is_archived=False).count(),
+        'has_job_postings': Job.objects.filter(owner=user).exists(),
+        'has_job_applications': JobApplication.objects.filter(worker=user).exists(),
+        'user_guide': guide_status,
+        'user_guide_enabled': True,
+    }
+
+
+def compute_admin_state():
+    """Site-wide pending counts shown in the admin dashboard sidebar."""
+    from admin_dashboard.models import FlaggedChat
+    from reports.models import Report
+    from services.models import ServicePost
+    from users.models import Skill
+
+    return {
+        'pending_skills_count': Skill.objects.filter(status='pending').count(),
+        'pending_reports_count': Report.objects.filter(status='pending').count(),
+        'pending_flagged_chats_count': FlaggedChat.objects.filter(status='pending').count(),
+        'pending_services_count': ServicePost.objects.filter(status='pending').count(),
+    }
+
+
+class NavbarState:
+    """Lazily loads and caches navbar values for one request."""
+
+    def __init__(self, user):
+        self.user = user
+        self._user_state = None
+        self._admin_state = None
+
+    def _load(self, key, compute):
+        state = cache.get(key)
+        if state is None:
+            _record('misses')
+            state = get_or_set_single_flight(key, compute, timeout=NAVBAR_CACHE_TIMEOUT)
+        else:
+            _record('hits')
+        return state
+
+    def get(self, name):
+        is_admin = self.user.is_authenticated and self.user.role == 'admin'
+
+        if name in ADMIN_STATE_DEFAULTS:
+            if not is_admin:
+                return ADMIN_STATE_DEFAULTS[name]
+            if self._admin_state is None:
+                self._admin_state = self._load(ADMIN_STATE_KEY, compute_admin_state)
+            return self._admin_state[name]
+
+        # The archived-aware unread count is only shown in the admin dashboard
+        if not self.user.is_authenticated or (name == 'unread_notifications_count' and not is_admin):
+            return USER_STATE_DEFAULTS[name]
+
+        if self._user_state is None:
+            self._user_state = self._load(
+                USER_STATE_KEY.format(user_id=self.user.pk),
+                lambda: compute_user_state(self.user),
+            )
+        return self._user_state[name]
+
+
+def invalidate_user_state(*user_ids):
+    """Drop cached navbar state for the given users."""
+    keys = [USER_STATE_KEY.format(user_id=user_id) for user_id in user_ids if user_id]
+    if keys:
+        cache.delete_many(keys)
+
+
+def invalidate_admin_state():
+    """Drop the shared admin pending counts."""
+    cache.delete(ADMIN_STATE_KEY)
@@ -0,0 +1,48 @@
+"""
+Invalidate cached navbar state when the data behind it changes.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from notifications.models import Notification
+from notifications.navbar import invalidate_user_state, invalidate_admin_state
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def invalidate_navbar_on_notification(sender, instance, **kwargs):
+    invalidate_user_state(instance.user_id)
+
+
+@receiver(post_save, sender='jobs.Job')
+def invalidate_navbar_on_job(sender, instance, created, **kwargs):
+    if created:
+        invalidate_user_state(instance.owner_id)
+
+
+@receiver(post_save, sender='jobs.JobApplication')
+def invalidate_navbar_on_application(sender, instance, created, **kwargs):
+    if created:
+        invalidate_user_state(instance.worker_id)
+
+
+@receiver(post_delete, sender='jobs.Job')
+@receiver(post_delete, sender='jobs.JobApplication')
+def invalidate_navbar_on_dashboard_delete(sender, instance, **kwargs):
+    invalidate_user_state(getattr(instance, 'owner_id', None) or getattr(instance, 'worker_id', None))
+
+
+@receiver(post_save, sender='users.UserGuideStatus')
+def invalidate_navbar_on_guide_status(sender, instance, **kwargs):
+    invalidate_user_state(instance.user_id)
+
+
+@receiver(post_save, sender='users.Skill')
+@receiver(post_delete, sender='users.Skill')
+@receiver(post_save, sender='reports.Report')
+@receiver(post_delete, sender='reports.Report')
+@receiver(post_save, sender='admin_dashboard.FlaggedChat')
+@receiver(post_delete, sender='admin_dashboard.FlaggedChat')
+@receiver(post_save, sender='services.ServicePost')
+@receiver(post_delete, sender='services.ServicePost')
+def invalidate_navbar_admin_counts(sender, **kwargs):
+    invalidate_admin_state()
@@ -15,3 +15,36 @@ def send_notification_email(subject, message, recipient_email):
         # Log the error but don't crash the application
         print(f"Failed to send email to {recipient_email}: {str(e)}")
         pass
+
+
+def push_realtime_notifications(notifications):
+    """
+    Push websocket events for many notifications in one event-loop pass.
+
+    All group_send calls are gathered together instead of paying one blocking
+    async_to_sync round-trip to Redis per notification.
+    """
+    import asyncio
+    import logging
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    logger = logging.getLogger(__name__)
+
+    channel_layer = get_channel_layer()
+    if channel_layer is None or not notifications:
+        return
+
+    async def _send_all():
+        await asyncio.gather(*[
+            channel_layer.group_send(
+                f"notifications_{notif.user_id}",
+                {"type": "send_notification", "message": {"message": notif.message, "type": notif.notif_type}},
+            )
+            for notif in notifications
+        ])
+
+    try:
+        async_to_sync(_send_all)()
+    except Exception as e:
+        logger.warning(f"Realtime push failed for {len(notifications)} notifications: {e}")
@@ -5,6 +5,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.urls import reverse_lazy, reverse
 from .models import Notification, NotificationSettings
+from .navbar import invalidate_user_state
 from django.dispatch import receiver
 from notifications.utils import send_notification_email
 from django.contrib.auth import get_user_model
@@ -163,6 +164,7 @@ class MarkAllNotificationsAsReadView(LoginRequiredMixin, View):
     def post(self, request, *args, **kwargs):
         try:
             count = Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+            invalidate_user_state(request.user.pk)
             return JsonResponse({"status": "success", "message": f"{count} notifications marked as read", "count": count})
         except Exception as e:
             logger.error(f"Error marking all notifications as read for user {request.user.id}: {str(e)}")
@@ -251,6 +253,7 @@ class ArchiveAllReadView(LoginRequiredMixin, View):
                 is_read=True,
                 is_archived=False
             ).update(is_archived=True)
+            invalidate_user_state(request.user.pk)
             return JsonResponse({"status": "success", "message": f"{count} notifications archived", "count": count})
         except Exception as e:
             logger.error(f"Error archiving all read notifications for user {request.user.id}: {str(e)}")
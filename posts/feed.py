@@ -0,0 +1,142 @@
+"""
+Combined job/service feed built with a single UNION ALL query.
+
+Both branches select the same narrow set of card columns, are pre-filtered
+by the keyset cursor and pre-limited, and the union is ordered by
+(created_at, kind, id) descending, so each page reads at most `limit + 1`
+rows from each table no matter how large the inventory is.
+"""
+from django.core.files.storage import default_storage
+from django.db.models import CharField, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Left
+from django.urls import reverse
+from django.utils.dateparse import parse_datetime
+import base64
+import json
+
+from jobs.models import Job
+from services.models import ServicePost, ServicePostImage
+
+KIND_JOB = 'job'
+KIND_SERVICE = 'service'
+
+# Card text is truncated in the template at 150 characters
+SUMMARY_LENGTH = 200
+
+# Annotations must not reuse model field names (ServicePost.slug), and both
+# branches select these columns in this order
+FEED_COLUMNS = ('id', 'created_at', 'kind', 'feed_title', 'summary', 'image', 'feed_slug')
+
+
+class FeedItem:
+    """One card in the combined feed (a job or a service post)."""
+
+    def __init__(self, row):
+        self.id = row['id']
+        self.created_at = row['created_at']
+        self.kind = row['kind']
+        self.title = row['feed_title']
+        self.description = row['summary']
+        self.image = row['image']
+        self.slug = row['feed_slug']
+
+    @property
+    def post_type(self):
+        return 'Job' if self.kind == KIND_JOB else 'Service'
+
+    @property
+    def headline(self):
+        return self.title
+
+    @property
+    def image_url(self):
+        return default_storage.url(self.image) if self.image else None
+
+    def get_absolute_url(self):
+        if self.kind == KIND_JOB:
+            return reverse('jobs:job_detail', kwargs={'pk': self.id})
+        return reverse('services:servicepost_detail', kwargs={'slug': self.slug})
+
+
+def _job_rows():
+    return Job.objects.filter(is_active=True).annotate(
+        kind=Value(KIND_JOB, output_field=CharField()),
+        feed_title=F('title'),
+        summary=Left(Coalesce('description', Value('')), SUMMARY_LENGTH),
+        image=F('job_picture'),
+        feed_slug=Value('', output_field=CharField()),
+    )
+
+
+def _service_rows():
+    first_image = ServicePostImage.objects.filter(
+        service_post=OuterRef('pk')
+    ).order_by('id').values('image')[:1]
+    return ServicePost.objects.filter(is_active=True, created_at__isnull=False).annotate(
+        kind=Value(KIND_SERVICE, output_field=CharField()),
+        feed_title=F('headline'),
+        summary=Left('description', SUMMARY_LENGTH),
+        image=Subquery(first_image, output_field=CharField()),
+        feed_slug=F('slug'),
+    )
+
+
+def _after(kind, cursor):
+    """
+    Keyset condition for one branch: rows strictly after `cursor` in
+    (created_at, kind, id) descending order. `kind` is constant within a
+    branch, so the tuple comparison reduces to a per-branch condition.
+    """
+    created_at, cursor_kind, cursor_id = cursor
+    if kind < cursor_kind:
+        return Q(created_at__lte=created_at)
+    if kind > cursor_kind:
+        return Q(created_at__lt=created_at)
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=cursor_id)
+
+
+def fetch_feed(kinds, limit, cursor=None):
+    """
+    Return (items, next_cursor) for the newest `limit` posts of the given
+    kinds after `cursor`. next_cursor is None on the last page.
+    """
+    ordering = ('-created_at', '-kind', '-id')
+    branches = []
+    for kind, rows in ((KIND_JOB, _job_rows), (KIND_SERVICE, _service_rows)):
+        if kind not in kinds:
+            continue
+        queryset = rows()
+        if cursor:
+            queryset = queryset.filter(_after(kind, cursor))
+        branches.append(queryset.values(*FEED_COLUMNS).order_by(*ordering)[:limit + 1])
+
+    if not branches:
+        return [], None
+
+    feed = branches[0]
+    if len(branches) > 1:
+        feed = feed.union(*branches[1:], all=True)
+    rows = list(feed.order_by(*ordering)[:limit + 1])
+
+    items = [FeedItem(row) for row in rows[:limit]]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > limit else None
+    return items, next_cursor
+
+
+def encode_cursor(item):
+    payload = json.dumps([item.created_at.isoformat(), item.kind, item.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return (created_at, kind, id) or None for a missing/malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        created_at, kind, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        created_at = parse_datetime(created_at)
+    except (ValueError, TypeError):
+        return None
+    if created_at is None or kind not in (KIND_JOB, KIND_SERVICE):
+        return None
+    return created_at, kind, int(pk)
@@ -1,27 +1,30 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView
-from jobs.models import Job
-from services.models import ServicePost
+from .feed import KIND_JOB, KIND_SERVICE, decode_cursor, fetch_feed
+
 
 class CombinedPostListView(LoginRequiredMixin, ListView):
     template_name = "posts/combined_post_list.html"
     context_object_name = "posts"
-    paginate_by = 12
+    page_size = 12
 
     def get_queryset(self):
         filter_type = self.request.GET.get("type", "all")
-        items = []
         if filter_type == "job":
-            items.extend(Job.objects.filter(is_active=True))
+            kinds = {KIND_JOB}
         elif filter_type == "service":
-            items.extend(ServicePost.objects.filter(is_active=True))
+            kinds = {KIND_SERVICE}
         else:
-            items.extend(Job.objects.filter(is_active=True))
-            items.extend(ServicePost.objects.filter(is_active=True))
-        # Sort by created_at descending (newest first)
-        return sorted(items, key=lambda p: p.created_at, reverse=True)
+            kinds = {KIND_JOB, KIND_SERVICE}
+
+        # Merged and keyset-paginated in the database (see posts.feed)
+        cursor = decode_cursor(self.request.GET.get("cursor"))
+        items, self.next_cursor = fetch_feed(kinds, self.page_size, cursor)
+        return items
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["filter_type"] = self.request.GET.get("type", "all")
+        context["next_cursor"] = self.next_cursor
+        context["is_first_page"] = "cursor" not in self.request.GET
         return context
@@ -57,12 +57,11 @@ def handle_report_creation(sender, instance, created, **kwargs):
                 # Create notification for admins
                 from users.models import CustomUser
                 admins = CustomUser.objects.filter(role='admin', is_active=True)
-                for admin in admins:
-                    Notification.objects.create(
-                        user=admin,
-                        message=f"User '{user.username}' has been automatically deactivated after reaching {unique_report_count} reports.",
-                        notif_type="admin_alert"
-                    )
+                Notification.objects.bulk_notify(
+                    admins,
+                    "admin_alert",
+                    f"User '{user.username}' has been automatically deactivated after reaching {unique_report_count} reports.",
+                )
         
         elif instance.reported_post:
             # Handle post report
@@ -96,9 +95,8 @@ def handle_report_creation(sender, instance, created, **kwargs):
                 # Create notification for admins
                 from users.models import CustomUser
                 admins = CustomUser.objects.filter(role='admin', is_active=True)
-                for admin in admins:
-                    Notification.objects.create(
-                        user=admin,
-                        message=f"Job posting '{post.title}' (ID: {post.id}) has been automatically deactivated after reaching {unique_report_count} reports.",
-                        notif_type="admin_alert"
-                    )
+                Notification.objects.bulk_notify(
+                    admins,
+                    "admin_alert",
+                    f"Job posting '{post.title}' (ID: {post.id}) has been automatically deactivated after reaching {unique_report_count} reports.",
+                )
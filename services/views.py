@@ -10,6 +10,7 @@ from django.views.generic.base import RedirectView
 from .forms import ServicePostForm
 from .models import ServicePost, ServicePostImage
 from admin_dashboard.moderation_utils import check_for_banned_words
+from geo import geocode_text
 
 class ServicePostListView(RedirectView):
     """
@@ -93,8 +94,12 @@ class ServicePostCreateView(LoginRequiredMixin, CreateView):
                     messages.error(self.request, f"Invalid location coordinates: {str(e)}")
                     return self.form_invalid(form)
             else:
-                messages.error(self.request, "Location data is required. Please set a location on the map.")
-                return self.form_invalid(form)
+                # No map pin: fall back to the gazetteer centroid for the address
+                place = geocode_text(form.cleaned_data.get('address', ''))
+                if not place:
+                    messages.error(self.request, "Location data is required. Please set a location on the map.")
+                    return self.form_invalid(form)
+                form.instance.location = Point(place.lng, place.lat, srid=4326)
             
             response = super().form_valid(form)
             transaction.on_commit(lambda: self.save_images(self.object))
@@ -212,8 +217,12 @@ class ServicePostUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView)
                     messages.error(self.request, f"Invalid location coordinates: {str(e)}")
                     return self.form_invalid(form)
             else:
-                messages.error(self.request, "Location data is required. Please set a location on the map.")
-                return self.form_invalid(form)
+                # No map pin: fall back to the gazetteer centroid for the address
+                place = geocode_text(form.cleaned_data.get('address', ''))
+                if not place:
+                    messages.error(self.request, "Location data is required. Please set a location on the map.")
+                    return self.form_invalid(form)
+                form.instance.location = Point(place.lng, place.lat, srid=4326)
 
             response = super().form_valid(form)
             
@@ -262,7 +262,677 @@ class JobTest(TestCase):
         response = self.client.get(reverse('jobs:job_list'))
         self.assertEqual(response.status_code, 200)
         print("✅ Job list test passed")
-    
+
+    def test_job_list_count_is_cached(self):
+        """Test a repeated job list request reuses the cached total instead of counting again"""
+        from django.core.cache import cache
+        from django.test.utils import CaptureQueriesContext
+
+        cache.clear()
+        Job.objects.create(owner=self.employer, title='Counted job', category=self.category, budget=500)
+        params = {'category': self.category.id, 'page': 1}
+
+        self.client.get(reverse('jobs:job_list'), params)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('jobs:job_list'), params)
+        self.assertEqual(response.context['paginator'].count, 1)
+        counting = [q['sql'] for q in queries
+                    if q['sql'].startswith('EXPLAIN') or 'AS "__count" FROM "jobs_job"' in q['sql']]
+        self.assertEqual(counting, [])
+        print("✅ Job list count cache test passed")
+
+    def test_distance_keyset_pages(self):
+        """Test distance cursors page through tied distances and unlocated jobs without gaps or repeats"""
+        from django.contrib.gis.geos import Point
+
+        nearest = Job.objects.create(owner=self.employer, title='Nearest', category=self.category, budget=500,
+                                     location=Point(120.968096, 14.431095, srid=4326))
+        tied = [Job.objects.create(owner=self.employer, title=f'Tied {i}', category=self.category, budget=500,
+                                   location=Point(120.982478, 14.423512, srid=4326)) for i in range(10)]
+        unlocated = Job.objects.create(owner=self.employer, title='Unlocated', category=self.category, budget=500)
+
+        params = {'lat': '14.431095', 'lng': '120.968096', 'sort': 'distance'}
+        seen = []
+        response = self.client.get(reverse('jobs:job_list'), params)
+        while True:
+            seen += [job.pk for job in response.context['jobs']]
+            cursor = response.context['next_cursor']
+            if not cursor:
+                break
+            page = response.context['page_obj'].next_page_number()
+            response = self.client.get(reverse('jobs:job_list'), {**params, 'cursor': cursor, 'page': page})
+        self.assertEqual(seen, [nearest.pk, *sorted(job.pk for job in tied), unlocated.pk])
+        print("✅ Distance keyset pages test passed")
+
+    def test_job_search(self):
+        """Test full-text search ranks matches and tolerates misspelled locations"""
+        from jobs.search import search_jobs
+
+        plumbing = Job.objects.create(
+            owner=self.employer, title='Plumbing repair', description='Fix leaking pipes',
+            category=self.category, budget=800, municipality='Antipolo', barangay='Dalig',
+        )
+        Job.objects.create(
+            owner=self.employer, title='House painting', description='Paint two rooms',
+            category=self.category, budget=600, municipality='Taytay', barangay='Dolores',
+        )
+
+        results = list(search_jobs(Job.objects.all(), 'plumbing').order_by('-rank'))
+        self.assertEqual(results, [plumbing])
+
+        results = list(search_jobs(Job.objects.all(), 'Antipolu'))
+        self.assertEqual(results, [plumbing])
+        print("✅ Job search test passed")
+
+    def test_radius_search_uses_spatial_index(self):
+        """Test radius_km filter is answered through the GiST index on Job.location"""
+        from django.contrib.gis.geos import Point
+        from django.contrib.gis.measure import D
+        from django.db import connection
+
+        center = Point(121.1763, 14.5869, srid=4326)
+        Job.objects.create(
+            owner=self.employer, title='Nearby job', category=self.category, budget=500,
+            municipality='Antipolo', barangay='Dalig', location=center,
+        )
+
+        queryset = Job.objects.filter(location__dwithin=(center, D(km=5)))
+        self.assertEqual(queryset.count(), 1)
+
+        # Tiny test tables favour sequential scans; take that option away
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+        self.assertRegex(plan, r'Index Scan|Bitmap Index Scan')
+        self.assertNotIn('Seq Scan on jobs_job', plan)
+        print("✅ Radius index test passed")
+
+    @override_settings(USE_GIS=False)
+    def test_distance_sort_without_gis(self):
+        """Test distance sort and radius use the NumPy engine when GIS is disabled"""
+        far = Job.objects.create(
+            owner=self.employer, title='Far job', category=self.category, budget=500,
+            municipality='Antipolo', barangay='Dalig', latitude=14.593069, longitude=121.180027,
+        )
+        near = Job.objects.create(
+            owner=self.employer, title='Near job', category=self.category, budget=500,
+            municipality='Bacoor', barangay='Molino', latitude=14.423512, longitude=120.982478,
+        )
+        Job.objects.create(
+            owner=self.employer, title='Cebu job', category=self.category, budget=500,
+            municipality='Cebu City', barangay='Lahug', latitude=10.3157, longitude=123.8854,
+        )
+        params = {'lat': '14.431095', 'lng': '120.968096', 'sort': 'distance'}
+
+        # Candidates come from a bounding box, so jobs hundreds of km away are never ranked
+        response = self.client.get(reverse('jobs:job_list'), params)
+        self.assertEqual([job.pk for job in response.context['jobs']], [near.pk, far.pk])
+
+        response = self.client.get(reverse('jobs:job_list'), {**params, 'radius_km': '5'})
+        self.assertEqual([job.pk for job in response.context['jobs']], [near.pk])
+        self.assertLess(response.context['jobs'][0].distance_km, 5)
+        print("✅ Non-GIS distance test passed")
+
+    def test_new_job_fanout(self):
+        """Test the fanout notifies in-radius workers with matching categories, once, and honours muting"""
+        from django.contrib.gis.geos import Point
+        from jobs.models import GeneralCategory
+        from jobs.tasks_notifications import fanout_new_job_notifications
+        from notifications.models import NotificationSettings
+        from users.models import NotificationPreference
+
+        repairs = GeneralCategory.objects.create(slug='repairs', name='Repairs')
+        education = GeneralCategory.objects.create(slug='education', name='Education')
+        self.category.general_category = repairs
+        self.category.save()
+
+        users = {}
+        for name, role, radius_km, categories in [
+            ('anything', 'worker', 5, []), ('subscribed', 'worker', 5, [repairs]),
+            ('other_category', 'worker', 5, [education]), ('short_radius', 'worker', 1, []),
+            ('muted', 'worker', 5, []), ('client', 'client', 5, []),
+        ]:
+            users[name] = User.objects.create_user(username=name, password='testpass123', role=role)
+            preference = NotificationPreference.objects.create(
+                user=users[name], notification_location=Point(120.982478, 14.423512, srid=4326),
+                notification_radius_km=radius_km,
+            )
+            preference.preferred_categories.set(categories)
+        NotificationSettings.objects.create(user=users['muted'], notify_job_post=False)
+
+        # About 1.8 km from every worker above
+        job = Job.objects.create(owner=self.employer, title='Roof repair', category=self.category, budget=500,
+                                 latitude=14.431095, longitude=120.968096,
+                                 location=Point(120.968096, 14.431095, srid=4326))
+        with patch('jobs.tasks_recommendations.recommend_new_job.delay') as recommend:
+            result = fanout_new_job_notifications.apply(args=[job.pk]).get()
+            self.assertEqual(result, {'success': True, 'sent': 2})
+            notified = Notification.objects.filter(notif_type='job_post', object_id=job.pk)
+            self.assertEqual(set(notified.values_list('user__username', flat=True)), {'anything', 'subscribed'})
+            self.assertIn('1.8km', notified.first().message)
+            recommend.assert_called_once_with(job.pk)
+
+            # A retry skips workers who were already notified
+            Notification.objects.filter(user=users['anything']).delete()
+            result = fanout_new_job_notifications.apply(args=[job.pk], retries=1).get()
+        self.assertEqual(result, {'success': True, 'sent': 1})
+        self.assertEqual(Notification.objects.filter(notif_type='job_post', object_id=job.pk).count(), 2)
+        print("✅ New job fanout test passed")
+
+    @override_settings(USE_GIS=False)
+    def test_fanout_matching_without_gis(self):
+        """Test non-GIS fanout applies each worker's radius after a bounding-box prefilter"""
+        from django.contrib.gis.geos import Point
+        from jobs.tasks_notifications import get_matching_preferences
+        from users.models import NotificationPreference
+
+        job = Job.objects.create(owner=self.employer, title='Gate repair', category=self.category, budget=500,
+                                 latitude=14.431095, longitude=120.968096)
+        preferences = {}
+        for name, lat, lng, radius_km in [('near', 14.423512, 120.982478, 5), ('short', 14.423512, 120.982478, 1),
+                                          ('wide', 14.593069, 121.180027, 50), ('cebu', 10.3157, 123.8854, 5)]:
+            user = User.objects.create_user(username=name, password='testpass123', role='worker')
+            preferences[name] = NotificationPreference.objects.create(
+                user=user, notification_location=Point(lng, lat, srid=4326), notification_radius_km=radius_km,
+            )
+        near = preferences['near']
+        self.assertEqual((near.notification_latitude, near.notification_longitude), (14.423512, 120.982478))
+
+        matches = dict(get_matching_preferences(job))
+        self.assertEqual(set(matches), {near.user_id, preferences['wide'].user_id})
+        self.assertTrue(1700 < matches[near.user_id] < 1800)
+
+        # Moving the pin keeps the float columns in step
+        near.notification_location = Point(123.8854, 10.3157, srid=4326)
+        near.save(update_fields=['notification_location'])
+        self.assertEqual(set(dict(get_matching_preferences(job))), {preferences['wide'].user_id})
+        print("✅ Non-GIS fanout matching test passed")
+
+    def test_map_clusters(self):
+        """Test map tiles cluster nearby markers, are cached, and survive edits that don't move markers"""
+        from django.contrib.gis.geos import Point
+        from django.core.cache import cache
+        from jobs.map_clusters import get_clusters, get_map_version, query_tile, tiles_for_bbox
+
+        cache.clear()
+        bacoor = Point(120.982478, 14.423512, srid=4326)
+        first = Job.objects.create(owner=self.employer, title='Roofing', category=self.category, budget=500,
+                                   location=bacoor)
+        Job.objects.create(owner=self.employer, title='Tiling', category=self.category, budget=500,
+                           location=bacoor)
+        antipolo = Job.objects.create(owner=self.employer, title='Painting', category=self.category, budget=500,
+                                      location=Point(121.180027, 14.593069, srid=4326))
+        bbox, zoom = (120.9, 14.35, 121.25, 14.65), 12
+
+        features = sorted(get_clusters(bbox, zoom, 'job')['features'], key=lambda f: -f['properties']['count'])
+        self.assertEqual([f['properties']['count'] for f in features], [2, 1])
+        self.assertEqual(features[0]['properties']['jobs'], 2)
+        self.assertEqual((features[1]['properties']['kind'], features[1]['properties']['id']), ('job', antipolo.pk))
+        self.assertEqual(sum(len(query_tile(*tile, zoom, 'job')) for tile in tiles_for_bbox(bbox, zoom)), 2)
+        self.assertEqual(get_clusters(bbox, zoom, 'service')['features'], [])
+
+        # Every tile is cached now
+        with patch('jobs.map_clusters.query_tile', side_effect=AssertionError):
+            self.assertEqual(len(get_clusters(bbox, zoom, 'job')['features']), 2)
+
+        # A title edit keeps the cache; deactivating a job drops it
+        version = get_map_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            first.title = 'Roof repair'
+            first.save()
+        self.assertEqual(get_map_version(), version)
+        with self.captureOnCommitCallbacks(execute=True):
+            first.is_active = False
+            first.save()
+        self.assertEqual(get_map_version(), version + 1)
+        features = get_clusters(bbox, zoom, 'job')['features']
+        self.assertEqual(sorted(f['properties']['count'] for f in features), [1, 1])
+        print("✅ Map clusters test passed")
+
+    def test_map_clusters_api(self):
+        """Test the map clusters endpoint returns GeoJSON and rejects bad tiles"""
+        from django.contrib.gis.geos import Point
+
+        Job.objects.create(owner=self.employer, title='Roofing', category=self.category, budget=500,
+                           location=Point(120.982478, 14.423512, srid=4326))
+        url = reverse('map_clusters')
+        response = self.client.get(url, {'bbox': '120.9,14.35,121.25,14.65', 'zoom': '12'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['type'], 'FeatureCollection')
+        self.assertEqual([f['properties']['count'] for f in data['features']], [1])
+        self.assertIn('max-age', response['Cache-Control'])
+
+        self.assertEqual(self.client.get(url, {'bbox': '121,14,120,15', 'zoom': '12'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'bbox': '120,14,122,16', 'zoom': '16'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'bbox': '120.9,14.35,121.25,14.65', 'zoom': '30'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'bbox': '120.9,14.35,121.25,14.65', 'zoom': '12',
+                                               'type': 'shops'}).status_code, 400)
+        print("✅ Map clusters API test passed")
+
+    def test_activity_summary_counters(self):
+        """Test dashboard counters follow saves and reconcile repairs drift"""
+        from jobs.activity_summary import get_activity_summary, rebuild_summaries
+        from jobs.models import UserActivitySummary
+
+        job = Job.objects.create(owner=self.employer, title='Counted job', category=self.category, budget=500)
+        employer = get_activity_summary(self.employer)
+        self.assertEqual((employer.jobs_total, employer.jobs_active), (1, 1))
+
+        application = JobApplication.objects.create(job=job, worker=self.worker)
+        employer.refresh_from_db()
+        self.assertEqual(employer.applications_received_pending, 1)
+        self.assertEqual(get_activity_summary(self.worker).applications_sent_pending, 1)
+
+        application.status = 'Rejected'
+        application.save()
+        employer.refresh_from_db()
+        self.assertEqual(employer.applications_received_pending, 0)
+        self.assertEqual(employer.applications_received_rejected, 1)
+
+        UserActivitySummary.objects.filter(user=self.employer).update(jobs_total=7)
+        self.assertEqual(rebuild_summaries([self.employer.pk]), [self.employer.pk])
+        employer.refresh_from_db()
+        self.assertEqual(employer.jobs_total, 1)
+        print("✅ Activity summary test passed")
+
+    def test_job_expiry_sweep(self):
+        """Test the sweep deactivates overdue jobs, schedules imminent ones and only releases its own lock"""
+        from datetime import timedelta
+        from django.core.cache import cache
+        from django.utils import timezone
+        from jobs.activity_summary import get_activity_summary
+        from jobs.tasks_expiry import EXPIRY_LOCK_KEY, expire_job, sweep_expired_jobs
+
+        cache.clear()
+        now = timezone.now()
+        overdue, soon, later = [
+            Job.objects.create(owner=self.employer, title=title, category=self.category, budget=500, expires_at=expires_at)
+            for title, expires_at in [('Overdue', now - timedelta(hours=1)), ('Soon', now + timedelta(minutes=5)),
+                                      ('Later', now + timedelta(days=2))]
+        ]
+
+        with patch.object(expire_job, 'apply_async') as apply_async:
+            result = sweep_expired_jobs()
+        self.assertEqual(result, {'success': True, 'deactivated': 1, 'scheduled': 1})
+        apply_async.assert_called_once_with(args=[soon.pk], eta=soon.expires_at)
+        overdue.refresh_from_db()
+        self.assertFalse(overdue.is_active)
+        self.assertIsNone(cache.get(EXPIRY_LOCK_KEY))
+
+        # The ETA trigger is a no-op until the job is actually due
+        self.assertEqual(expire_job(soon.pk), 0)
+        Job.objects.filter(pk=soon.pk).update(expires_at=now - timedelta(minutes=1))
+        self.assertEqual(expire_job(soon.pk), 1)
+        self.assertEqual(list(Job.objects.filter(is_active=True).values_list('pk', flat=True)), [later.pk])
+        self.assertEqual(get_activity_summary(self.employer).jobs_active, 1)
+
+        # Another worker holds the lock: skip, and leave its lock alone
+        cache.add(EXPIRY_LOCK_KEY, 'other-worker', timeout=60)
+        self.assertEqual(sweep_expired_jobs(), {'success': False, 'reason': 'locked'})
+        self.assertEqual(cache.get(EXPIRY_LOCK_KEY), 'other-worker')
+
+        # Our lock expired mid-sweep and another worker took it: it is not deleted
+        cache.delete(EXPIRY_LOCK_KEY)
+
+        def lock_taken_over():
+            cache.set(EXPIRY_LOCK_KEY, 'other-worker', timeout=60)
+            return 0
+        with patch.object(Job, 'deactivate_expired_jobs', side_effect=lock_taken_over):
+            sweep_expired_jobs()
+        self.assertEqual(cache.get(EXPIRY_LOCK_KEY), 'other-worker')
+        print("✅ Job expiry sweep test passed")
+
+    def test_schedule_conflicts(self):
+        """Test the range-based conflict engine for single and batch checks"""
+        from datetime import date, time
+        from jobs.schedule_conflicts import find_conflicts, worker_conflicts
+
+        job = Job.objects.create(owner=self.employer, title='Morning shift', category=self.category, budget=500)
+        booked = Contract.objects.create(
+            job=job, worker=self.worker, client=self.employer, status='Finalized',
+            start_date=date(2030, 1, 6), end_date=date(2030, 1, 10),
+            start_time=time(8, 0), end_time=time(12, 0),
+        )
+
+        conflicts = worker_conflicts(self.worker.pk, date(2030, 1, 9), date(2030, 1, 12), time(11, 0), time(15, 0))
+        self.assertEqual([c.contract_id for c in conflicts], [booked.pk])
+        self.assertEqual((conflicts[0].overlap_start, conflicts[0].overlap_end), (date(2030, 1, 9), date(2030, 1, 10)))
+
+        # Back-to-back hours and later dates don't conflict; no hours means all day
+        self.assertEqual(worker_conflicts(self.worker.pk, date(2030, 1, 9), date(2030, 1, 9), time(12, 0), time(17, 0)), [])
+        self.assertEqual(worker_conflicts(self.worker.pk, date(2030, 1, 11), date(2030, 1, 12)), [])
+        self.assertEqual(len(worker_conflicts(self.worker.pk, date(2030, 1, 7))), 1)
+        self.assertEqual(worker_conflicts(self.worker.pk, date(2030, 1, 7), exclude_contract_id=booked.pk), [])
+
+        batch = find_conflicts([self.worker.pk, self.employer.pk], date(2030, 1, 1), date(2030, 1, 31))
+        self.assertEqual(list(batch), [self.worker.pk])
+        print("✅ Schedule conflict test passed")
+
+    def test_availability_bitmap(self):
+        """Test availability checks use merged weekly slots and stay fresh after edits"""
+        from datetime import date, time
+        from jobs.models import WorkerAvailability
+
+        # Tuesday 8-10 and 10-12 together cover an 8-12 window
+        WorkerAvailability.objects.create(worker=self.worker, day_of_week=1, start_time=time(8, 0), end_time=time(10, 0))
+        WorkerAvailability.objects.create(worker=self.worker, day_of_week=1, start_time=time(10, 0), end_time=time(12, 0))
+        tuesday, wednesday = date(2030, 1, 1), date(2030, 1, 2)
+
+        result = WorkerAvailability.check_availability_for_contract(self.worker, tuesday, tuesday, time(8, 0), time(12, 0))
+        self.assertTrue(result['available'])
+
+        result = WorkerAvailability.check_availability_for_contract(self.worker, tuesday, wednesday, time(8, 0), time(12, 0))
+        self.assertEqual([c['date'] for c in result['conflicts']], [wednesday])
+
+        WorkerAvailability.objects.filter(worker=self.worker, start_time=time(10, 0)).delete()
+        result = WorkerAvailability.check_availability_for_contract(self.worker, tuesday, tuesday, time(8, 0), time(12, 0))
+        self.assertFalse(result['available'])
+        self.assertIn('08:00 AM-10:00 AM', result['conflicts'][0]['reason'])
+        print("✅ Availability bitmap test passed")
+
+    def test_worker_search_params(self):
+        """Test available-worker search parameters are parsed and validated"""
+        from datetime import date, time
+        from jobs.worker_search import WorkerSearchError, parse_search
+
+        job = Job.objects.create(owner=self.employer, title='Tiling', category=self.category, budget=500,
+                                 latitude=14.6, longitude=121.0)
+        search = parse_search({
+            'job': str(job.pk), 'start_date': '2030-01-01', 'end_date': '2030-01-31',
+            'start_time': '08:00', 'end_time': '12:00', 'weekdays': 'tue,Thursday', 'radius_km': '500',
+        }, self.employer)
+        self.assertEqual((search.lat, search.lng), (14.6, 121.0))
+        self.assertEqual(search.weekdays, [1, 3])
+        self.assertEqual((search.start_date, search.end_date), (date(2030, 1, 1), date(2030, 1, 31)))
+        self.assertEqual((search.start_time, search.end_time), (time(8, 0), time(12, 0)))
+        self.assertEqual(search.radius_km, 100.0)
+        self.assertEqual(search.exclude_user_id, self.employer.pk)
+
+        schedule = {'start_date': '2030-01-01', 'start_time': '08:00', 'end_time': '12:00'}
+        with self.assertRaises(WorkerSearchError):
+            parse_search({'job': str(job.pk), 'start_date': '2030-01-01'}, self.employer)
+        # Arbitrary coordinates and other users' jobs are refused
+        with self.assertRaises(WorkerSearchError):
+            parse_search({'lat': '14.6', 'lng': '121.0', **schedule}, self.employer)
+        with self.assertRaises(WorkerSearchError):
+            parse_search({'job': str(job.pk), **schedule}, self.worker)
+        with self.assertRaises(WorkerSearchError):
+            parse_search({**schedule, 'job': str(job.pk), 'start_date': '2030-02-30'}, self.employer)
+        with self.assertRaises(WorkerSearchError):
+            parse_search({**schedule, 'job': str(job.pk), 'end_time': '25:00'}, self.employer)
+        print("✅ Worker search parameters test passed")
+
+    def test_available_workers_search(self):
+        """Test the available-worker search keeps free workers in range and drops booked ones"""
+        from datetime import date, time
+        from django.contrib.gis.geos import Point
+        from jobs.models import WorkerAvailability
+
+        self.employer.role = 'client'
+        self.employer.save()
+        job = Job.objects.create(owner=self.employer, title='Tiling', category=self.category, budget=500,
+                                 latitude=14.431095, longitude=120.968096)
+        workers = {}
+        for name, lat, lng in [('free', 14.423512, 120.982478), ('booked', 14.423512, 120.982478),
+                               ('far', 14.593069, 121.180027)]:
+            workers[name] = User.objects.create_user(username=name, password='testpass123', role='worker',
+                                                     location=Point(lng, lat, srid=4326))
+            # Tuesday 8-12
+            WorkerAvailability.objects.create(worker=workers[name], day_of_week=1,
+                                              start_time=time(8, 0), end_time=time(12, 0))
+        Contract.objects.create(job=job, worker=workers['booked'], client=self.employer, status='Finalized',
+                                start_date=date(2030, 1, 1), end_date=date(2030, 1, 1),
+                                start_time=time(8, 0), end_time=time(12, 0))
+
+        params = {'job': job.pk, 'start_date': '2030-01-01', 'start_time': '08:00', 'end_time': '12:00',
+                  'radius_km': '10'}
+        self.client.login(username='employer', password='testpass123')
+        data = self.client.get(reverse('jobs_api:available_workers'), params).json()
+        self.assertEqual(data['candidates'], 2)
+        self.assertEqual([worker['id'] for worker in data['results']], [workers['free'].pk])
+        self.assertEqual(data['results'][0]['distance_km'], 2.0)
+
+        self.client.login(username='worker', password='testpass123')
+        self.assertEqual(self.client.get(reverse('jobs_api:available_workers'), params).status_code, 403)
+        print("✅ Available workers search test passed")
+
+    def test_schedule_reminders(self):
+        """Test day-ahead reminders are sent in bulk once per occurrence"""
+        from datetime import date
+        from jobs.models import ReminderLog
+        from jobs.reminders import send_due_reminders
+        from notifications.models import Notification
+
+        job = Job.objects.create(owner=self.employer, title='Roof repair', category=self.category, budget=500)
+        contract = Contract.objects.create(
+            job=job, worker=self.worker, client=self.employer, status='Finalized',
+            start_date=date(2030, 1, 2), end_date=date(2030, 1, 4),
+        )
+
+        sent = send_due_reminders(date(2030, 1, 1))
+        self.assertEqual(sent['contract_start_1d'], 1)
+        self.assertEqual(sent['contract_end_3d'], 1)
+        self.assertEqual(Notification.objects.filter(object_id=contract.pk, notif_type='schedule_reminder').count(), 2)
+        self.assertEqual(Notification.objects.filter(object_id=contract.pk, notif_type='schedule_deadline').count(), 1)
+
+        # A second run the same day finds nothing due
+        self.assertEqual(sum(send_due_reminders(date(2030, 1, 1)).values()), 0)
+        self.assertEqual(ReminderLog.objects.filter(contract=contract).count(), 2)
+
+        # Rows another run logged meanwhile are skipped; the rest are still logged
+        from jobs.reminders import REMINDER_KINDS, log_reminders
+        later = Contract.objects.create(job=job, worker=self.worker, client=self.employer, status='Finalized',
+                                        start_date=date(2030, 1, 2), end_date=date(2030, 1, 9))
+        self.assertEqual(log_reminders(REMINDER_KINDS[0], date(2030, 1, 2), [contract.pk, later.pk]), {later.pk})
+        print("✅ Schedule reminders test passed")
+
+    def test_calendar_window_etag(self):
+        """Test calendar events are clipped to the window and revalidate with ETags"""
+        from datetime import date
+        from django.core.cache import cache
+
+        cache.clear()
+        job = Job.objects.create(owner=self.employer, title='Long build', category=self.category, budget=500)
+        contract = Contract.objects.create(
+            job=job, worker=self.worker, client=self.employer, status='In Progress',
+            start_date=date(2029, 6, 1), end_date=date(2031, 6, 1),
+        )
+        self.client.login(username='worker', password='testpass123')
+        url = reverse('jobs:worker_calendar_api')
+
+        response = self.client.get(url, {'start': '2030-01-01', 'end': '2030-01-07'})
+        self.assertEqual(len(response.json()), 7)
+        etag = response['ETag']
+
+        # Revalidation is decided from the version and join windows alone
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'start': '2030-01-01', 'end': '2030-01-07'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse([q for q in queries if 'jobs_contract' in q['sql']])
+
+        # Changing the contract invalidates the cached window once it commits
+        contract.end_date = date(2030, 1, 3)
+        with self.captureOnCommitCallbacks(execute=True):
+            contract.save()
+        response = self.client.get(url, {'start': '2030-01-01', 'end': '2030-01-07'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 3)
+        print("✅ Calendar window ETag test passed")
+
+    def test_calendar_feed(self):
+        """Test the tokenized iCalendar feed renders recurring contracts and revalidates"""
+        from datetime import time, timedelta
+        from django.utils import timezone
+
+        job = Job.objects.create(owner=self.employer, title='Painting', category=self.category, budget=500)
+        Contract.objects.create(
+            job=job, worker=self.worker, client=self.employer, status='Finalized',
+            start_date=timezone.localdate(), end_date=timezone.localdate() + timedelta(days=4),
+            start_time=time(8, 0), end_time=time(12, 0),
+        )
+        self.client.login(username='worker', password='testpass123')
+        url = self.client.get(reverse('jobs:calendar_feed_link')).json()['url']
+        self.client.logout()
+
+        response = self.client.get(url)
+        body = b''.join(response.streaming_content).decode()
+        self.assertEqual(body.count('BEGIN:VEVENT'), 1)
+        self.assertIn('RRULE:FREQ=DAILY', body)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.client.get(url.replace('.ics', 'x.ics')).status_code, 404)
+
+        # Rotating the token revokes the old URL even though it was cached
+        self.client.login(username='worker', password='testpass123')
+        with self.captureOnCommitCallbacks(execute=True):
+            new_url = self.client.post(reverse('jobs:calendar_feed_link')).json()['url']
+        self.client.logout()
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.get(new_url).status_code, 200)
+        print("✅ Calendar feed test passed")
+
+    def test_calendar_feed_after_commit(self):
+        """Test a contract change inside a transaction reaches the feed only once it commits"""
+        from datetime import timedelta
+        from django.db import transaction
+        from django.utils import timezone
+
+        job = Job.objects.create(owner=self.employer, title='Painting', category=self.category, budget=500)
+        contract = Contract.objects.create(
+            job=job, worker=self.worker, client=self.employer, status='Finalized',
+            start_date=timezone.localdate(), end_date=timezone.localdate() + timedelta(days=4),
+        )
+        self.client.login(username='worker', password='testpass123')
+        url = self.client.get(reverse('jobs:calendar_feed_link')).json()['url']
+        self.client.logout()
+        response = self.client.get(url)
+        self.assertEqual(b''.join(response.streaming_content).decode().count('BEGIN:VEVENT'), 1)
+        etag = response['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                contract.status = 'Cancelled'
+                contract.save()
+                # Before commit the version is unchanged, so nothing new is rendered or cached
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(b''.join(response.streaming_content).decode().count('BEGIN:VEVENT'), 0)
+        print("✅ Calendar feed after commit test passed")
+
+    def _recommendation_setup(self):
+        """A worker subscribed to one general category, pinned in Bacoor with a 10 km radius"""
+        from django.contrib.gis.geos import Point
+        from jobs.models import GeneralCategory
+        from users.models import NotificationPreference
+
+        subscribed = GeneralCategory.objects.create(slug='repairs', name='Repairs')
+        self.category.general_category = subscribed
+        self.category.save()
+        preference = NotificationPreference.objects.create(
+            user=self.worker, notification_location=Point(120.968096, 14.431095, srid=4326),
+            notification_radius_km=10,
+        )
+        preference.preferred_categories.add(subscribed)
+        return JobCategory.objects.create(name='Tutoring',
+                                          general_category=GeneralCategory.objects.create(slug='education', name='Education'))
+
+    def test_recommendation_scoring(self):
+        """Test jobs score by category, then distance, and a worker's own postings never rank"""
+        from jobs.recommendations import load_candidates, load_profiles, score_candidates
+
+        other_category = self._recommendation_setup()
+        jobs = {}
+        for name, owner, category, lat, lng in [
+            ('near', self.employer, self.category, 14.423512, 120.982478),
+            ('far', self.employer, self.category, 14.593069, 121.180027),
+            ('other', self.employer, other_category, 14.423512, 120.982478),
+            ('own', self.worker, self.category, 14.423512, 120.982478),
+        ]:
+            jobs[name] = Job.objects.create(owner=owner, title=name, category=category, budget=500,
+                                            latitude=lat, longitude=lng)
+
+        candidates = load_candidates(Job.objects.filter(pk__in=[job.pk for job in jobs.values()]))
+        scores, distances = score_candidates(load_profiles([self.worker.pk])[self.worker.pk], candidates)
+        ranked = [candidates.ids[i] for i in sorted(range(len(scores)), key=lambda i: -scores[i])]
+        self.assertEqual(ranked, [jobs[name].pk for name in ('near', 'far', 'other', 'own')])
+        self.assertEqual(scores[candidates.ids.index(jobs['own'].pk)], -1.0)
+        self.assertTrue(1.7 < distances[candidates.ids.index(jobs['near'].pk)] < 1.8)
+        print("✅ Recommendation scoring test passed")
+
+    def test_recommendations_merge_trim_and_apply(self):
+        """Test a new job merges into a full list, the list stays at TOP_N, and applying removes it"""
+        from jobs.models import WorkerRecommendation
+        from jobs.recommendations import TOP_N
+        from jobs.tasks_recommendations import recommend_new_job
+
+        self._recommendation_setup()
+        stale = [Job.objects.create(owner=self.employer, title=f'Old job {i}', category=self.category, budget=500)
+                 for i in range(TOP_N)]
+        WorkerRecommendation.objects.bulk_create([
+            WorkerRecommendation(worker=self.worker, job=job, score=0.01 * (i + 1)) for i, job in enumerate(stale)
+        ])
+        new_job = Job.objects.create(owner=self.employer, title='New job', category=self.category, budget=500,
+                                     latitude=14.423512, longitude=120.982478)
+
+        self.assertEqual(recommend_new_job(new_job.pk), {'workers': 1})
+        kept = set(WorkerRecommendation.objects.filter(worker=self.worker).values_list('job_id', flat=True))
+        self.assertEqual(len(kept), TOP_N)
+        self.assertIn(new_job.pk, kept)
+        self.assertNotIn(stale[0].pk, kept)
+
+        JobApplication.objects.create(job=new_job, worker=self.worker)
+        self.assertFalse(WorkerRecommendation.objects.filter(worker=self.worker, job=new_job).exists())
+        print("✅ Recommendation merge/trim/apply test passed")
+
+    def test_recommended_api(self):
+        """Test the recommended action returns stored recommendations best first, open jobs only"""
+        from jobs.models import WorkerRecommendation
+
+        best, good, closed = [
+            Job.objects.create(owner=self.employer, title=title, category=self.category, budget=500)
+            for title in ('Best match', 'Good match', 'Closed job')
+        ]
+        closed.is_active = False
+        closed.save()
+        WorkerRecommendation.objects.bulk_create([
+            WorkerRecommendation(worker=self.worker, job=good, score=0.5),
+            WorkerRecommendation(worker=self.worker, job=best, score=0.9, distance_km=1.234),
+            WorkerRecommendation(worker=self.worker, job=closed, score=0.95),
+        ])
+
+        self.client.login(username='worker', password='testpass123')
+        data = self.client.get(reverse('jobs_api:job-recommended'), {'limit': 5}).json()
+        self.assertEqual([item['id'] for item in data], [best.pk, good.pk])
+        self.assertEqual([item['recommendation_score'] for item in data], [0.9, 0.5])
+        self.assertEqual(data[0]['distance_km'], 1.23)
+        print("✅ Recommended API test passed")
+
+    def test_workload_range(self):
+        """Test per-day workload over a range matches single-day calculations"""
+        from datetime import date, timedelta
+        from jobs.schedule_utils import calculate_workload, workload_range
+
+        job = Job.objects.create(owner=self.employer, title='Fence', category=self.category, budget=500)
+        Contract.objects.create(job=job, worker=self.worker, client=self.employer, status='In Progress',
+                                start_date=date(2030, 1, 2), end_date=date(2030, 1, 4))
+        Contract.objects.create(job=job, worker=self.worker, client=self.employer, status='Awaiting Review',
+                                start_date=date(2030, 1, 4), end_date=None)
+
+        workload = workload_range(self.worker.pk, date(2030, 1, 1), date(2030, 1, 6))
+        self.assertEqual([day['contract_count'] for day in workload['days']], [0, 1, 1, 2, 1, 1])
+        self.assertEqual(workload['days'][3]['level'], 'moderate')
+        for offset in range(6):
+            day = date(2030, 1, 1) + timedelta(days=offset)
+            self.assertEqual(calculate_workload(self.worker.pk, day)['contract_count'],
+                             workload['days'][offset]['contract_count'])
+        print("✅ Workload range test passed")
+
     def test_job_application(self):
         """Test worker can apply to job"""
         # Create job
@@ -391,6 +1061,136 @@ class ServiceTest(TestCase):
         self.assertTrue(Review.objects.filter(service=service, reviewer=self.client_user).exists())
         print("✅ Review creation test passed")
 
+    def test_combined_feed(self):
+        """Test the combined feed merges jobs and services newest first"""
+        if not JOBS_AVAILABLE:
+            self.skipTest("Jobs models not available")
+        job = Job.objects.create(owner=self.client_user, title='Fix the sink', budget=500,
+                                 category=JobCategory.objects.create(name='Repairs'))
+        service = ServicePost.objects.create(
+            worker=self.worker, headline='Pipe repair', description='Leaks and clogs', availability='Weekdays',
+            contact_number='09170000000', email='worker@example.com', category=self.category, address='Antipolo',
+        )
+
+        self.client.login(username='client', password='testpass123')
+        response = self.client.get(reverse('posts:combined_list'))
+        self.assertEqual(response.status_code, 200)
+        posts = response.context['posts']
+        self.assertEqual([(post.kind, post.id) for post in posts], [('service', service.pk), ('job', job.pk)])
+        self.assertEqual(posts[0].get_absolute_url(), service.get_absolute_url())
+        self.assertContains(response, 'Pipe repair')
+
+        response = self.client.get(reverse('posts:combined_list'), {'type': 'service'})
+        self.assertEqual([post.slug for post in response.context['posts']], [service.slug])
+        print("✅ Combined feed test passed")
+
+
+class GeoTest(TestCase):
+    """Test offline gazetteer lookups"""
+
+    def test_normalize(self):
+        """Test place names are normalized for matching"""
+        from geo import normalize
+
+        self.assertEqual(normalize('Brgy. Molino IV'), 'molino 4')
+        self.assertEqual(normalize('  DASMARIÑAS  '), 'dasmarinas')
+        self.assertEqual(normalize('Barangay Queens Row, East'), 'queens row east')
+        # Roman numerals after the first word are numbers; a leading one is part of the name
+        self.assertEqual(normalize('V. Luna'), 'v luna')
+        self.assertEqual(normalize(None), '')
+        print("✅ Normalize test passed")
+
+    def test_lookup_barangay(self):
+        """Test barangays match by alias within a fuzzily matched municipality"""
+        from geo import lookup_barangay
+
+        place = lookup_barangay('Bacoor City', 'Brgy. Molino IV')
+        self.assertEqual((place.name, place.kind, place.municipality), ('Molino', 'barangay', 'Bacoor'))
+        self.assertEqual(lookup_barangay('Bacor', 'Zapote 2').name, 'Zapote')
+        # Barangay names are never fuzzy matched, and belong to one municipality
+        self.assertIsNone(lookup_barangay('Bacoor', 'Molinoo'))
+        self.assertIsNone(lookup_barangay('Manila', 'Molino'))
+        self.assertIsNone(lookup_barangay('Bacoor', ''))
+        print("✅ Barangay lookup test passed")
+
+    def test_geocode_text(self):
+        """Test free-text addresses resolve to the most specific known place"""
+        from geo import geocode_text
+
+        place = geocode_text('Blk 3 Lot 5, Molino 2, Bacoor')
+        self.assertEqual((place.name, place.kind), ('Molino', 'barangay'))
+        place = geocode_text('123 Rizal St, Unknown Subdivision, Imus City')
+        self.assertEqual((place.name, place.kind), ('Imus', 'municipality'))
+        self.assertIsNone(geocode_text('Somewhere far away'))
+        self.assertIsNone(geocode_text(''))
+        print("✅ Geocode text test passed")
+
+
+class VerificationOCRTest(TestCase):
+    """Test the parallel multi-version ID OCR"""
+
+    GOOD_TEXT = (
+        "REPUBLIKA NG PILIPINAS\nPCN 1234-5678-9012-3456\nDELA CRUZ, JUAN SANTOS\nJANUARY 15, 1990\n"
+        "ADDRESS 123 RIZAL STREET, BARANGAY MOLINO, BACOOR CITY, CAVITE"
+    )
+
+    def setUp(self):
+        from users.services.verification import ocr_improved_v3
+        if not ocr_improved_v3.TESSERACT_AVAILABLE:
+            self.skipTest("pytesseract not available")
+        from django.core.cache import cache
+        cache.clear()
+        self.ocr = ocr_improved_v3.ImprovedIDOCR()
+
+    def test_text_and_confidence(self):
+        """Test image_to_data rows are joined per line and block and word confidences averaged"""
+        from users.services.verification.ocr_improved_v3 import text_and_confidence
+
+        data = {
+            'text': ['', '', '', 'DELA', 'CRUZ,', 'JUAN', ' ', 'PCN', '1234'],
+            'conf': ['-1', '-1', '-1', '90', '80', '70', '95', '60', '100'],
+            'block_num': [0, 1, 1, 1, 1, 1, 1, 2, 2],
+            'par_num': [0, 0, 1, 1, 1, 1, 1, 1, 1],
+            'line_num': [0, 0, 0, 1, 1, 2, 2, 1, 1],
+        }
+        text, confidence = text_and_confidence(data)
+        self.assertEqual(text, "DELA CRUZ,\nJUAN\n\nPCN 1234")
+        self.assertEqual(confidence, 82.5)
+        self.assertEqual(text_and_confidence({'text': [], 'conf': [], 'block_num': [], 'par_num': [],
+                                              'line_num': []}), ("", 0))
+        print("✅ OCR text and confidence test passed")
+
+    def test_is_good_enough(self):
+        """Test the early-exit check needs the quality threshold and every required field"""
+        self.assertTrue(self.ocr.is_good_enough([{'text': self.GOOD_TEXT, 'quality_score': 80}]))
+        self.assertFalse(self.ocr.is_good_enough([{'text': self.GOOD_TEXT, 'quality_score': 70}]))
+        without_pcn = self.GOOD_TEXT.replace('1234-5678-9012-3456', '')
+        self.assertFalse(self.ocr.is_good_enough([{'text': without_pcn, 'quality_score': 90}]))
+        self.assertFalse(self.ocr.is_good_enough([]))
+        print("✅ OCR quality check test passed")
+
+    def test_early_exit(self):
+        """Test the search stops at the first good enough result and records its win"""
+        from PIL import Image
+        from users.services.verification.ocr_improved_v3 import PSM_MODES, combination_key, load_win_counts
+
+        image = Image.new('RGB', (200, 100), 'white')
+        with patch('users.services.verification.ocr_improved_v3.run_combination',
+                   return_value=(self.GOOD_TEXT, 98.0, 0.01)):
+            text, confidence = self.ocr.extract_text_multi_version(image)
+        self.assertEqual(len(self.ocr.timings), 1)
+        self.assertEqual((text, confidence), (self.GOOD_TEXT, 98.0))
+        winner = combination_key(self.ocr.timings[0]['version'], self.ocr.timings[0]['psm'])
+        self.assertEqual(load_win_counts([winner]), {winner: 1})
+
+        # Without a good enough result every combination runs
+        with patch('users.services.verification.ocr_improved_v3.run_combination',
+                   return_value=("BLURRY", 40.0, 0.01)):
+            text, confidence = self.ocr.extract_text_multi_version(image)
+        self.assertEqual(len(self.ocr.timings), 4 * len(PSM_MODES))
+        self.assertEqual(text, "BLURRY\nBLURRY\nBLURRY")
+        print("✅ OCR early exit test passed")
+
 
 class MessagingTest(TestCase):
     """Test messaging functionality"""
@@ -475,7 +1275,83 @@ class NotificationTest(TestCase):
         
         self.assertEqual(notification.recipient, self.user)
         print("✅ Notification creation test passed")
-    
+
+    def test_bulk_notify_respects_settings(self):
+        """Test bulk_notify skips users who disabled the notification type"""
+        from notifications.models import NotificationSettings
+
+        muted_user = User.objects.create_user(
+            username='muteduser',
+            email='muted@example.com',
+            password='testpass123'
+        )
+        NotificationSettings.objects.create(user=muted_user, notify_announcement=False)
+
+        created = Notification.objects.bulk_notify(
+            [self.user, muted_user],
+            'announcement',
+            'Bulk announcement',
+            object_id=1
+        )
+
+        self.assertEqual(len(created), 1)
+        self.assertTrue(Notification.objects.filter(user=self.user, notif_type='announcement').exists())
+        self.assertFalse(Notification.objects.filter(user=muted_user).exists())
+        print("✅ Bulk notify test passed")
+
+    def test_announcement_broadcast_resumes(self):
+        """Test an interrupted broadcast resumes from its cursor without duplicates and tracks progress"""
+        from django.core import mail
+        from announcements.models import Announcement, AnnouncementBroadcast
+        from announcements.tasks import broadcast_announcement
+        from notifications.models import NotificationSettings
+
+        recipients = [
+            User.objects.create_user(username=f'reader{i}', email=f'reader{i}@example.com', password='testpass123')
+            for i in range(5)
+        ]
+        NotificationSettings.objects.create(user=recipients[1], notify_announcement=False)
+        NotificationSettings.objects.create(user=recipients[3], email_on_announcement=False)
+        announcement = Announcement.objects.create(title='Maintenance', description='Down tonight', posted_by=self.user)
+
+        bulk_notify = Notification.objects.bulk_notify
+        calls = []
+
+        def fail_second_chunk(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError('database went away')
+            return bulk_notify(*args, **kwargs)
+
+        with patch('announcements.tasks.BROADCAST_CHUNK_SIZE', 2):
+            with patch.object(Notification.objects, 'bulk_notify', side_effect=fail_second_chunk):
+                with self.assertRaises(RuntimeError):
+                    broadcast_announcement(announcement.pk)
+
+            broadcast = AnnouncementBroadcast.objects.get(announcement=announcement)
+            self.assertEqual((broadcast.status, broadcast.last_user_id), ('running', recipients[1].pk))
+            self.assertEqual((broadcast.total_recipients, broadcast.processed_count), (5, 2))
+            self.assertEqual((broadcast.notified_count, broadcast.emailed_count), (1, 2))
+            self.assertEqual(broadcast.progress, 40)
+            self.assertIn('database went away', broadcast.error)
+
+            result = broadcast_announcement(announcement.pk)
+
+        self.assertEqual(result, {'success': True, 'status': 'completed', 'notified': 4, 'emailed': 4})
+        broadcast.refresh_from_db()
+        self.assertEqual((broadcast.status, broadcast.processed_count, broadcast.error), ('completed', 5, ''))
+        self.assertEqual(broadcast.progress, 100)
+        notified = Notification.objects.filter(notif_type='announcement', object_id=announcement.pk)
+        self.assertEqual(sorted(notified.values_list('user_id', flat=True)),
+                         [user.pk for i, user in enumerate(recipients) if i != 1])
+        self.assertEqual(sorted(to for message in mail.outbox for to in message.to),
+                         [user.email for i, user in enumerate(recipients) if i != 3])
+
+        # A completed broadcast is not sent again
+        self.assertEqual(broadcast_announcement(announcement.pk), {'success': True, 'status': 'completed'})
+        self.assertEqual(notified.count(), 4)
+        print("✅ Announcement broadcast resume test passed")
+
     def test_notification_list(self):
         """Test notification list page loads"""
         self.client.login(username='testuser', password='testpass123')
@@ -666,6 +1542,46 @@ class AdminDashboardTest(TestCase):
         self.assertEqual(response.status_code, 302)  # Redirect to login
         print("✅ Non-admin dashboard restriction test passed")
 
+    def test_daily_metrics_series(self):
+        """Test chart series are served from the DailyMetrics rollup"""
+        from admin_dashboard.metrics import rollup
+        from django.utils import timezone
+
+        User.objects.create_user(username='newcomer', email='new@example.com', password='testpass123')
+        today = timezone.localdate()
+        rollup(today)
+
+        self.client.login(username='admin', password='admin123')
+        response = self.client.get(reverse('admin_dashboard:dashboard_metrics_api'), {
+            'days': 30, 'metrics': 'new_users,total_users',
+        })
+        data = response.json()
+        self.assertEqual(len(data['labels']), 30)
+        self.assertEqual(data['new_users'][-1], 2)
+        self.assertEqual(data['total_users'][-1], 2)
+
+        response = self.client.get(reverse('admin_dashboard:dashboard_metrics_api'), {'days': 1000})
+        self.assertEqual(response.status_code, 400)
+        print("✅ Daily metrics test passed")
+
+    def test_moderation_hits_flush(self):
+        """Test banned word hits are counted in the shared cache and flushed to the database"""
+        from admin_dashboard.models import ModeratedWord
+        from admin_dashboard.moderation_utils import check_for_banned_words, flush_hits
+        from django.core.cache import caches
+
+        caches['counters'].clear()
+        word = ModeratedWord.objects.create(word='scam', is_banned=True)
+        self.assertTrue(check_for_banned_words('This is a scam')[0])
+        check_for_banned_words('scam scam')
+        self.assertEqual(ModeratedWord.objects.get(pk=word.pk).flagged_count, 0)
+
+        # One hit per message, however often the word repeats
+        self.assertEqual(flush_hits(), 2)
+        self.assertEqual(ModeratedWord.objects.get(pk=word.pk).flagged_count, 2)
+        self.assertEqual(flush_hits(), 0)
+        print("✅ Moderation hits flush test passed")
+
 
 # Run all tests
 def run_all_tests():
@@ -686,6 +1602,8 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(ProfileTest))
     suite.addTests(loader.loadTestsFromTestCase(JobTest))
     suite.addTests(loader.loadTestsFromTestCase(ServiceTest))
+    suite.addTests(loader.loadTestsFromTestCase(GeoTest))
+    suite.addTests(loader.loadTestsFromTestCase(VerificationOCRTest))
     suite.addTests(loader.loadTestsFromTestCase(MessagingTest))
     suite.addTests(loader.loadTestsFromTestCase(NotificationTest))
     suite.addTests(loader.loadTestsFromTestCase(PerformanceTest))
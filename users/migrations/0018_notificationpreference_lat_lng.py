@@ -0,0 +1,44 @@
+# Float copies of NotificationPreference.notification_location for the
+# non-GIS new-job fanout
+
+from django.db import migrations, models
+
+
+def copy_coordinates(apps, schema_editor):
+    from geo.haversine import parse_point
+
+    NotificationPreference = apps.get_model('users', 'NotificationPreference')
+    batch = []
+    for pref in NotificationPreference.objects.filter(notification_location__isnull=False).iterator():
+        point = parse_point(pref.notification_location)
+        if point:
+            pref.notification_latitude, pref.notification_longitude = point
+            batch.append(pref)
+    NotificationPreference.objects.bulk_update(
+        batch, ['notification_latitude', 'notification_longitude'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0017_add_start_end_year_to_experience'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationpreference',
+            name='notification_latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='notificationpreference',
+            name='notification_longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='notificationpreference',
+            index=models.Index(fields=['notification_latitude', 'notification_longitude'], name='users_notifpref_lat_lng'),
+        ),
+        migrations.RunPython(copy_coordinates, migrations.RunPython.noop),
+    ]
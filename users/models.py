@@ -801,6 +801,10 @@ class NotificationPreference(models.Model):
         default=1.0,
         help_text="Radius in kilometers to search for jobs (e.g., 1.0, 5.0, 10.0)"
     )
+    # notification_location as plain floats, kept in sync by save(), so the
+    # non-GIS fanout can bounding-box prefilter in SQL (see geo.haversine)
+    notification_latitude = models.FloatField(null=True, blank=True, editable=False)
+    notification_longitude = models.FloatField(null=True, blank=True, editable=False)
     
     # Category preferences (many-to-many with GeneralCategory)
     preferred_categories = models.ManyToManyField(
@@ -823,10 +827,22 @@ class NotificationPreference(models.Model):
     class Meta:
         verbose_name = "Notification Preference"
         verbose_name_plural = "Notification Preferences"
+        indexes = [
+            models.Index(fields=['notification_latitude', 'notification_longitude'], name='users_notifpref_lat_lng'),
+        ]
     
     def __str__(self):
         return f"Notification Preferences for {self.user.username}"
     
+    def save(self, *args, **kwargs):
+        from geo.haversine import parse_point
+        point = parse_point(self.notification_location)
+        self.notification_latitude, self.notification_longitude = point or (None, None)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'notification_location' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'notification_latitude', 'notification_longitude'}
+        super().save(*args, **kwargs)
+    
     def get_radius_display(self):
         """Get human-readable radius display"""
         return f"{self.notification_radius_km} km"
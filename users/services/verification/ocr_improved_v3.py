@@ -6,9 +6,15 @@ Fixes:
 - More PSM modes
 - Better text cleaning
 - Handles low quality images
+- Parallel, early-exit search over preprocessing versions x PSM modes
 """
 import re
+import os
+import time
+import shutil
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Optional, Tuple, List
 from PIL import Image
 import numpy as np
@@ -24,6 +30,111 @@ except ImportError:
     logger.warning("pytesseract not available")
 
 
+# PSM modes to try
+PSM_MODES = [
+    6,  # Uniform block of text
+    3,  # Fully automatic
+    11, # Sparse text
+    4,  # Single column of text
+    1,  # Automatic with OSD (Orientation and Script Detection)
+]
+
+# Stop searching once the best result scores this high and has all required fields
+QUALITY_THRESHOLD = 75.0
+
+# Concurrent Tesseract runs, and the time limit for each
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+COMBINATION_TIMEOUT = 30
+
+# OpenMP threads per Tesseract run, so parallel runs share the cores instead
+# of each using all of them (an OMP_THREAD_LIMIT set by the operator wins).
+# Tesseract subprocesses inherit the environment, so it is set once here.
+TESSERACT_THREADS = max(1, (os.cpu_count() or 1) // MAX_WORKERS)
+os.environ.setdefault('OMP_THREAD_LIMIT', str(TESSERACT_THREADS))
+
+# How often each (version, PSM) combination produced the best result; one
+# counter per combination so concurrent workers can increment atomically
+WIN_COUNT_KEY = 'ocr:improved_v3:wins:{combination}'
+_local_win_counts: Dict[str, int] = {}
+
+
+def combination_key(version_name: str, psm: int) -> str:
+    return f"{version_name}|{psm}"
+
+
+def load_win_counts(keys: List[str]) -> Dict[str, int]:
+    """Win counts for the combination keys from the Django cache, or this process's own when there is none."""
+    try:
+        from django.core.cache import cache
+        counts = cache.get_many([WIN_COUNT_KEY.format(combination=key) for key in keys])
+        return {key: counts.get(WIN_COUNT_KEY.format(combination=key), 0) for key in keys}
+    except Exception:
+        return dict(_local_win_counts)
+
+
+def record_win(version_name: str, psm: int) -> None:
+    key = combination_key(version_name, psm)
+    _local_win_counts[key] = _local_win_counts.get(key, 0) + 1
+    try:
+        from django.core.cache import cache
+        cache_key = WIN_COUNT_KEY.format(combination=key)
+        try:
+            cache.incr(cache_key)
+        except ValueError:
+            if not cache.add(cache_key, 1, timeout=None):
+                cache.incr(cache_key)
+    except Exception:
+        pass
+
+
+def text_and_confidence(data: Dict[str, list]) -> Tuple[str, float]:
+    """
+    Text and mean word confidence from one image_to_data result: words are
+    joined per line, lines per block, blocks separated by a blank line.
+    """
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    confidences = []
+    for i, word in enumerate(data['text']):
+        confidence = float(data['conf'][i])
+        if confidence < 0:  # Page/block/line rows, not words
+            continue
+        confidences.append(confidence)
+        if word.strip():
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            lines.setdefault(key, []).append(word.strip())
+    
+    text_lines = []
+    previous_block = None
+    for (block, _, _), words in lines.items():
+        if previous_block is not None and block != previous_block:
+            text_lines.append("")
+        text_lines.append(" ".join(words))
+        previous_block = block
+    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+    return "\n".join(text_lines), avg_confidence
+
+
+def run_combination(image_path: str, psm: int) -> Tuple[str, float, float]:
+    """One Tesseract pass over an image file; returns (text, confidence, seconds)."""
+    started = time.perf_counter()
+    data = pytesseract.image_to_data(
+        image_path, config=f'--oem 3 --psm {psm}', lang='eng',
+        output_type=pytesseract.Output.DICT, timeout=COMBINATION_TIMEOUT,
+    )
+    text, avg_confidence = text_and_confidence(data)
+    return text, avg_confidence, time.perf_counter() - started
+
+
+def write_versions(versions: Dict[str, np.ndarray], directory: str) -> Dict[str, str]:
+    """Save each preprocessed version once as a PNG; returns {name: path}."""
+    paths = {}
+    for index, (name, image) in enumerate(versions.items()):
+        path = os.path.join(directory, f'{index}.png')
+        cv2.imwrite(path, image)
+        paths[name] = path
+    return paths
+
+
 class ImprovedIDOCR:
     """Improved OCR for Philippine ID cards with robust preprocessing."""
     
@@ -192,67 +303,90 @@ class ImprovedIDOCR:
         logger.info(f"Created {len(versions)} preprocessed versions")
         return versions
     
+    def ordered_combinations(self, version_names: List[str]) -> List[Tuple[str, int]]:
+        """
+        Every (preprocessing version, PSM mode) pair, the ones that have most
+        often produced the best result first (ties keep the default order).
+        """
+        combinations = [(name, psm) for name in version_names for psm in PSM_MODES]
+        wins = load_win_counts([combination_key(*combo) for combo in combinations])
+        return sorted(combinations, key=lambda combo: -wins.get(combination_key(*combo), 0))
+    
+    def is_good_enough(self, results: List[Dict]) -> bool:
+        """Whether the results so far meet the quality threshold and contain every required field."""
+        top = sorted(results, key=lambda x: x['quality_score'], reverse=True)[:3]
+        if not top or top[0]['quality_score'] < QUALITY_THRESHOLD:
+            return False
+        text = "\n".join(result['text'] for result in top)
+        return bool(self.parse_pcn(text) and self.parse_date_of_birth(text) and self.parse_name(text))
+    
     def extract_text_multi_version(self, image: Image.Image) -> Tuple[str, float]:
         """
         Extract text using multiple preprocessing versions and PSM modes.
         Returns best text and confidence score.
+        
+        Combinations run on a bounded thread pool, most successful first,
+        and the search stops as soon as the best results reach
+        QUALITY_THRESHOLD and contain the PCN, date of birth and name.
+        Tesseract itself runs as a subprocess, so threads are enough for
+        parallelism; each preprocessed version is written to disk once and
+        shared by its PSM runs. Per-combination timings are kept in
+        self.timings.
         """
         logger.info("Starting multi-version OCR extraction")
         
         # Get multiple preprocessed versions
-        preprocessed_versions = self.preprocess_for_ocr(image)
-        
-        # PSM modes to try
-        psm_modes = [
-            6,  # Uniform block of text
-            3,  # Fully automatic
-            11, # Sparse text
-            4,  # Single column of text
-            1,  # Automatic with OSD (Orientation and Script Detection)
-        ]
+        versions = {name: version_img for version_img, name in self.preprocess_for_ocr(image)}
+        combinations = self.ordered_combinations(list(versions))
         
         all_results = []
+        self.timings = []
+        started = time.perf_counter()
         
-        for version_img, version_name in preprocessed_versions:
-            # Convert to PIL for tesseract
-            pil_img = Image.fromarray(version_img)
-            
-            for psm in psm_modes:
+        directory = tempfile.mkdtemp(prefix='ocr_v3_')
+        executor = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(combinations)))
+        try:
+            paths = write_versions(versions, directory)
+            futures = {
+                executor.submit(run_combination, paths[name], psm): (name, psm)
+                for name, psm in combinations
+            }
+            for future in as_completed(futures):
+                version_name, psm = futures[future]
                 try:
-                    # Less restrictive whitelist - allow more characters
-                    custom_config = f'--oem 3 --psm {psm}'
-                    
-                    # Extract text
-                    text = pytesseract.image_to_string(pil_img, config=custom_config, lang='eng')
-                    
-                    # Get confidence
-                    try:
-                        data = pytesseract.image_to_data(
-                            pil_img, config=custom_config, lang='eng',
-                            output_type=pytesseract.Output.DICT
-                        )
-                        confidences = [int(conf) for conf in data['conf'] if conf != '-1']
-                        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-                    except:
-                        avg_confidence = 0
-                    
-                    # Calculate quality score based on text length and confidence
-                    text_length = len(text.strip())
-                    quality_score = (avg_confidence * 0.7) + (min(text_length, 500) / 500 * 30)
-                    
-                    all_results.append({
-                        'text': text,
-                        'confidence': avg_confidence,
-                        'quality_score': quality_score,
-                        'version': version_name,
-                        'psm': psm,
-                        'length': text_length
-                    })
-                    
-                    logger.debug(f"{version_name} + PSM {psm}: {text_length} chars, conf={avg_confidence:.1f}%, score={quality_score:.1f}")
-                    
+                    text, avg_confidence, seconds = future.result()
                 except Exception as e:
                     logger.warning(f"OCR failed for {version_name} + PSM {psm}: {e}")
+                    self.timings.append({'version': version_name, 'psm': psm, 'seconds': None, 'error': str(e)})
+                    continue
+                
+                # Calculate quality score based on text length and confidence
+                text_length = len(text.strip())
+                quality_score = (avg_confidence * 0.7) + (min(text_length, 500) / 500 * 30)
+                
+                all_results.append({
+                    'text': text,
+                    'confidence': avg_confidence,
+                    'quality_score': quality_score,
+                    'version': version_name,
+                    'psm': psm,
+                    'length': text_length
+                })
+                self.timings.append({'version': version_name, 'psm': psm, 'seconds': seconds})
+                
+                logger.debug(f"{version_name} + PSM {psm}: {text_length} chars, conf={avg_confidence:.1f}%, "
+                             f"score={quality_score:.1f}, {seconds:.2f}s")
+                
+                if self.is_good_enough(all_results):
+                    logger.info(f"OCR early exit after {len(all_results)} of {len(combinations)} combinations")
+                    break
+        finally:
+            # Combinations not started yet are dropped; runs still in flight
+            # are abandoned and fail harmlessly once their file is gone
+            executor.shutdown(wait=False, cancel_futures=True)
+            shutil.rmtree(directory, ignore_errors=True)
+        
+        logger.info(f"OCR search took {time.perf_counter() - started:.2f}s over {len(self.timings)} combinations")
         
         if not all_results:
             logger.error("No OCR results obtained")
@@ -263,6 +397,7 @@ class ImprovedIDOCR:
         
         # Get best result
         best = all_results[0]
+        record_win(best['version'], best['psm'])
         logger.info(f"Best result: {best['version']} + PSM {best['psm']}, "
                    f"confidence={best['confidence']:.1f}%, "
                    f"quality_score={best['quality_score']:.1f}, "
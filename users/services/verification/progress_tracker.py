@@ -2,7 +2,7 @@
 Progress tracking for verification pipeline.
 Allows real-time monitoring of verification progress in admin dashboard.
 """
-from django.core.cache import cache
+from django.core.cache import caches
 from typing import Dict, Optional
 import time
 
@@ -35,7 +35,7 @@ class VerificationProgressTracker:
         }
         
         # Store in cache for 5 minutes
-        cache.set(self.cache_key, data, timeout=300)
+        caches['verification'].set(self.cache_key, data, timeout=300)
     
     def complete(self, status: str, message: str = ""):
         """Mark verification as complete."""
@@ -51,7 +51,7 @@ class VerificationProgressTracker:
         }
         
         # Store for 10 minutes so admin can see final status
-        cache.set(self.cache_key, data, timeout=600)
+        caches['verification'].set(self.cache_key, data, timeout=600)
     
     def error(self, error_message: str):
         """Mark verification as failed."""
@@ -66,16 +66,16 @@ class VerificationProgressTracker:
             'timestamp': time.time()
         }
         
-        cache.set(self.cache_key, data, timeout=600)
+        caches['verification'].set(self.cache_key, data, timeout=600)
     
     @staticmethod
     def get_progress(user_id: int) -> Optional[Dict]:
         """Get current progress for a user."""
         cache_key = f"verification_progress_{user_id}"
-        return cache.get(cache_key)
+        return caches['verification'].get(cache_key)
     
     @staticmethod
     def clear_progress(user_id: int):
         """Clear progress data for a user."""
         cache_key = f"verification_progress_{user_id}"
-        cache.delete(cache_key)
+        caches['verification'].delete(cache_key)
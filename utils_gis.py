@@ -38,4 +38,20 @@ except (ImportError, OSError, Exception):
     Distance = None
     USE_GIS = False
 
-__all__ = ['gis_models', 'Point', 'GEOSGeometry', 'D', 'Distance', 'USE_GIS']
+
+
+def gis_enabled():
+    """
+    Whether distance queries should use PostGIS.
+
+    False when GeoDjango is unavailable, or when settings.USE_GIS is False
+    (lightweight nodes/CI on PostgreSQL without the PostGIS extension;
+    several jobs migrations use PostgreSQL-only SQL, so SQLite is not
+    supported); callers then use the NumPy engine in geo.haversine on the
+    latitude/longitude columns.
+    """
+    from django.conf import settings
+    return USE_GIS and getattr(settings, 'USE_GIS', True)
+
+
+__all__ = ['gis_models', 'Point', 'GEOSGeometry', 'D', 'Distance', 'USE_GIS', 'gis_enabled']